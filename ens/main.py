@@ -5,7 +5,6 @@ from eth_utils import (
     to_checksum_address,
 )
 
-from ens import abis
 from ens.constants import (
     EMPTY_ADDR_HEX,
     REVERSE_REGISTRAR_DOMAIN,
@@ -55,6 +54,9 @@ class ENS:
         :param hex-string addr: the address of the ENS registry on-chain. If not provided,
             ENS.py will default to the mainnet ENS registry address.
         '''
+        # the abis are only imported once they're needed
+        from ens import abis
+
         self.web3 = init_web3(providers)
 
         ens_addr = addr if addr else ENS_MAINNET_ADDR
@@ -313,5 +315,7 @@ class ENS:
         return self._reverse_registrar().setName(name, transact=transact)
 
     def _reverse_registrar(self):
+        from ens import abis
+
         addr = self.ens.owner(name_to_hash(REVERSE_REGISTRAR_DOMAIN))
         return self.web3.eth.contract(address=addr, abi=abis.REVERSE_REGISTRAR)
@@ -0,0 +1,47 @@
+from web3._utils.caching import (
+    IdentityLRU,
+)
+
+
+def test_identity_lru_is_keyed_by_identity():
+    cache = IdentityLRU(8)
+    abi = [{'type': 'fallback'}]
+    equal_abi = [{'type': 'fallback'}]
+
+    cache.set(abi, 'value')
+
+    assert cache.get(abi) == 'value'
+    assert cache.get(equal_abi) is None
+    assert cache.get(equal_abi, default='default') == 'default'
+
+
+def test_identity_lru_with_key():
+    cache = IdentityLRU(8)
+    abi = [{'type': 'fallback'}]
+
+    cache.set(abi, 'a', key='a')
+    cache.set(abi, 'b', key='b')
+
+    assert cache.get(abi, 'a') == 'a'
+    assert cache.get(abi, 'b') == 'b'
+    assert cache.get(abi) is None
+    assert len(cache) == 2
+
+
+def test_identity_lru_keeps_object_alive():
+    cache = IdentityLRU(8)
+    cache.set([], 'value')
+
+    # a new object can't be given the id of the cached one and its value
+    assert all(cache.get([]) is None for _ in range(100))
+
+
+def test_identity_lru_evicts_least_recently_used():
+    cache = IdentityLRU(2)
+    abis = [[], [], []]
+    for index, abi in enumerate(abis):
+        cache.set(abi, index)
+
+    assert len(cache) == 2
+    assert cache.get(abis[0]) is None
+    assert cache.get(abis[2]) == 2
@@ -0,0 +1,115 @@
+import pytest
+
+# Ignore warning in pyethereum 1.6 - will go away with the upgrade
+pytestmark = pytest.mark.filterwarnings("ignore:implicit cast from 'char *'")
+
+
+@pytest.fixture()
+def math_contract(web3, MathContract):
+    deploy_txn = MathContract.constructor().transact()
+    deploy_receipt = web3.eth.waitForTransactionReceipt(deploy_txn)
+    return MathContract(address=deploy_receipt['contractAddress'])
+
+
+@pytest.fixture()
+def increment(web3, math_contract):
+    def _increment():
+        txn_hash = math_contract.functions.increment().transact()
+        web3.eth.waitForTransactionReceipt(txn_hash)
+    return _increment
+
+
+@pytest.fixture()
+def requested_methods(web3, monkeypatch):
+    methods = []
+    request_blocking = web3.manager.request_blocking
+
+    def _request_blocking(method, params):
+        methods.append(method)
+        return request_blocking(method, params)
+
+    monkeypatch.setattr(web3.manager, 'request_blocking', _request_blocking)
+    return methods
+
+
+def test_snapshot_pins_contract_calls(web3, math_contract, increment):
+    with web3.eth.at_block('latest') as snapshot:
+        assert snapshot.block_number == web3.eth.blockNumber
+        increment()
+        assert math_contract.functions.counter().call() == 0
+        assert math_contract.functions.counter().call(block_identifier='latest') == 0
+        assert math_contract.functions.counter().call(
+            block_identifier=snapshot.block_number + 1,
+        ) == 1
+
+    assert math_contract.functions.counter().call() == 1
+
+
+def test_snapshot_pins_state_reads(web3, math_contract):
+    account = web3.eth.accounts[1]
+    balance = web3.eth.getBalance(account)
+
+    with web3.eth.at_block('latest') as snapshot:
+        txn_hash = web3.eth.sendTransaction({
+            'from': web3.eth.coinbase,
+            'to': account,
+            'value': 12345,
+        })
+        web3.eth.waitForTransactionReceipt(txn_hash)
+
+        assert web3.eth.getBalance(account) == balance
+        assert web3.eth.getCode(math_contract.address) == web3.eth.getCode(
+            math_contract.address,
+            snapshot.block_number,
+        )
+
+    assert web3.eth.getBalance(account) == balance + 12345
+    assert snapshot.getBalance(account) == balance
+
+
+def test_snapshot_memoizes_reads(web3, math_contract, requested_methods):
+    with web3.eth.at_block('latest'):
+        for _ in range(3):
+            assert math_contract.functions.multiply7(3).call() == 21
+            web3.eth.getBalance(web3.eth.coinbase)
+        assert math_contract.functions.multiply7(4).call() == 28
+
+    assert requested_methods.count('eth_call') == 2
+    assert requested_methods.count('eth_getBalance') == 1
+
+
+def test_snapshot_at_earlier_block(web3, math_contract, increment):
+    block_number = web3.eth.blockNumber
+    increment()
+
+    snapshot = web3.eth.at_block(block_number)
+    with snapshot:
+        assert math_contract.functions.counter().call() == 0
+    assert snapshot.call({
+        'to': math_contract.address,
+        'data': math_contract.encodeABI('counter'),
+    }) == b'\x00' * 32
+
+
+def test_nested_snapshots(web3, math_contract, increment):
+    with web3.eth.at_block('latest'):
+        increment()
+        with web3.eth.at_block('latest'):
+            increment()
+            assert math_contract.functions.counter().call() == 1
+        assert math_contract.functions.counter().call() == 0
+    assert math_contract.functions.counter().call() == 2
+
+
+def test_snapshot_pins_call_batches(web3, math_contract, increment):
+    with web3.eth.at_block('latest'):
+        increment()
+        batch = web3.batch()
+        batch.add(math_contract.functions.counter())
+
+    assert batch.execute() == [0]
+
+
+def test_snapshot_of_pending_block(web3):
+    with pytest.raises(ValueError):
+        web3.eth.at_block('pending')
@@ -0,0 +1,94 @@
+import pytest
+
+# Ignore warning in pyethereum 1.6 - will go away with the upgrade
+pytestmark = pytest.mark.filterwarnings("ignore:implicit cast from 'char *'")
+
+
+def deploy(web3, Contract, args=None):
+    deploy_txn = Contract.constructor(*(args or [])).transact()
+    deploy_receipt = web3.eth.waitForTransactionReceipt(deploy_txn)
+    return Contract(address=deploy_receipt['contractAddress'])
+
+
+@pytest.fixture()
+def math_contract(web3, MathContract):
+    return deploy(web3, MathContract)
+
+
+@pytest.fixture()
+def string_contract(web3, StringContract):
+    return deploy(web3, StringContract, args=["Caqalai"])
+
+
+@pytest.fixture()
+def batch_requests(web3, monkeypatch):
+    provider = web3.providers[0]
+    batches = []
+    make_batch_request = provider.make_batch_request
+
+    def _make_batch_request(requests):
+        batches.append([method for method, _ in requests])
+        return make_batch_request(requests)
+
+    monkeypatch.setattr(provider, 'make_batch_request', _make_batch_request)
+    return batches
+
+
+def test_call_batch(web3, math_contract, string_contract, batch_requests):
+    contract_functions = [
+        math_contract.functions.return13(),
+        string_contract.functions.getValue(),
+        math_contract.functions.add(7, 8),
+        math_contract.functions.multiply7(3),
+        math_contract.functions.counter(),
+    ]
+
+    batch = web3.batch()
+    indices = [batch.add(fn) for fn in contract_functions]
+    assert indices == [0, 1, 2, 3, 4]
+    assert len(batch) == 5
+
+    results = batch.execute()
+
+    assert results == [13, "Caqalai", 15, 21, 0]
+    # the requests the eth-tester middlewares make to fill in the
+    # transactions are batched as well
+    assert batch_requests[-1] == ['eth_call'] * 5
+    assert len(batch) == 0
+    assert results == [fn.call() for fn in contract_functions]
+
+
+def test_call_batch_in_batches(web3, math_contract, batch_requests):
+    batch = web3.batch(batch_size=2)
+    for i in range(5):
+        batch.add(math_contract.functions.multiply7(i))
+
+    assert batch.execute() == [0, 7, 14, 21, 28]
+    assert [
+        len(methods)
+        for methods
+        in batch_requests
+        if 'eth_call' in methods
+    ] == [2, 2, 1]
+
+
+def test_call_batch_at_block(web3, math_contract):
+    block_number = web3.eth.blockNumber
+    txn_hash = math_contract.functions.increment().transact()
+    web3.eth.waitForTransactionReceipt(txn_hash)
+
+    batch = web3.batch()
+    batch.add(math_contract.functions.counter())
+    batch.add(math_contract.functions.counter(), block_identifier=block_number)
+
+    assert batch.execute() == [1, 0]
+
+
+def test_call_batch_empty(web3, batch_requests):
+    assert web3.batch().execute() == []
+    assert batch_requests == []
+
+
+def test_call_batch_rejects_data(web3, math_contract):
+    with pytest.raises(ValueError):
+        web3.batch().add(math_contract.functions.return13(), {'data': '0x'})
@@ -0,0 +1,159 @@
+import pytest
+
+from web3.contract import (
+    CallResultCache,
+)
+
+# Ignore warning in pyethereum 1.6 - will go away with the upgrade
+pytestmark = pytest.mark.filterwarnings("ignore:implicit cast from 'char *'")
+
+
+@pytest.fixture()
+def math_contract(web3, MathContract):
+    deploy_txn = MathContract.constructor().transact()
+    deploy_receipt = web3.eth.waitForTransactionReceipt(deploy_txn)
+    return MathContract(address=deploy_receipt['contractAddress'])
+
+
+@pytest.fixture()
+def eth_calls(web3, monkeypatch):
+    provider = web3.providers[0]
+    calls = []
+    make_request = provider.make_request
+
+    def _make_request(method, params):
+        if method == 'eth_call':
+            calls.append(params)
+        return make_request(method, params)
+
+    monkeypatch.setattr(provider, 'make_request', _make_request)
+    return calls
+
+
+@pytest.fixture()
+def call_result_cache(web3):
+    call_result_cache = CallResultCache(confirmation_blocks=1)
+    web3.eth.setCallResultCache(call_result_cache)
+    return call_result_cache
+
+
+def increment(web3, math_contract):
+    txn_hash = math_contract.functions.increment().transact()
+    return web3.eth.waitForTransactionReceipt(txn_hash)['blockNumber']
+
+
+def test_calls_are_not_cached_by_default(web3, math_contract, eth_calls):
+    block_number = increment(web3, math_contract)
+    increment(web3, math_contract)
+
+    assert math_contract.functions.counter().call(block_identifier=block_number) == 1
+    assert math_contract.functions.counter().call(block_identifier=block_number) == 1
+    assert len(eth_calls) == 2
+
+
+def test_calls_at_a_confirmed_block_are_cached(
+        web3,
+        math_contract,
+        call_result_cache,
+        eth_calls):
+    block_number = increment(web3, math_contract)
+    increment(web3, math_contract)
+
+    assert math_contract.functions.counter().call(block_identifier=block_number) == 1
+    assert math_contract.functions.counter().call(block_identifier=block_number) == 1
+    assert len(eth_calls) == 1
+
+    assert math_contract.functions.counter().call(block_identifier=block_number - 1) == 0
+    assert len(eth_calls) == 2
+    assert len(call_result_cache) == 2
+
+
+def test_calls_at_a_block_hash_are_cached_by_hash(
+        web3,
+        math_contract,
+        call_result_cache,
+        eth_calls):
+    block_number = increment(web3, math_contract)
+    block_hash = web3.eth.getBlock(block_number)['hash']
+    increment(web3, math_contract)
+
+    assert math_contract.functions.counter().call(block_identifier=block_hash) == 1
+    assert math_contract.functions.counter().call(block_identifier=block_hash.hex()) == 1
+    assert len(eth_calls) == 1
+
+    assert math_contract.functions.counter().call(block_identifier=block_number) == 1
+    assert len(eth_calls) == 2
+
+
+def test_calls_at_unconfirmed_blocks_are_not_cached(
+        web3,
+        math_contract,
+        call_result_cache,
+        eth_calls):
+    block_number = increment(web3, math_contract)
+
+    assert math_contract.functions.counter().call(block_identifier=block_number) == 1
+    assert math_contract.functions.counter().call(block_identifier=block_number) == 1
+    assert len(eth_calls) == 2
+
+    increment(web3, math_contract)
+
+    assert math_contract.functions.counter().call(block_identifier=block_number) == 1
+    assert math_contract.functions.counter().call(block_identifier=block_number) == 1
+    assert len(eth_calls) == 3
+
+
+def test_calls_at_latest_block_are_not_cached(
+        web3,
+        math_contract,
+        call_result_cache,
+        eth_calls):
+    assert math_contract.functions.counter().call() == 0
+    increment(web3, math_contract)
+    assert math_contract.functions.counter().call() == 1
+    assert math_contract.functions.counter().call(block_identifier='latest') == 1
+    assert len(eth_calls) == 3
+
+
+def test_calls_in_a_snapshot_are_cached_once_confirmed(
+        web3,
+        math_contract,
+        call_result_cache,
+        eth_calls):
+    increment(web3, math_contract)
+    with web3.eth.at_block():
+        assert math_contract.functions.counter().call() == 1
+    assert len(call_result_cache) == 0
+
+    increment(web3, math_contract)
+    with web3.eth.at_block(web3.eth.blockNumber - 1):
+        assert math_contract.functions.counter().call() == 1
+    with web3.eth.at_block(web3.eth.blockNumber - 1):
+        assert math_contract.functions.counter().call() == 1
+    assert len(eth_calls) == 2
+
+
+def test_calls_of_state_changing_functions_are_not_cached(
+        web3,
+        math_contract,
+        call_result_cache,
+        eth_calls):
+    increment(web3, math_contract)
+    block_number = web3.eth.blockNumber - 1
+    assert math_contract.functions.add(7, 8).call(block_identifier=block_number) == 15
+    assert math_contract.functions.add(7, 8).call(block_identifier=block_number) == 15
+    assert len(eth_calls) == 2
+
+
+def test_calls_with_other_transaction_fields_are_not_cached(
+        web3,
+        math_contract,
+        call_result_cache,
+        eth_calls):
+    increment(web3, math_contract)
+    block_number = web3.eth.blockNumber - 1
+    counter = math_contract.functions.counter()
+    assert counter.call({'gas': 100000}, block_identifier=block_number) == 0
+    assert counter.call({'gas': 100000}, block_identifier=block_number) == 0
+    assert len(eth_calls) == 2
+    assert len(call_result_cache) == 0
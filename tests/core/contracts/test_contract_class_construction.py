@@ -54,3 +54,38 @@ def test_error_to_call_non_existent_fallback(web3,
     )
     with pytest.raises(FallbackNotFound):
         math_contract.fallback.estimateGas()
+
+
+def test_contracts_with_the_same_abi_share_compiled_abi(web3, MATH_ABI, some_address):
+    MathContract = web3.eth.contract(abi=MATH_ABI)
+    OtherMathContract = web3.eth.contract(abi=json.loads(json.dumps(MATH_ABI)))
+    math = MathContract(some_address)
+
+    assert MathContract.functions._compiled_abi is OtherMathContract.functions._compiled_abi
+    assert math.functions._compiled_abi is MathContract.functions._compiled_abi
+    assert math.events._compiled_abi is MathContract.events._compiled_abi
+
+
+def test_contract_instances_share_function_classes(web3, MATH_ABI, some_address):
+    other_address = '0x' + '22' * 20
+    MathContract = web3.eth.contract(abi=MATH_ABI)
+    math = MathContract(some_address)
+    other_math = MathContract(other_address)
+
+    return13_class = MathContract.functions.return13.__class__
+    assert math.functions.return13.__class__ is return13_class
+    assert other_math.functions.return13.__class__ is return13_class
+    assert MathContract.functions.return13.address is None
+    assert math.functions.return13.address == math.address
+    assert other_math.functions.return13().address == other_address
+    assert math.functions['multiply7'](3).selector == MathContract.encodeABI('multiply7', [3])[:10]
+
+
+def test_contract_instance_events_are_bound(web3, MATH_ABI, some_address):
+    MathContract = web3.eth.contract(abi=MATH_ABI)
+    math = MathContract(some_address)
+
+    assert MathContract.events.Increased.address is None
+    assert math.events.Increased.address == math.address
+    assert math.events.Increased._get_event_abi() is MathContract.events.Increased._get_event_abi()
+    assert math.events['Increased'] is math.events.Increased
@@ -4,6 +4,10 @@ import pytest
 from web3._utils.abi import (
     get_abi_input_types,
 )
+import web3._utils.contracts
+from web3._utils.contracts import (
+    find_matching_fn_abi,
+)
 from web3._utils.function_identifiers import (
     FallbackFn,
 )
@@ -13,7 +17,9 @@ from web3.exceptions import (
 
 SINGLE_FN_NO_ARGS = json.loads('[{"constant":false,"inputs":[],"name":"a","outputs":[],"type":"function"}]')  # noqa: E501
 SINGLE_FN_ONE_ARG = json.loads('[{"constant":false,"inputs":[{"name":"","type":"uint256"}],"name":"a","outputs":[],"type":"function"}]')  # noqa: E501
+INT8_AND_INT16_FUNCTIONS = json.loads('[{"constant":false,"inputs":[{"name":"","type":"int8"}],"name":"a","outputs":[],"type":"function"},{"constant":false,"inputs":[{"name":"","type":"int16"}],"name":"a","outputs":[],"type":"function"}]')  # noqa: E501
 MULTIPLE_FUNCTIONS = json.loads('[{"constant":false,"inputs":[],"name":"a","outputs":[],"type":"function"},{"constant":false,"inputs":[{"name":"","type":"bytes32"}],"name":"a","outputs":[],"type":"function"},{"constant":false,"inputs":[{"name":"","type":"uint256"}],"name":"a","outputs":[],"type":"function"},{"constant":false,"inputs":[{"name":"","type":"uint8"}],"name":"a","outputs":[],"type":"function"},{"constant":false,"inputs":[{"name":"","type":"int8"}],"name":"a","outputs":[],"type":"function"}]')  # noqa: E501
+ADDRESS_AND_UINT_FUNCTIONS = json.loads('[{"constant":true,"inputs":[{"name":"","type":"address"},{"name":"","type":"uint256"}],"name":"a","outputs":[],"type":"function"},{"constant":true,"inputs":[{"name":"","type":"uint256"},{"name":"","type":"uint256"}],"name":"a","outputs":[],"type":"function"},{"constant":true,"inputs":[{"name":"","type":"address[]"}],"name":"a","outputs":[],"type":"function"}]')  # noqa: E501
 FALLBACK_FUNCTION = json.loads('[{"constant": false, "inputs": [], "name": "getData", "outputs": [{"name": "r", "type": "uint256"}], "payable": false, "stateMutability": "nonpayable", "type": "function"}, {"payable": false, "stateMutability": "nonpayable", "type": "fallback"}]')  # noqa: E501
 
 
@@ -73,3 +79,103 @@ def test_error_when_duplicate_match(web3):
 
     with pytest.raises(ValidationError):
         Contract._find_matching_fn_abi('a', [100])
+
+
+@pytest.mark.parametrize(
+    'arguments,expected_types',
+    (
+        ([b'arst'], ['bytes32']),
+        (['0xf00b47'], ['bytes32']),
+        ([1234567890], ['uint256']),
+        ([-1], ['int8']),
+    )
+)
+def test_matching_function_is_cached(monkeypatch, arguments, expected_types):
+    abi = json.loads(json.dumps(MULTIPLE_FUNCTIONS))
+    fn_abi = find_matching_fn_abi(abi, 'a', arguments)
+    assert get_abi_input_types(fn_abi) == expected_types
+
+    def must_not_filter(*args, **kwargs):
+        assert False, "The matching function should have been cached"
+
+    monkeypatch.setattr(web3._utils.contracts, '_find_matching_fn_abi', must_not_filter)
+    assert find_matching_fn_abi(abi, 'a', arguments) is fn_abi
+
+
+@pytest.mark.parametrize(
+    'first_arguments,other_arguments',
+    (
+        ([-1], [-1000]),
+        ([1234567890], [2 ** 256]),
+        (['0xf00b47'], ['0x' + 'f0' * 33]),
+    )
+)
+def test_cached_match_depends_on_argument_shape(first_arguments, other_arguments):
+    abi = json.loads(json.dumps(MULTIPLE_FUNCTIONS))
+    find_matching_fn_abi(abi, 'a', first_arguments)
+
+    with pytest.raises(ValidationError):
+        find_matching_fn_abi(abi, 'a', other_arguments)
+
+
+@pytest.mark.parametrize(
+    'first_arguments,other_arguments',
+    (
+        ([-129], [-128]),
+        ([128], [127]),
+    )
+)
+def test_cached_match_depends_on_integer_size(first_arguments, other_arguments):
+    abi = json.loads(json.dumps(INT8_AND_INT16_FUNCTIONS))
+    fn_abi = find_matching_fn_abi(abi, 'a', first_arguments)
+    assert get_abi_input_types(fn_abi) == ['int16']
+
+    with pytest.raises(ValidationError):
+        find_matching_fn_abi(abi, 'a', other_arguments)
+
+
+CHECKSUM_ADDRESS = '0x82A978B3f5962A5b0957d9ee9eEf472EE55B42F1'
+
+
+@pytest.mark.parametrize(
+    'arguments,expected_types',
+    (
+        ([CHECKSUM_ADDRESS, 1], ['address', 'uint256']),
+        ([CHECKSUM_ADDRESS.lower(), 1], ['address', 'uint256']),
+        ([[CHECKSUM_ADDRESS] * 500], ['address[]']),
+    )
+)
+def test_cached_match_with_address_arguments_does_not_hash(
+        monkeypatch,
+        arguments,
+        expected_types):
+    abi = json.loads(json.dumps(ADDRESS_AND_UINT_FUNCTIONS))
+    fn_abi = find_matching_fn_abi(abi, 'a', arguments)
+    assert get_abi_input_types(fn_abi) == expected_types
+
+    def must_not_hash(*args, **kwargs):
+        assert False, "The checksum of a cached address should not be checked again"
+
+    # checking a checksum is what made a cached match slower than no cache
+    monkeypatch.setattr('eth_utils.address.keccak', must_not_hash)
+    assert find_matching_fn_abi(abi, 'a', arguments) is fn_abi
+
+
+def test_cached_match_depends_on_address_checksum():
+    abi = json.loads(json.dumps(ADDRESS_AND_UINT_FUNCTIONS))
+    find_matching_fn_abi(abi, 'a', [CHECKSUM_ADDRESS, 1])
+
+    bad_checksum_address = CHECKSUM_ADDRESS.replace('A', 'a', 1)
+    with pytest.raises(ValidationError):
+        find_matching_fn_abi(abi, 'a', [bad_checksum_address, 1])
+
+
+def test_cached_match_depends_on_abi_identity():
+    abi = json.loads(json.dumps(SINGLE_FN_ONE_ARG))
+    other_abi = json.loads(json.dumps(SINGLE_FN_ONE_ARG))
+
+    fn_abi = find_matching_fn_abi(abi, 'a', [1])
+    other_fn_abi = find_matching_fn_abi(other_abi, 'a', [1])
+
+    assert fn_abi is abi[0]
+    assert other_fn_abi is other_abi[0]
@@ -0,0 +1,212 @@
+import pytest
+
+from eth_abi import (
+    encode_single,
+)
+from eth_utils import (
+    event_abi_to_log_topic,
+)
+
+from web3._utils.events import (
+    get_event_data,
+)
+from web3.router import (
+    EventRouter,
+)
+
+# Ignore warning in pyethereum 1.6 - will go away with the upgrade
+pytestmark = pytest.mark.filterwarnings("ignore:implicit cast from 'char *'")
+
+
+@pytest.fixture()
+def Emitter(web3, EMITTER):
+    return web3.eth.contract(**EMITTER)
+
+
+def deploy(web3, Emitter):
+    deploy_txn_hash = Emitter.constructor().transact({'from': web3.eth.coinbase, 'gas': 1000000})
+    deploy_receipt = web3.eth.waitForTransactionReceipt(deploy_txn_hash)
+    return Emitter(address=deploy_receipt['contractAddress'])
+
+
+@pytest.fixture()
+def emitter(web3, Emitter, wait_for_block):
+    wait_for_block(web3)
+    return deploy(web3, Emitter)
+
+
+@pytest.fixture()
+def emit_logs(web3, emitter_event_ids, wait_for_transaction):
+    def _emit_logs(contract, calls):
+        log_entries = []
+        for contract_fn, event_name, call_args in calls:
+            event_id = getattr(emitter_event_ids, event_name)
+            txn_hash = contract.functions[contract_fn](event_id, *call_args).transact()
+            log_entries.extend(wait_for_transaction(web3, txn_hash)['logs'])
+        return log_entries
+    return _emit_logs
+
+
+EMITTED_EVENTS = (
+    ('logSingle', 'LogSingleArg', [1]),
+    ('logNoArgs', 'LogNoArguments', []),
+    ('logSingle', 'LogSingleAnonymous', [2]),
+    ('logDouble', 'LogDoubleWithIndex', [3, 4]),
+    ('logSingle', 'LogSingleArg', [5]),
+)
+
+
+def test_contract_process_logs(emitter, emit_logs):
+    log_entries = emit_logs(emitter, EMITTED_EVENTS)
+
+    events = emitter.processLogs(log_entries)
+
+    # anonymous events are skipped
+    assert [event.event for event in events] == [
+        'LogSingleArg',
+        'LogNoArguments',
+        'LogDoubleWithIndex',
+        'LogSingleArg',
+    ]
+    assert events[2] == get_event_data(
+        emitter._find_matching_event_abi('LogDoubleWithIndex'),
+        log_entries[3],
+    )
+    assert [event.args for event in events] == [
+        {'arg0': 1},
+        {},
+        {'arg0': 3, 'arg1': 4},
+        {'arg0': 5},
+    ]
+
+
+def test_contract_process_receipt(web3, emitter, emitter_event_ids, wait_for_transaction):
+    txn_hash = emitter.functions.logDouble(emitter_event_ids.LogDoubleArg, 6, 7).transact()
+    txn_receipt = wait_for_transaction(web3, txn_hash)
+
+    events = emitter.processReceipt(txn_receipt)
+
+    assert len(events) == 1
+    assert events[0].args == {'arg0': 6, 'arg1': 7}
+    assert events == emitter.events.LogDoubleArg().processReceipt(txn_receipt)
+
+
+def test_contract_process_logs_by_address(web3, Emitter, emitter, emit_logs):
+    other_emitter = deploy(web3, Emitter)
+    log_entries = emit_logs(emitter, [('logSingle', 'LogSingleArg', [1])])
+    log_entries += emit_logs(other_emitter, [('logSingle', 'LogSingleArg', [2])])
+
+    assert [event.args.arg0 for event in emitter.processLogs(log_entries)] == [1]
+    assert [event.args.arg0 for event in other_emitter.processLogs(log_entries)] == [2]
+    assert [event.args.arg0 for event in Emitter.processLogs(log_entries)] == [1, 2]
+
+
+def test_event_router_registry(web3, Emitter, emitter, emit_logs):
+    other_emitter = deploy(web3, Emitter)
+    log_entries = emit_logs(emitter, EMITTED_EVENTS)
+    log_entries += emit_logs(other_emitter, EMITTED_EVENTS)
+
+    router = EventRouter([emitter.events.LogSingleArg])
+    router.add_contract(other_emitter)
+    events = router.processLogs(log_entries)
+
+    assert [(event.address, event.event) for event in events] == [
+        (emitter.address, 'LogSingleArg'),
+        (emitter.address, 'LogSingleArg'),
+        (other_emitter.address, 'LogSingleArg'),
+        (other_emitter.address, 'LogNoArguments'),
+        (other_emitter.address, 'LogDoubleWithIndex'),
+        (other_emitter.address, 'LogSingleArg'),
+    ]
+    assert router.decode(log_entries[1]) is None
+    assert router.decode(log_entries[0]) == events[0]
+
+
+def test_event_router_skips_mismatched_indexing(emitter, emit_logs):
+    # same signature as LogDoubleArg, with both arguments indexed
+    log_entries = emit_logs(emitter, [('logDouble', 'LogDoubleWithIndex', [1, 2])])
+    event_abi = dict(
+        emitter._find_matching_event_abi('LogDoubleWithIndex'),
+        inputs=[dict(arg, indexed=True) for arg in emitter._find_matching_event_abi(
+            'LogDoubleWithIndex',
+        )['inputs']],
+    )
+
+    router = EventRouter()
+    router.add_event_abi(event_abi)
+
+    assert router.processLogs(log_entries) == ()
+
+
+ERC20_TRANSFER = {
+    'anonymous': False,
+    'name': 'Transfer',
+    'type': 'event',
+    'inputs': [
+        {'indexed': True, 'name': 'from', 'type': 'address'},
+        {'indexed': True, 'name': 'to', 'type': 'address'},
+        {'indexed': False, 'name': 'value', 'type': 'uint256'},
+    ],
+}
+ERC721_TRANSFER = {
+    'anonymous': False,
+    'name': 'Transfer',
+    'type': 'event',
+    'inputs': [
+        {'indexed': True, 'name': 'from', 'type': 'address'},
+        {'indexed': True, 'name': 'to', 'type': 'address'},
+        {'indexed': True, 'name': 'tokenId', 'type': 'uint256'},
+    ],
+}
+TOKEN_ADDRESS = '0x' + '11' * 20
+FROM_ADDRESS = '0x' + '22' * 20
+TO_ADDRESS = '0x' + '33' * 20
+
+
+def make_transfer_log(indexed_values, data_values, log_index):
+    return {
+        'address': TOKEN_ADDRESS,
+        'topics': [event_abi_to_log_topic(ERC20_TRANSFER)] + [
+            encode_single(abi_type, value)
+            for abi_type, value
+            in indexed_values
+        ],
+        'data': b''.join(encode_single(abi_type, value) for abi_type, value in data_values),
+        'logIndex': log_index,
+        'transactionIndex': 0,
+        'transactionHash': b'\x01' * 32,
+        'blockHash': b'\x02' * 32,
+        'blockNumber': 1,
+    }
+
+
+@pytest.mark.parametrize('address', (None, TOKEN_ADDRESS))
+def test_event_router_tells_events_apart_by_indexed_arguments(address):
+    erc20_log = make_transfer_log(
+        [('address', FROM_ADDRESS), ('address', TO_ADDRESS)],
+        [('uint256', 100)],
+        0,
+    )
+    erc721_log = make_transfer_log(
+        [('address', FROM_ADDRESS), ('address', TO_ADDRESS), ('uint256', 7)],
+        [],
+        1,
+    )
+
+    router = EventRouter()
+    router.add_event_abi(ERC20_TRANSFER, address)
+    router.add_event_abi(ERC721_TRANSFER, address)
+    events = router.processLogs([erc20_log, erc721_log])
+
+    assert events == (
+        get_event_data(ERC20_TRANSFER, erc20_log),
+        get_event_data(ERC721_TRANSFER, erc721_log),
+    )
+    assert events[0].args.value == 100
+    assert events[1].args.tokenId == 7
+    assert len(router.topics) == 1
+
+
+def test_event_router_rejects_anonymous_events(emitter):
+    with pytest.raises(ValueError, match="Anonymous"):
+        EventRouter([emitter.events.LogSingleAnonymous])
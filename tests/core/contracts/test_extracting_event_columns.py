@@ -0,0 +1,125 @@
+import array
+import pytest
+
+from eth_utils import (
+    to_bytes,
+)
+
+from web3._utils.event_columns import (
+    get_event_columns,
+)
+from web3._utils.events import (
+    get_event_data,
+)
+
+# Ignore warning in pyethereum 1.6 - will go away with the upgrade
+pytestmark = pytest.mark.filterwarnings("ignore:implicit cast from 'char *'")
+
+
+@pytest.fixture()
+def Emitter(web3, EMITTER):
+    return web3.eth.contract(**EMITTER)
+
+
+@pytest.fixture()
+def emitter(web3, Emitter, wait_for_block):
+    wait_for_block(web3)
+    deploy_txn_hash = Emitter.constructor().transact({'from': web3.eth.coinbase, 'gas': 1000000})
+    deploy_receipt = web3.eth.waitForTransactionReceipt(deploy_txn_hash)
+    return Emitter(address=deploy_receipt['contractAddress'])
+
+
+@pytest.fixture()
+def emit_logs(web3, emitter, emitter_event_ids, wait_for_transaction):
+    def _emit_logs(contract_fn, event_name, call_args_list):
+        event_id = getattr(emitter_event_ids, event_name)
+        log_entries = []
+        for call_args in call_args_list:
+            txn_hash = emitter.functions[contract_fn](event_id, *call_args).transact()
+            log_entries.extend(wait_for_transaction(web3, txn_hash)['logs'])
+        return log_entries
+    return _emit_logs
+
+
+@pytest.mark.parametrize(
+    'contract_fn,event_name,call_args_list',
+    (
+        ('logSingle', 'LogSingleArg', [[12345], [2 ** 255]]),
+        ('logSingle', 'LogSingleWithIndex', [[12345], [54321]]),
+        ('logSingle', 'LogSingleAnonymous', [[12345], [54321]]),
+        ('logDouble', 'LogDoubleWithIndex', [[12345, 54321], [1, 2]]),
+        ('logQuadruple', 'LogQuadrupleWithIndex', [[12345, 54321, 98765, 56789], [1, 2, 3, 4]]),
+    )
+)
+def test_event_columns_match_event_data(emitter,
+                                        emit_logs,
+                                        contract_fn,
+                                        event_name,
+                                        call_args_list):
+    log_entries = emit_logs(contract_fn, event_name, call_args_list)
+    event_abi = emitter._find_matching_event_abi(event_name)
+
+    columns = get_event_columns(event_abi, log_entries, use_numpy=False)
+
+    for index, log_entry in enumerate(log_entries):
+        event_data = get_event_data(event_abi, log_entry)
+        for name, value in event_data['args'].items():
+            assert columns[name][index] == value
+        assert columns['blockNumber'][index] == event_data['blockNumber']
+        assert columns['transactionIndex'][index] == event_data['transactionIndex']
+        assert columns['logIndex'][index] == event_data['logIndex']
+        assert columns['blockHash'][32 * index:32 * (index + 1)] == event_data['blockHash']
+        assert columns['transactionHash'][32 * index:32 * (index + 1)] == (
+            event_data['transactionHash']
+        )
+        assert columns['address'][20 * index:20 * (index + 1)] == to_bytes(
+            hexstr=event_data['address']
+        )
+
+
+def test_event_columns_are_compact(emitter, emit_logs):
+    log_entries = emit_logs('logSingle', 'LogSingleWithIndex', [[1], [2], [3]])
+    event_abi = emitter._find_matching_event_abi('LogSingleWithIndex')
+
+    columns = get_event_columns(event_abi, log_entries, use_numpy=False)
+
+    assert columns['arg0'] == [1, 2, 3]
+    assert isinstance(columns['blockNumber'], array.array)
+    assert isinstance(columns['logIndex'], array.array)
+    assert columns['address'] == to_bytes(hexstr=emitter.address) * 3
+    assert len(columns['blockHash']) == 32 * 3
+
+
+def test_event_columns_dynamic_arguments(web3, emitter, wait_for_transaction):
+    strings = ("first-string-which-exceeds-32-bytes-in-length", "second")
+    txn_hash = emitter.functions.logDynamicArgs(*strings).transact()
+    log_entries = wait_for_transaction(web3, txn_hash)['logs']
+    event_abi = emitter._find_matching_event_abi('LogDynamicArgs')
+
+    columns = get_event_columns(event_abi, log_entries, use_numpy=False)
+
+    assert columns['arg0'] == web3.keccak(text=strings[0])
+    assert columns['arg1'] == [strings[1]]
+
+
+def test_event_columns_skip_other_events(emitter, emit_logs):
+    log_entries = emit_logs('logSingle', 'LogSingleArg', [[1], [2]])
+    log_entries += emit_logs('logNoArgs', 'LogNoArguments', [[]])
+
+    columns = emitter.events.LogSingleArg.processLogColumns(log_entries, use_numpy=False)
+
+    assert list(columns['arg0']) == [1, 2]
+    assert len(columns['blockNumber']) == 2
+
+
+def test_event_columns_with_numpy(emitter, emit_logs):
+    numpy = pytest.importorskip('numpy')
+    log_entries = emit_logs('logDouble', 'LogDoubleWithIndex', [[1, 2], [3, 4]])
+
+    columns = emitter.events.LogDoubleWithIndex.processLogColumns(log_entries, use_numpy=True)
+
+    assert columns['arg0'] == [1, 3]
+    assert isinstance(columns['blockNumber'], numpy.ndarray)
+    assert columns['blockNumber'].dtype == numpy.uint64
+    assert columns['transactionHash'].shape == (2, 32)
+    assert bytes(columns['transactionHash'][1]) == log_entries[1]['transactionHash']
@@ -0,0 +1,85 @@
+import pytest
+
+from eth_tester.exceptions import (
+    TransactionFailed,
+)
+
+from web3.multicall import (
+    MULTICALL_RUNTIME,
+    Multicall,
+)
+
+# Ignore warning in pyethereum 1.6 - will go away with the upgrade
+pytestmark = pytest.mark.filterwarnings("ignore:implicit cast from 'char *'")
+
+
+def deploy(web3, Contract, args=None):
+    deploy_txn = Contract.constructor(*(args or [])).transact()
+    deploy_receipt = web3.eth.waitForTransactionReceipt(deploy_txn)
+    return Contract(address=deploy_receipt['contractAddress'])
+
+
+@pytest.fixture()
+def math_contract(web3, MathContract):
+    return deploy(web3, MathContract)
+
+
+@pytest.fixture()
+def string_contract(web3, StringContract):
+    return deploy(web3, StringContract, args=["Caqalai"])
+
+
+@pytest.fixture()
+def multicall(web3):
+    return Multicall.deploy(web3)
+
+
+def test_multicall_deploy(web3, multicall):
+    assert web3.eth.getCode(multicall.address).hex() == MULTICALL_RUNTIME
+
+
+def test_multicall_call(multicall, math_contract, string_contract):
+    contract_functions = [
+        math_contract.functions.return13(),
+        string_contract.functions.getValue(),
+        math_contract.functions.add(7, 8),
+        math_contract.functions.multiply7(3),
+        math_contract.functions.counter(),
+    ]
+
+    results = multicall.call(contract_functions)
+
+    assert results == [fn.call() for fn in contract_functions]
+    assert results == [13, "Caqalai", 15, 21, 0]
+
+
+def test_multicall_call_in_batches(web3, math_contract):
+    multicall = Multicall.deploy(web3, batch_size=2)
+
+    results = multicall.call([math_contract.functions.multiply7(i) for i in range(5)])
+
+    assert results == [0, 7, 14, 21, 28]
+
+
+def test_multicall_call_at_block(web3, multicall, math_contract):
+    block_number = web3.eth.blockNumber
+    txn_hash = math_contract.functions.increment().transact()
+    web3.eth.waitForTransactionReceipt(txn_hash)
+
+    assert multicall.call([math_contract.functions.counter()]) == [1]
+    assert multicall.call(
+        [math_contract.functions.counter()],
+        block_identifier=block_number,
+    ) == [0]
+
+
+def test_multicall_call_failures(web3, multicall, math_contract, MathContract):
+    # the aggregator contract reverts calls to unknown functions
+    failing_function = MathContract(address=multicall.address).functions.return13()
+
+    results = multicall.call([math_contract.functions.return13(), failing_function])
+    assert results == [13, None]
+
+    strict_multicall = Multicall(web3, multicall.address, require_success=True)
+    with pytest.raises(TransactionFailed):
+        strict_multicall.call([math_contract.functions.return13(), failing_function])
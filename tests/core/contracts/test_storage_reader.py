@@ -0,0 +1,181 @@
+import pytest
+
+from eth_abi import (
+    encode_single,
+)
+from eth_utils import (
+    to_bytes,
+    to_canonical_address,
+    to_int,
+)
+
+from web3.storage import (
+    get_array_slot,
+    get_mapping_slot,
+    get_storage_decoder,
+)
+
+# Ignore warning in pyethereum 1.6 - will go away with the upgrade
+pytestmark = pytest.mark.filterwarnings("ignore:implicit cast from 'char *'")
+
+ADD = b'\x01'
+SHA3 = b'\x20'
+MSTORE = b'\x52'
+SSTORE = b'\x55'
+RETURN = b'\xf3'
+
+OWNER = '0x' + '11' * 20
+HOLDERS = ['0x' + '%02x' % i * 20 for i in range(1, 6)]
+BALANCES = [i * 10 ** 18 for i in range(1, 6)]
+ITEMS = [7, 0, 2 ** 256 - 1, 42]
+
+
+def push(value, size=32):
+    return bytes([0x5f + size]) + value.to_bytes(size, 'big')
+
+
+def push_word(word):
+    return push(int.from_bytes(word, 'big'))
+
+
+def store(slot_code, value):
+    # the value goes on the stack first, the slot is computed on top of it
+    return push(value) + slot_code + SSTORE
+
+
+def mapping_slot_code(slot, key_word):
+    # keccak(key . slot), computed by the EVM as solidity does
+    return (
+        push_word(key_word) + push(0, 1) + MSTORE +
+        push(slot) + push(32, 1) + MSTORE +
+        push(64, 1) + push(0, 1) + SHA3
+    )
+
+
+def string_mapping_slot_code(slot, key):
+    key_bytes = key.encode()
+    return (
+        push_word(key_bytes.ljust(32, b'\0')) + push(0, 1) + MSTORE +
+        push(slot) + push(len(key_bytes), 1) + MSTORE +
+        push(len(key_bytes) + 32, 1) + push(0, 1) + SHA3
+    )
+
+
+def array_slot_code(slot, index):
+    return (
+        push(slot) + push(0, 1) + MSTORE +
+        push(32, 1) + push(0, 1) + SHA3 +
+        push(index) + ADD
+    )
+
+
+def storage_init_code():
+    """
+    The init code of a contract which sets up its storage like:
+
+        address owner;                          // slot 0
+        mapping(address => uint256) balances;   // slot 1
+        uint256[] items;                        // slot 2
+        mapping(string => int8) scores;         // slot 3
+    """
+    code = store(push(0), int(OWNER, 16))
+    for holder, balance in zip(HOLDERS, BALANCES):
+        code += store(mapping_slot_code(1, encode_single('address', holder)), balance)
+    code += store(push(2), len(ITEMS))
+    for index, item in enumerate(ITEMS):
+        code += store(array_slot_code(2, index), item)
+    code += store(string_mapping_slot_code(3, 'alice'), 2 ** 256 - 5)
+    # return a single byte of runtime code
+    return code + push(1, 1) + push(0, 1) + RETURN
+
+
+def to_integer(value):
+    if isinstance(value, str):
+        return to_int(hexstr=value)
+    return value
+
+
+@pytest.fixture()
+def storage_web3(web3, monkeypatch):
+    # eth-tester doesn't implement eth_getStorageAt, so it is read from the
+    # state of the py-evm backend at the requested block.
+    provider = web3.providers[0]
+    chain = provider.ethereum_tester.backend.chain
+
+    def get_storage_at(eth_tester, params):
+        address, slot, block_number = params
+        header = chain.get_canonical_block_by_number(to_integer(block_number)).header
+        value = chain.get_vm(header).state.account_db.get_storage(
+            to_canonical_address(address),
+            to_integer(slot),
+        )
+        return '0x' + value.to_bytes(32, 'big').hex()
+
+    api_endpoints = dict(provider.api_endpoints)
+    api_endpoints['eth'] = dict(api_endpoints['eth'], getStorageAt=get_storage_at)
+    monkeypatch.setattr(provider, 'api_endpoints', api_endpoints)
+    return web3
+
+
+@pytest.fixture()
+def storage_contract_address(web3):
+    txn_hash = web3.eth.sendTransaction({
+        'from': web3.eth.coinbase,
+        'data': storage_init_code(),
+        'gas': 2000000,
+    })
+    return web3.eth.waitForTransactionReceipt(txn_hash)['contractAddress']
+
+
+def test_storage_reader(storage_web3, storage_contract_address):
+    web3 = storage_web3
+    storage = web3.storage(storage_contract_address, batch_size=2)
+
+    assert storage.read([0], 'address') == [web3.toChecksumAddress(OWNER)]
+    assert storage.read_mapping(1, HOLDERS, 'address') == BALANCES
+    assert storage.read_mapping(1, [OWNER], 'address') == [0]
+    assert storage.read_array(2) == ITEMS
+    assert storage.read_array(2, 'bytes32', indexes=[3]) == [(42).to_bytes(32, 'big')]
+    assert storage.read_mapping(3, ['alice', 'bob'], 'string', 'int8') == [-5, 0]
+
+
+def test_storage_reader_is_pinned_to_a_block(storage_web3, storage_contract_address):
+    web3 = storage_web3
+    storage = web3.storage(storage_contract_address)
+    block_number = storage.block_number
+
+    web3.eth.sendTransaction({'from': web3.eth.coinbase, 'to': OWNER, 'value': 1})
+
+    assert web3.eth.blockNumber > block_number
+    assert storage.block_number == block_number
+    assert web3.storage(storage_contract_address, block_number - 1).read([0]) == [0]
+
+
+def test_get_mapping_slot_of_bytes_keys():
+    assert get_mapping_slot(5, '0x0102', 'bytes') == get_mapping_slot(5, b'\x01\x02', 'bytes')
+    assert get_mapping_slot(5, b'\x01', 'bytes') != get_mapping_slot(5, b'\x01', 'bytes1')
+    assert get_array_slot(1, 3, item_slots=2) == get_array_slot(1, 0) + 6
+
+
+@pytest.mark.parametrize(
+    'abi_type,word,expected',
+    (
+        ('uint8', '0x' + 'ff' * 32, 255),
+        ('int16', '0x' + '00' * 30 + 'fffe', -2),
+        ('bool', '0x' + '00' * 31 + '01', True),
+        ('bytes4', '0x' + '00' * 28 + '12345678', b'\x12\x34\x56\x78'),
+        (
+            'address',
+            '0x' + '00' * 12 + '5b2063246f2191f18f2675cedb8b28102e957458',
+            '0x5B2063246F2191f18F2675ceDB8b28102e957458',
+        ),
+    ),
+)
+def test_get_storage_decoder(abi_type, word, expected):
+    assert get_storage_decoder(abi_type)(to_bytes(hexstr=word)) == expected
+
+
+@pytest.mark.parametrize('abi_type', ('string', 'bytes', 'uint256[]', 'fixed128x18'))
+def test_get_storage_decoder_rejects_other_types(abi_type):
+    with pytest.raises(ValueError):
+        get_storage_decoder(abi_type)
@@ -0,0 +1,82 @@
+import pytest
+import threading
+
+
+@pytest.fixture()
+def batches(web3, monkeypatch):
+    provider = web3.providers[0]
+    batches = []
+    make_batch_request = provider.make_batch_request
+
+    def _make_batch_request(requests):
+        batches.append([method for method, _ in requests])
+        return make_batch_request(requests)
+
+    monkeypatch.setattr(provider, 'make_batch_request', _make_batch_request)
+    return batches
+
+
+def mine_transactions(web3, count):
+    return [
+        web3.eth.sendTransaction({
+            'from': web3.eth.coinbase,
+            'to': web3.eth.coinbase,
+            'value': 1,
+        })
+        for _ in range(count)
+    ]
+
+
+def test_getBlocks_makes_batch_requests(web3, batches):
+    mine_transactions(web3, 4)
+
+    blocks = list(web3.eth.getBlocks(0, 5, batch_size=2))
+
+    assert [block['number'] for block in blocks] == [0, 1, 2, 3, 4]
+    block_batches = [batch for batch in batches if 'eth_getBlockByNumber' in batch]
+    assert sorted(len(batch) for batch in block_batches) == [1, 2, 2]
+
+
+def test_getBlocks_fetches_batches_concurrently(web3, monkeypatch):
+    mine_transactions(web3, 4)
+    provider = web3.providers[0]
+    make_request = provider.make_request
+    # eth-tester doesn't support batch requests, so only requests made at
+    # the same time can all reach the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    def _make_request(method, params):
+        if method == 'eth_getBlockByNumber':
+            barrier.wait()
+        return make_request(method, params)
+
+    monkeypatch.setattr(provider, 'make_request', _make_request)
+    blocks = web3.eth.getBlocks(1, 5, concurrency=2, batch_size=1)
+
+    assert [block['number'] for block in blocks] == [1, 2, 3, 4]
+
+
+def test_getTransactionReceipts_makes_batch_requests(web3, batches):
+    transaction_hashes = mine_transactions(web3, 3)
+
+    receipts = web3.eth.getTransactionReceipts(transaction_hashes, concurrency=1, batch_size=2)
+
+    assert [receipt['transactionHash'] for receipt in receipts] == transaction_hashes
+    assert batches == [['eth_getTransactionReceipt'] * 2, ['eth_getTransactionReceipt']]
+
+
+def test_getTransactionReceipts_fetches_batches_concurrently(web3, monkeypatch):
+    transaction_hashes = mine_transactions(web3, 4)
+    provider = web3.providers[0]
+    make_request = provider.make_request
+    barrier = threading.Barrier(2, timeout=5)
+
+    def _make_request(method, params):
+        if method == 'eth_getTransactionReceipt':
+            barrier.wait()
+        return make_request(method, params)
+
+    monkeypatch.setattr(provider, 'make_request', _make_request)
+    receipts = web3.eth.getTransactionReceipts(transaction_hashes, concurrency=2, batch_size=1)
+
+    assert [receipt['transactionHash'] for receipt in receipts] == transaction_hashes
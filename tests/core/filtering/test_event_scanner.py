@@ -0,0 +1,139 @@
+import pytest
+
+from web3.scanner import (
+    EventScanner,
+    FileCheckpointStore,
+    MemoryCheckpointStore,
+)
+
+
+@pytest.fixture()
+def emit(web3, emitter, emitter_event_ids, wait_for_transaction):
+    def _emit(value):
+        txn_hash = emitter.functions.logSingle(emitter_event_ids.LogSingleArg, value).transact()
+        wait_for_transaction(web3, txn_hash)
+        return txn_hash
+    return _emit
+
+
+def _scanned_values(events):
+    return [event['args']['arg0'] for event in events]
+
+
+def test_event_scanner_yields_events_in_order(web3, emitter, emitter_event_ids, emit):
+    start_block = web3.eth.blockNumber
+    for value in range(1, 6):
+        emit(value)
+        emitter.functions.logNoArgs(emitter_event_ids.LogNoArguments).transact()
+
+    scanner = EventScanner(web3, [emitter.events.LogSingleArg], chunk_size=3)
+    events = list(scanner.scan(start_block))
+
+    assert _scanned_values(events) == [1, 2, 3, 4, 5]
+    assert all(event['event'] == 'LogSingleArg' for event in events)
+    assert scanner.last_scanned_block == web3.eth.blockNumber
+
+
+def test_event_scanner_scans_multiple_events(web3, emitter, emitter_event_ids, emit):
+    start_block = web3.eth.blockNumber
+    emit(1)
+    emitter.functions.logNoArgs(emitter_event_ids.LogNoArguments).transact()
+    emit(2)
+
+    scanner = EventScanner(
+        web3,
+        [emitter.events.LogSingleArg, emitter.events.LogNoArguments],
+    )
+    events = list(scanner.scan(start_block))
+
+    assert [event['event'] for event in events] == [
+        'LogSingleArg',
+        'LogNoArguments',
+        'LogSingleArg',
+    ]
+
+
+def test_event_scanner_rejects_anonymous_events(web3, emitter):
+    with pytest.raises(ValueError):
+        EventScanner(web3, [emitter.events.LogAnonymous])
+
+
+def test_event_scanner_resumes_from_checkpoint(web3, emitter, emit, tmpdir):
+    start_block = web3.eth.blockNumber
+    for value in range(1, 4):
+        emit(value)
+
+    store = FileCheckpointStore(str(tmpdir.join('checkpoints.json')))
+    events = list(EventScanner(web3, [emitter.events.LogSingleArg], store).scan(start_block))
+    assert _scanned_values(events) == [1, 2, 3]
+
+    for value in range(4, 6):
+        emit(value)
+
+    # a fresh scanner, as after a restart, only yields the new events
+    events = list(EventScanner(web3, [emitter.events.LogSingleArg], store).scan(start_block))
+    assert _scanned_values(events) == [4, 5]
+
+
+def test_event_scanner_does_not_checkpoint_unconsumed_events(web3, emitter, emit):
+    start_block = web3.eth.blockNumber
+    for value in range(1, 4):
+        emit(value)
+
+    store = MemoryCheckpointStore()
+    events = EventScanner(web3, [emitter.events.LogSingleArg], store).scan(start_block)
+    assert next(events)['args']['arg0'] == 1
+    events.close()
+
+    events = EventScanner(web3, [emitter.events.LogSingleArg], store).scan(start_block)
+    assert _scanned_values(events) == [1, 2, 3]
+
+
+def test_event_scanner_rescans_after_reorg(web3, emitter, emit):
+    start_block = web3.eth.blockNumber
+    emit(1)
+    snapshot = web3.providers[0].ethereum_tester.take_snapshot()
+    emit(2)
+    emit(3)
+
+    reorgs = []
+    scanner = EventScanner(
+        web3,
+        [emitter.events.LogSingleArg],
+        chunk_size=1,
+        on_reorg=reorgs.append,
+    )
+    assert _scanned_values(scanner.scan(start_block)) == [1, 2, 3]
+
+    web3.providers[0].ethereum_tester.revert_to_snapshot(snapshot)
+    fork_block = web3.eth.blockNumber + 1
+    emit(20)
+    emit(30)
+    emit(40)
+
+    assert _scanned_values(scanner.scan(start_block)) == [20, 30, 40]
+    assert reorgs == [fork_block]
+
+
+def test_event_scanner_stops_at_head(web3, emitter, emit):
+    start_block = web3.eth.blockNumber
+    emit(1)
+    emit(2)
+
+    scanner = EventScanner(web3, [emitter.events.LogSingleArg])
+    events = list(scanner.scan(start_block, end_block=web3.eth.blockNumber + 100))
+
+    assert _scanned_values(events) == [1, 2]
+    assert scanner.last_scanned_block == web3.eth.blockNumber
+
+
+def test_event_scanner_stops_confirmation_blocks_behind_head(web3, emitter, emit):
+    start_block = web3.eth.blockNumber
+    for value in range(1, 4):
+        emit(value)
+
+    scanner = EventScanner(web3, [emitter.events.LogSingleArg], confirmation_blocks=1)
+    events = list(scanner.scan(start_block, end_block=web3.eth.blockNumber + 100))
+
+    assert _scanned_values(events) == [1, 2]
+    assert scanner.last_scanned_block == web3.eth.blockNumber - 1
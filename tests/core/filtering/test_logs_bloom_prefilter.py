@@ -0,0 +1,86 @@
+from web3._utils.bloom import (
+    BloomQuery,
+)
+from web3.middleware.filter import (
+    get_logs_multipart,
+)
+
+
+def emit_logs(web3, emitter, emitter_event_ids, wait_for_transaction):
+    start_block = web3.eth.blockNumber + 1
+    for value in range(3):
+        txn_hash = emitter.functions.logSingle(
+            emitter_event_ids.LogSingleWithIndex,
+            value,
+        ).transact()
+        wait_for_transaction(web3, txn_hash)
+    return start_block, web3.eth.blockNumber
+
+
+def get_blooms(web3, start_block, end_block):
+    return {
+        block['number']: block['logsBloom']
+        for block
+        in web3.eth.getBlocks(start_block, end_block + 1)
+    }
+
+
+def test_logs_bloom_of_block_matches_query(
+        web3,
+        emitter,
+        emitter_event_ids,
+        emitter_log_topics,
+        wait_for_transaction):
+    start_block, end_block = emit_logs(web3, emitter, emitter_event_ids, wait_for_transaction)
+    block = web3.eth.getBlock(end_block)
+
+    assert BloomQuery(emitter.address, [emitter_log_topics.LogSingleWithIndex]).matches(
+        block['logsBloom']
+    )
+    assert BloomQuery(emitter.address, [None, '0x' + '00' * 31 + '02']).matches(
+        block['logsBloom']
+    )
+    assert not BloomQuery(emitter.address, [emitter_log_topics.LogString]).matches(
+        block['logsBloom']
+    )
+
+
+def test_get_logs_multipart_skips_ranges_by_bloom(
+        web3,
+        emitter,
+        emitter_event_ids,
+        emitter_log_topics,
+        wait_for_transaction):
+    start_block, end_block = emit_logs(web3, emitter, emitter_event_ids, wait_for_transaction)
+    blooms = get_blooms(web3, start_block, end_block)
+
+    matching_logs = [
+        log
+        for logs
+        in get_logs_multipart(
+            web3,
+            start_block,
+            end_block,
+            emitter.address,
+            [emitter_log_topics.LogSingleWithIndex],
+            max_blocks=1,
+            blooms=blooms,
+        )
+        for log
+        in logs
+    ]
+    assert len(matching_logs) == 3
+
+    assert BloomQuery(
+        emitter.address,
+        [emitter_log_topics.LogString],
+    ).narrow_block_range(start_block, end_block, blooms) is None
+    assert list(get_logs_multipart(
+        web3,
+        start_block,
+        end_block,
+        emitter.address,
+        [emitter_log_topics.LogString],
+        max_blocks=1,
+        blooms=blooms,
+    )) == [[], [], []]
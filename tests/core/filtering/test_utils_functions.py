@@ -8,6 +8,8 @@ from eth_abi import (
 )
 
 from web3._utils.filters import (
+    compile_match_fn,
+    get_head_size,
     match_fn,
 )
 
@@ -99,3 +101,56 @@ def test_wrong_type_match_data():
     encoded_data = encode_abi(abi_types, data)
     with pytest.raises(ValueError):
         match_fn(match_data_and_abi, encoded_data)
+
+
+@pytest.mark.parametrize(
+    "abi_type,expected",
+    (
+        ("uint256", 32),
+        ("bytes3", 32),
+        ("string", 32),
+        ("bytes", 32),
+        ("uint8[]", 32),
+        ("uint8[3]", 96),
+        ("uint8[2][3]", 192),
+        ("string[2]", 32),
+        ("(uint256,bool[2])", 96),
+        ("(uint256,string)", 32),
+    )
+)
+def test_get_head_size(abi_type, expected):
+    assert get_head_size(abi_type) == expected
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    (
+        (((1, 2), "aye", 7, "0x" + "11" * 20), True),
+        (((1, 2), "aye", 8, "0x" + "11" * 20), True),
+        (((1, 2), "aye", 9, "0x" + "11" * 20), False),
+        (((1, 2), "bee", 7, "0x" + "11" * 20), False),
+        (((1, 2), "aye", 7, "0x" + "22" * 20), False),
+    )
+)
+def test_compiled_match_fn_word_offsets(data, expected):
+    abi_types = ("uint256[2]", "string", "uint8", "address")
+    match_data_and_abi = (
+        ("uint256[2]", None),
+        ("string", ("aye",)),
+        ("uint8", (7, 8)),
+        ("address", ("0x" + "11" * 20, "0x" + "ab" * 20)),
+    )
+    compiled_match_fn = compile_match_fn(match_data_and_abi)
+
+    encoded_data = encode_abi(abi_types, data)
+    assert compiled_match_fn(encoded_data) is expected
+    assert compiled_match_fn(encoded_data.hex()) is expected
+
+
+def test_compiled_match_fn_wrong_type_word():
+    compiled_match_fn = compile_match_fn((("uint8", (1, 256)),))
+
+    # values of the wrong type are rejected when they are compared
+    assert compiled_match_fn(encode_abi(["uint8"], [1])) is True
+    with pytest.raises(ValueError):
+        compiled_match_fn(encode_abi(["uint8"], [2]))
@@ -0,0 +1,171 @@
+import pytest
+import threading
+
+from web3.manager import (
+    RequestManager,
+)
+from web3.middleware import (
+    make_stalecheck_middleware,
+)
+from web3.providers import (
+    BaseProvider,
+)
+
+
+class DummyProvider(BaseProvider):
+    def __init__(self):
+        self.batches = []
+
+    def make_request(self, method, params):
+        if method == 'fail':
+            return {'error': 'failed'}
+        return {'result': [method] + params}
+
+    def make_batch_request(self, requests):
+        self.batches.append(requests)
+        return super().make_batch_request(requests)
+
+
+def tag_middleware(make_request, web3):
+    def middleware(method, params):
+        return make_request(method, params + ['tagged'])
+    return middleware
+
+
+def cache_middleware(make_request, web3):
+    def middleware(method, params):
+        if method == 'cached':
+            return {'result': 'from-cache'}
+        return make_request(method, params)
+    return middleware
+
+
+def double_request_middleware(make_request, web3):
+    def middleware(method, params):
+        if method == 'double':
+            first = make_request('first', params)
+            second = make_request('second', first['result'])
+            return second
+        return make_request(method, params)
+    return middleware
+
+
+def make_locking_middleware():
+    lock = threading.Lock()
+    fetched = []
+
+    def locking_middleware(make_request, web3):
+        def middleware(method, params):
+            # like a shared cache refreshed by the first request to need it
+            with lock:
+                if not fetched:
+                    fetched.append(make_request('refresh', [])['result'])
+            return make_request(method, params)
+        return middleware
+    return locking_middleware
+
+
+@pytest.fixture
+def provider():
+    return DummyProvider()
+
+
+def test_request_blocking_batch(provider):
+    manager = RequestManager(None, provider, middlewares=[tag_middleware])
+
+    results = manager.request_blocking_batch([('a', [1]), ('b', [2]), ('c', [])])
+
+    assert results == [['a', 1, 'tagged'], ['b', 2, 'tagged'], ['c', 'tagged']]
+    assert len(provider.batches) == 1
+    assert sorted(provider.batches[0]) == [
+        ('a', [1, 'tagged']),
+        ('b', [2, 'tagged']),
+        ('c', ['tagged']),
+    ]
+
+
+def test_request_blocking_batch_empty(provider):
+    manager = RequestManager(None, provider, middlewares=[])
+
+    assert manager.request_blocking_batch([]) == []
+    assert provider.batches == []
+
+
+def test_request_blocking_batch_without_provider_request(provider):
+    manager = RequestManager(None, provider, middlewares=[cache_middleware])
+
+    results = manager.request_blocking_batch([('a', []), ('cached', []), ('b', [])])
+
+    assert results == [['a'], 'from-cache', ['b']]
+    assert len(provider.batches) == 1
+    assert sorted(provider.batches[0]) == [('a', []), ('b', [])]
+
+
+def test_request_blocking_batch_with_repeated_provider_requests(provider):
+    manager = RequestManager(None, provider, middlewares=[double_request_middleware])
+
+    results = manager.request_blocking_batch([('double', [1]), ('a', [2])])
+
+    assert results == [['second', 'first', 1], ['a', 2]]
+    assert len(provider.batches) == 2
+    assert sorted(provider.batches[0]) == [('a', [2]), ('first', [1])]
+    assert provider.batches[1] == [('second', ['first', 1])]
+
+
+def test_request_blocking_batch_error(provider):
+    manager = RequestManager(None, provider, middlewares=[])
+
+    with pytest.raises(ValueError, match='failed'):
+        manager.request_blocking_batch([('a', []), ('fail', [])])
+
+
+def test_request_blocking_batch_provider_error(provider, monkeypatch):
+    def make_batch_request(requests):
+        raise IOError('connection lost')
+
+    monkeypatch.setattr(provider, 'make_batch_request', make_batch_request)
+    manager = RequestManager(None, provider, middlewares=[])
+
+    with pytest.raises(IOError, match='connection lost'):
+        manager.request_blocking_batch([('a', []), ('b', [])])
+
+
+def test_request_blocking_batch_with_lock_held_across_request(provider):
+    manager = RequestManager(None, provider, middlewares=[make_locking_middleware()])
+
+    results = manager.request_blocking_batch([('a', []), ('b', []), ('c', []), ('d', [])])
+
+    assert results == [['a'], ['b'], ['c'], ['d']]
+    assert provider.batches[0] == [('refresh', [])]
+    assert sorted(request for batch in provider.batches[1:] for request in batch) == [
+        ('a', []),
+        ('b', []),
+        ('c', []),
+        ('d', []),
+    ]
+
+
+def test_request_blocking_batch_is_split_between_workers(provider):
+    manager = RequestManager(None, provider, middlewares=[])
+    manager.max_batch_workers = 2
+
+    results = manager.request_blocking_batch([('a', []), ('b', []), ('c', [])])
+
+    assert results == [['a'], ['b'], ['c']]
+    assert [sorted(batch) for batch in provider.batches] == [
+        [('a', []), ('b', [])],
+        [('c', [])],
+    ]
+
+
+def test_request_blocking_batch_with_stalecheck(web3):
+    web3.middleware_stack.add(make_stalecheck_middleware(60))
+    accounts = web3.eth.accounts[:4]
+
+    balances = web3.manager.request_blocking_batch(
+        ('eth_getBalance', [account, 'latest'])
+        for account
+        in accounts
+    )
+
+    assert balances == [web3.eth.getBalance(account) for account in accounts]
@@ -1,3 +1,6 @@
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
 import pytest
 
 from web3 import Web3
@@ -7,6 +10,8 @@ from web3.middleware import (
 )
 from web3.middleware.filter import (
     block_ranges,
+    get_logs_multipart,
+    is_too_many_logs_error,
     iter_latest_block_ranges,
 )
 from web3.providers.base import (
@@ -146,3 +151,94 @@ def test_local_filter_middleware(w3, iter_block_number):
 
     # Test that all ids are unique
     assert len(filter_ids) == len(set(filter_ids))
+
+
+@pytest.fixture
+def log_requests():
+    return []
+
+
+@pytest.fixture
+def w3_logs(w3_base, log_requests):
+    # one log per block from block 100 on, and the node refuses to return
+    # more than 20 logs at once.
+    def _get_logs(method, params):
+        from_block, to_block = params[0]['fromBlock'], params[0]['toBlock']
+        log_requests.append((from_block, to_block))
+        logs = [block for block in range(from_block, to_block + 1) if block >= 100]
+        if len(logs) > 20:
+            raise ValueError({'code': -32005, 'message': 'query returned more than 20 results'})
+        return logs
+
+    w3_base.middleware_stack.add(construct_result_generator_middleware({
+        'eth_getLogs': _get_logs,
+    }))
+    return w3_base
+
+
+def test_get_logs_multipart_preserves_order(w3_logs):
+    logs = list(get_logs_multipart(w3_logs, 0, 199, None, None, max_blocks=5, max_logs=8))
+    assert [log for chunk in logs for log in chunk] == list(range(100, 200))
+
+
+def test_get_logs_multipart_grows_chunks_over_sparse_ranges(w3_logs, log_requests):
+    list(get_logs_multipart(w3_logs, 0, 99, None, None, max_blocks=5, concurrency=2))
+    assert log_requests[:2] == [(0, 4), (5, 9)]
+    assert log_requests[2:4] == [(10, 19), (20, 29)]
+    assert len(log_requests) < 20
+
+
+def test_get_logs_multipart_shrinks_chunks_over_dense_ranges(w3_logs, log_requests):
+    list(get_logs_multipart(
+        w3_logs, 100, 199, None, None, max_blocks=40, max_logs=10, concurrency=1,
+    ))
+    # the first range is bisected after being rejected by the node
+    assert log_requests[:3] == [(100, 139), (100, 119), (120, 139)]
+    assert all(to_block - from_block < 20 for from_block, to_block in log_requests[3:])
+
+
+def test_get_logs_multipart_reraises_other_errors(w3_base):
+    def _get_logs(method, params):
+        raise ValueError({'code': -32000, 'message': 'unknown block'})
+
+    w3_base.middleware_stack.add(construct_result_generator_middleware({
+        'eth_getLogs': _get_logs,
+    }))
+    with pytest.raises(ValueError):
+        list(get_logs_multipart(w3_base, 0, 10, None, None, max_blocks=5))
+
+
+def test_get_logs_multipart_uses_one_executor(w3_logs, monkeypatch):
+    executors = []
+
+    class RecordingThreadPoolExecutor(ThreadPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            executors.append(self)
+
+    monkeypatch.setattr(
+        'web3.middleware.filter.ThreadPoolExecutor',
+        RecordingThreadPoolExecutor,
+    )
+    logs = list(get_logs_multipart(w3_logs, 0, 199, None, None, max_blocks=5, concurrency=2))
+
+    assert [log for chunk in logs for log in chunk] == list(range(100, 200))
+    assert len(executors) == 1
+
+
+@pytest.mark.parametrize(
+    'error,expected',
+    (
+        ({'code': -32005, 'message': 'query returned more than 10000 results'}, True),
+        ({'code': -32005, 'message': 'limit exceeded'}, True),
+        ({'code': -32602, 'message': 'Log response size exceeded.'}, True),
+        ({'code': -32600, 'message': 'block range is too wide'}, True),
+        ({'code': -32000, 'message': 'exceed maximum block range: 5000'}, True),
+        ('query returned more than 10000 results', True),
+        ({'code': -32000, 'message': 'gas required exceeds allowance'}, False),
+        ({'code': -32000, 'message': 'more than one filter'}, False),
+        ({'code': -32000, 'message': 'unknown block'}, False),
+    ),
+)
+def test_is_too_many_logs_error(error, expected):
+    assert is_too_many_logs_error(ValueError(error)) is expected
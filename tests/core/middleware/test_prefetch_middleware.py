@@ -0,0 +1,121 @@
+import collections
+import pytest
+import threading
+import time
+
+from eth_utils import (
+    keccak,
+)
+
+from web3 import Web3
+from web3.middleware import (
+    construct_prefetch_middleware,
+    construct_result_generator_middleware,
+)
+from web3.providers.base import (
+    BaseProvider,
+)
+
+
+@pytest.fixture
+def requests():
+    return collections.Counter()
+
+
+@pytest.fixture
+def head():
+    return {'number': 30}
+
+
+def _wait_for(condition, timeout=2):
+    expire_at = time.time() + timeout
+    while not condition():
+        assert time.time() < expire_at
+        time.sleep(0.01)
+
+
+def _mk_transaction_hash(block_number, index):
+    return keccak(text='{0}-{1}'.format(block_number, index))
+
+
+@pytest.fixture
+def w3(requests, head):
+    lock = threading.Lock()
+
+    def _get_block_by_number(method, params):
+        block_number = params[0]
+        with lock:
+            requests[(method, block_number)] += 1
+        if block_number > head['number']:
+            return None
+        return {
+            'hash': keccak(block_number),
+            'number': block_number,
+            'transactions': [
+                _mk_transaction_hash(block_number, index)
+                for index
+                in range(10)
+            ],
+        }
+
+    def _get_transaction_receipt(method, params):
+        with lock:
+            requests[(method, params[0])] += 1
+        return {'transactionHash': params[0]}
+
+    w3 = Web3(providers=[BaseProvider()], middlewares=[])
+    w3.middleware_stack.add(construct_result_generator_middleware({
+        'eth_getBlockByNumber': _get_block_by_number,
+        'eth_getTransactionReceipt': _get_transaction_receipt,
+    }))
+    w3.middleware_stack.add(construct_prefetch_middleware(prefetch_depth=4, max_workers=2))
+    return w3
+
+
+def test_prefetch_middleware_prefetches_sequential_blocks(w3, requests):
+    for block_number in range(10):
+        block = w3.eth.getBlock(block_number)
+        assert block['number'] == block_number
+
+    # every block was requested exactly once
+    for block_number in range(10):
+        assert requests[('eth_getBlockByNumber', block_number)] == 1
+    # and the prefetcher is ahead of the caller
+    _wait_for(lambda: requests[('eth_getBlockByNumber', 13)] == 1)
+    assert requests[('eth_getBlockByNumber', 14)] == 0
+
+
+def test_prefetch_middleware_ignores_random_access(w3, requests):
+    for block_number in (5, 1, 9, 3):
+        w3.eth.getBlock(block_number)
+
+    assert sum(requests.values()) == 4
+
+
+def test_prefetch_middleware_refetches_blocks_past_head(w3, requests, head):
+    for block_number in range(28, 31):
+        w3.eth.getBlock(block_number)
+
+    _wait_for(lambda: requests[('eth_getBlockByNumber', 31)] == 1)
+
+    head['number'] = 31
+    assert w3.eth.getBlock(31)['number'] == 31
+    assert requests[('eth_getBlockByNumber', 31)] == 2
+
+
+def test_prefetch_middleware_prefetches_sequential_receipts(w3, requests):
+    block = w3.eth.getBlock(3)
+    for transaction_hash in block['transactions'][:5]:
+        receipt = w3.eth.getTransactionReceipt(transaction_hash)
+        assert receipt['transactionHash'] == transaction_hash
+
+    for transaction_hash in block['transactions'][:5]:
+        assert requests[('eth_getTransactionReceipt', transaction_hash)] == 1
+
+    next_hashes = block['transactions'][5:9]
+    _wait_for(lambda: all(
+        requests[('eth_getTransactionReceipt', transaction_hash)] == 1
+        for transaction_hash
+        in next_hashes
+    ))
+    assert requests[('eth_getTransactionReceipt', block['transactions'][9])] == 0
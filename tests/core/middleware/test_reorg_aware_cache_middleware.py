@@ -0,0 +1,207 @@
+import itertools
+import pytest
+import uuid
+
+from eth_utils import (
+    is_integer,
+    keccak,
+)
+
+from web3 import Web3
+from web3.middleware import (
+    construct_error_generator_middleware,
+    construct_reorg_aware_cache_middleware,
+    construct_result_generator_middleware,
+)
+from web3.providers.base import (
+    BaseProvider,
+)
+
+
+@pytest.fixture
+def w3_base():
+    return Web3(providers=[BaseProvider()], middlewares=[])
+
+
+class FakeChain:
+    def __init__(self, num_blocks):
+        self.fork_counter = itertools.count()
+        self.blocks = []
+        self.uncles = []
+        self.extend(num_blocks)
+
+    def _mk_block(self, number, salt):
+        if number == 0:
+            parent_hash = b'\x00' * 32
+        else:
+            parent_hash = self.blocks[number - 1]['hash']
+        return {
+            'hash': keccak(text='{0}-{1}'.format(number, salt)),
+            'parentHash': parent_hash,
+            'number': number,
+            'timestamp': number,
+        }
+
+    def extend(self, num_blocks, salt=0):
+        for _ in range(num_blocks):
+            self.blocks.append(self._mk_block(len(self.blocks), salt))
+
+    def reorg(self, fork_block_number, num_blocks=None):
+        if num_blocks is None:
+            num_blocks = len(self.blocks) - fork_block_number
+        self.blocks = self.blocks[:fork_block_number]
+        self.extend(num_blocks, salt=next(self.fork_counter) + 1)
+
+    @property
+    def head(self):
+        return self.blocks[-1]
+
+
+@pytest.fixture
+def chain():
+    return FakeChain(10)
+
+
+@pytest.fixture
+def chain_middleware(chain):
+    def _get_block_by_number(method, params):
+        block_id = params[0]
+        if block_id == 'latest':
+            return chain.head
+        elif is_integer(block_id) and block_id < len(chain.blocks):
+            return chain.blocks[block_id]
+        return None
+
+    def _get_block_by_hash(method, params):
+        for block in chain.blocks + chain.uncles:
+            if block['hash'] == params[0]:
+                return block
+        return None
+
+    def _get_transaction_receipt(method, params):
+        block = chain.blocks[int(params[0], 16)]
+        return {
+            'transactionHash': params[0],
+            'blockHash': block['hash'],
+            'blockNumber': block['number'],
+            'nonce': str(uuid.uuid4()),
+        }
+
+    return construct_result_generator_middleware({
+        'eth_getBlockByNumber': _get_block_by_number,
+        'eth_getBlockByHash': _get_block_by_hash,
+        'eth_getTransactionReceipt': _get_transaction_receipt,
+        'eth_getBalance': lambda *_: str(uuid.uuid4()),
+        'eth_getLogs': lambda *_: [{'data': str(uuid.uuid4())}],
+    })
+
+
+@pytest.fixture
+def reorg_aware_cache_middleware():
+    return construct_reorg_aware_cache_middleware(
+        cache_class=dict,
+        head_poll_interval=0,
+    )
+
+
+@pytest.fixture
+def w3(w3_base, chain_middleware, reorg_aware_cache_middleware):
+    w3_base.middleware_stack.add(chain_middleware)
+    w3_base.middleware_stack.add(reorg_aware_cache_middleware)
+    return w3_base
+
+
+def test_reorg_aware_cache_middleware_caches_pinned_requests(w3):
+    result = w3.manager.request_blocking('eth_getBalance', ['0x0', 8])
+
+    assert w3.manager.request_blocking('eth_getBalance', ['0x0', 8]) == result
+    assert w3.manager.request_blocking('eth_getBalance', ['0x0', 7]) != result
+
+
+def test_reorg_aware_cache_middleware_does_not_cache_latest(w3):
+    result = w3.manager.request_blocking('eth_getBalance', ['0x0', 'latest'])
+
+    assert w3.manager.request_blocking('eth_getBalance', ['0x0', 'latest']) != result
+    assert w3.manager.request_blocking('eth_getBalance', ['0x0']) != result
+
+
+def test_reorg_aware_cache_middleware_evicts_reorged_blocks(w3, chain):
+    unaffected = w3.manager.request_blocking('eth_getBalance', ['0x0', 6])
+    orphaned = w3.manager.request_blocking('eth_getBalance', ['0x0', 8])
+    orphaned_block = w3.manager.request_blocking('eth_getBlockByNumber', [8, False])
+
+    chain.reorg(7)
+
+    assert w3.manager.request_blocking('eth_getBalance', ['0x0', 6]) == unaffected
+    assert w3.manager.request_blocking('eth_getBalance', ['0x0', 8]) != orphaned
+    block = w3.manager.request_blocking('eth_getBlockByNumber', [8, False])
+    assert block['hash'] != orphaned_block['hash']
+    assert block['hash'] == chain.blocks[8]['hash']
+
+
+def test_reorg_aware_cache_middleware_evicts_reorg_behind_new_head(w3, chain):
+    orphaned = w3.manager.request_blocking('eth_getTransactionReceipt', ['0x7'])
+
+    chain.reorg(5, num_blocks=8)
+
+    receipt = w3.manager.request_blocking('eth_getTransactionReceipt', ['0x7'])
+    assert receipt != orphaned
+    assert receipt['blockHash'] == chain.blocks[7]['hash']
+
+
+def test_reorg_aware_cache_middleware_does_not_cache_above_head(w3, chain):
+    filter_params = {'fromBlock': 5, 'toBlock': 20}
+    result = w3.manager.request_blocking('eth_getLogs', [filter_params])
+
+    assert w3.manager.request_blocking('eth_getLogs', [filter_params]) != result
+    assert w3.manager.request_blocking('eth_getBalance', ['0x0', 12]) != (
+        w3.manager.request_blocking('eth_getBalance', ['0x0', 12])
+    )
+
+    result = w3.manager.request_blocking('eth_getLogs', [{'fromBlock': 5, 'toBlock': 9}])
+    assert w3.manager.request_blocking('eth_getLogs', [{'fromBlock': 5, 'toBlock': 9}]) == result
+
+
+def test_reorg_aware_cache_middleware_ignores_uncles_by_hash(w3, chain):
+    uncle = dict(chain._mk_block(8, salt='uncle'), timestamp=8)
+    chain.uncles.append(uncle)
+    result = w3.manager.request_blocking('eth_getBalance', ['0x0', 8])
+
+    uncle_block = w3.manager.request_blocking('eth_getBlockByHash', [uncle['hash']])
+    assert uncle_block['hash'] == uncle['hash']
+
+    assert w3.manager.request_blocking('eth_getBalance', ['0x0', 8]) == result
+    block = w3.manager.request_blocking('eth_getBlockByNumber', [8, False])
+    assert block['hash'] == chain.blocks[8]['hash']
+
+
+def test_reorg_aware_cache_middleware_keeps_cache_when_chain_extends(w3, chain):
+    result = w3.manager.request_blocking('eth_getBalance', ['0x0', 9])
+
+    chain.extend(3)
+
+    assert w3.manager.request_blocking('eth_getBalance', ['0x0', 9]) == result
+
+
+def test_reorg_aware_cache_middleware_does_not_cache_error_response(
+        w3_base,
+        chain_middleware,
+        reorg_aware_cache_middleware):
+    counter = itertools.count()
+
+    def error_cb(method, params):
+        next(counter)
+        return "the error message"
+
+    w3_base.middleware_stack.add(chain_middleware)
+    w3_base.middleware_stack.add(construct_error_generator_middleware({
+        'eth_getBalance': error_cb,
+    }))
+    w3_base.middleware_stack.add(reorg_aware_cache_middleware)
+
+    with pytest.raises(ValueError):
+        w3_base.manager.request_blocking('eth_getBalance', ['0x0', 8])
+    with pytest.raises(ValueError):
+        w3_base.manager.request_blocking('eth_getBalance', ['0x0', 8])
+
+    assert next(counter) == 2
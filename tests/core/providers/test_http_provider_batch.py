@@ -0,0 +1,45 @@
+import json
+from unittest.mock import (
+    patch,
+)
+
+from web3.providers import (
+    HTTPProvider,
+)
+
+
+def respond_in_reverse(endpoint_uri, data, *args, **kwargs):
+    rpc_requests = json.loads(data.decode())
+    return json.dumps([
+        {'jsonrpc': '2.0', 'id': rpc_request['id'], 'result': rpc_request['method']}
+        for rpc_request
+        in reversed(rpc_requests)
+    ]).encode()
+
+
+def test_make_batch_request():
+    provider = HTTPProvider()
+    with patch('web3.providers.rpc.make_post_request', side_effect=respond_in_reverse) as post:
+        responses = provider.make_batch_request([
+            ('eth_call', [{'to': '0x' + '00' * 20}, 'latest']),
+            ('eth_blockNumber', []),
+        ])
+
+    assert post.call_count == 1
+    rpc_requests = json.loads(post.call_args[0][1].decode())
+    assert [rpc_request['method'] for rpc_request in rpc_requests] == [
+        'eth_call',
+        'eth_blockNumber',
+    ]
+    assert [response['result'] for response in responses] == ['eth_call', 'eth_blockNumber']
+
+
+def test_make_batch_request_unsupported():
+    provider = HTTPProvider()
+    error_response = {'jsonrpc': '2.0', 'id': None, 'error': {'message': 'batch unsupported'}}
+    with patch(
+            'web3.providers.rpc.make_post_request',
+            return_value=json.dumps(error_response).encode()):
+        responses = provider.make_batch_request([('eth_blockNumber', []), ('eth_gasPrice', [])])
+
+    assert responses == [error_response, error_response]
@@ -1,13 +1,46 @@
 
+import gc
 import pytest
+import weakref
 
+from eth_abi import (
+    encode_abi,
+    encode_single,
+)
+from eth_utils import (
+    event_abi_to_log_topic,
+)
+
+import web3._utils.abi
 from web3._utils.abi import (
+    ABITypedData,
     abi_data_tree,
+    data_tree_map,
+    get_abi_data_normalizer,
+    is_array_type,
+    length_of_array_type,
     map_abi_data,
+    parse_abi_type,
+    process_type,
+    strip_abi_type,
+    sub_type_of_array_type,
+)
+from web3._utils.contracts import (
+    CompiledFunctionABI,
+)
+from web3._utils.events import (
+    EventDecoder,
+)
+from web3._utils.formatters import (
+    recursive_map,
 )
 from web3._utils.normalizers import (
     BASE_RETURN_NORMALIZERS,
 )
+from web3._utils.toolz import (
+    partial,
+    pipe,
+)
 
 
 @pytest.mark.parametrize(
@@ -57,3 +90,187 @@ def test_abi_data_tree(types, data, expected):
 )
 def test_map_abi_data(types, data, funcs, expected):
     assert map_abi_data(funcs, types, data) == expected
+
+
+def map_abi_data_tree(normalizers, types, data):
+    return pipe(
+        data,
+        abi_data_tree(types),
+        *map(data_tree_map, normalizers),
+        partial(recursive_map, strip_abi_type)
+    )
+
+
+def to_upper_text(abi_type, data):
+    if abi_type == 'string':
+        return abi_type, data.upper()
+    return abi_type, data
+
+
+def to_typed_pair(abi_type, data):
+    if abi_type == 'uint256':
+        return abi_type, [ABITypedData(['uint256', data]), data]
+    return abi_type, data
+
+
+def to_text_type(abi_type, data):
+    if abi_type == 'bytes32':
+        return 'string', data.decode()
+    return abi_type, data
+
+
+@pytest.mark.parametrize(
+    'types, data, funcs',
+    (
+        (["string", "uint"], ['abc', 1], [to_upper_text]),
+        (["string[]", "string"], [['abc', 'de'], 'f'], [to_upper_text]),
+        ([None, "string"], [['abc'], 'de'], [to_upper_text]),
+        (["uint256", "string"], [2, 'abc'], [to_typed_pair, to_upper_text]),
+        (["bytes32"], [b'abc'], [to_text_type, to_upper_text]),
+        (["bytes32"], [(b'a', b'b')], [to_upper_text]),
+        (["address", "bool"], ['0x5b2063246f2191f18f2675cedb8b28102e957458', True],
+         BASE_RETURN_NORMALIZERS),
+        (["string", "string"], ['abc'], [to_upper_text]),
+    ),
+)
+def test_map_abi_data_matches_data_tree(types, data, funcs):
+    expected = map_abi_data_tree(funcs, types, data)
+
+    assert map_abi_data(funcs, types, data) == expected
+    # once more from the cache
+    assert map_abi_data(funcs, types, data) == expected
+
+
+def test_abi_data_normalizer_does_not_keep_normalizers_alive():
+    def normalizer(abi_type, data):
+        return abi_type, data
+    normalizer_ref = weakref.ref(normalizer)
+
+    assert map_abi_data([normalizer], ['string'], ['a']) == ['a']
+    del normalizer
+    gc.collect()
+
+    assert normalizer_ref() is None
+
+
+ADDRESS = '0x' + '1a' * 20
+CHECKSUM_ADDRESS = '0x1a1A1A1A1a1A1A1a1A1a1a1a1a1a1a1A1A1a1a1a'
+
+
+@pytest.fixture
+def sub_normalizer_compilations(monkeypatch):
+    compilations = []
+    compile_abi_sub_normalizer = web3._utils.abi.compile_abi_sub_normalizer
+
+    def _compile_abi_sub_normalizer(normalizers, data_type):
+        compilations.append(data_type)
+        return compile_abi_sub_normalizer(normalizers, data_type)
+
+    monkeypatch.setattr(
+        web3._utils.abi,
+        'compile_abi_sub_normalizer',
+        _compile_abi_sub_normalizer,
+    )
+    return compilations
+
+
+def test_compiled_function_abi_reuses_output_normalizer(sub_normalizer_compilations):
+    compiled_fn_abi = CompiledFunctionABI({
+        'name': 'f',
+        'type': 'function',
+        'inputs': [],
+        'outputs': [{'name': '', 'type': 'address'}, {'name': '', 'type': 'address[]'}],
+    })
+    output_data = compiled_fn_abi.decode_output(
+        encode_abi(['address', 'address[]'], [ADDRESS, [ADDRESS]]),
+    )
+
+    for _ in range(3):
+        assert compiled_fn_abi.normalize_output(output_data) == [
+            CHECKSUM_ADDRESS,
+            [CHECKSUM_ADDRESS],
+        ]
+    assert sub_normalizer_compilations == ['address', 'address[]']
+
+
+def test_event_decoder_reuses_normalizers(sub_normalizer_compilations):
+    event_abi = {
+        'anonymous': False,
+        'name': 'Named',
+        'type': 'event',
+        'inputs': [
+            {'indexed': True, 'name': 'owner', 'type': 'address'},
+            {'indexed': False, 'name': 'holders', 'type': 'address[]'},
+        ],
+    }
+    log_entry = {
+        'address': ADDRESS,
+        'topics': [event_abi_to_log_topic(event_abi), encode_single('address', ADDRESS)],
+        'data': encode_abi(['address[]'], [[ADDRESS]]),
+        'logIndex': 0,
+        'transactionIndex': 0,
+        'transactionHash': b'\x01' * 32,
+        'blockHash': b'\x02' * 32,
+        'blockNumber': 1,
+    }
+    decoder = EventDecoder(event_abi)
+    compilations = list(sub_normalizer_compilations)
+
+    for _ in range(3):
+        assert decoder.decode(log_entry).args == {
+            'owner': CHECKSUM_ADDRESS,
+            'holders': [CHECKSUM_ADDRESS],
+        }
+    assert sub_normalizer_compilations == compilations
+
+
+def test_map_abi_data_rejects_tuple_types_when_called():
+    normalize = get_abi_data_normalizer((to_upper_text,), ['(uint256,bool)'])
+
+    with pytest.raises(ValueError, match="Cannot process type"):
+        normalize([(1, True)])
+
+
+@pytest.mark.parametrize(
+    'type_str, expected',
+    (
+        ('uint', ('uint', '256', (), None)),
+        ('bytes32', ('bytes', '32', (), None)),
+        ('address[]', ('address', '', ((),), 'address')),
+        ('uint[2][]', ('uint', '256', ((2,), ()), 'uint256[2]')),
+    ),
+)
+def test_parse_abi_type(type_str, expected):
+    assert parse_abi_type(type_str) == expected
+    assert parse_abi_type(type_str) is parse_abi_type(type_str)
+
+
+def test_process_type_returns_new_arrlists():
+    base, sub, arrlist = process_type('uint8[2][]')
+    assert (base, sub, arrlist) == ('uint', '8', [[2], []])
+
+    arrlist[0].append(3)
+    assert process_type('uint8[2][]') == ('uint', '8', [[2], []])
+
+
+@pytest.mark.parametrize(
+    'abi_type, sub_type, length',
+    (
+        ('uint[]', 'uint', None),
+        ('bytes32[3]', 'bytes32', 3),
+        ('int8[2][]', 'int8[2]', None),
+        ('Lib.Enum[2]', None, None),
+        ('Enum[2]', 'Enum', 2),
+        ('string', None, None),
+    ),
+)
+def test_array_type_helpers(abi_type, sub_type, length):
+    assert is_array_type(abi_type) is (sub_type is not None)
+    if sub_type is None:
+        with pytest.raises(ValueError):
+            sub_type_of_array_type(abi_type)
+        with pytest.raises(ValueError):
+            length_of_array_type(abi_type)
+    else:
+        assert sub_type_of_array_type(abi_type) == sub_type
+        assert length_of_array_type(abi_type) == length
@@ -0,0 +1,48 @@
+import pytest
+
+from eth_utils import (
+    encode_hex,
+)
+
+from web3._utils.assembly import (
+    assemble,
+    get_deploy_code,
+)
+from web3.multicall import (
+    MULTICALL_BYTECODE,
+    MULTICALL_RUNTIME,
+)
+
+
+def test_assemble():
+    code = assemble([
+        ('PUSH1', 0), 'CALLDATALOAD', ('PUSH2', 'end'), 'JUMPI',
+        ('PUSH1', 0), 'DUP1', 'REVERT',
+        ('JUMPDEST', 'end'),
+        'STOP',
+    ])
+
+    assert encode_hex(code) == '0x60003561000b57600080fd5b00'
+
+
+@pytest.mark.parametrize(
+    'instructions',
+    (
+        [('PUSH1', 256)],
+        [('JUMPDEST', 'a'), ('JUMPDEST', 'a')],
+    ),
+)
+def test_assemble_errors(instructions):
+    with pytest.raises(ValueError):
+        assemble(instructions)
+
+
+def test_get_deploy_code():
+    runtime_code = assemble(['STOP'])
+    deploy_code = get_deploy_code(runtime_code)
+
+    assert encode_hex(deploy_code) == '0x6100018061000d6000396000f300'
+
+
+def test_multicall_bytecode_deploys_runtime():
+    assert MULTICALL_BYTECODE.endswith(MULTICALL_RUNTIME[2:])
@@ -0,0 +1,80 @@
+import pytest
+
+from eth_utils import (
+    to_bytes,
+)
+
+from web3._utils.bloom import (
+    BloomQuery,
+    get_bloom_bits,
+)
+
+ADDRESS = '0x' + '11' * 20
+OTHER_ADDRESS = '0x' + '22' * 20
+TOPIC_A = b'\xaa' * 32
+TOPIC_B = b'\xbb' * 32
+TOPIC_C = b'\xcc' * 32
+
+
+def make_bloom(*values):
+    bloom = 0
+    for value in values:
+        bloom |= get_bloom_bits(to_bytes(hexstr=value) if isinstance(value, str) else value)
+    return bloom
+
+
+def test_get_bloom_bits():
+    mask = get_bloom_bits(b'\x00' * 20)
+
+    # three bits of the 2048, which may coincide
+    assert 1 <= bin(mask).count('1') <= 3
+    assert mask < 2 ** 2048
+
+
+@pytest.mark.parametrize(
+    'address,topics,expected',
+    (
+        (None, None, True),
+        (ADDRESS, None, True),
+        (OTHER_ADDRESS, None, False),
+        ([OTHER_ADDRESS, ADDRESS], None, True),
+        (ADDRESS, [TOPIC_A], True),
+        (ADDRESS, [TOPIC_C], False),
+        (ADDRESS, [None, TOPIC_B], True),
+        (ADDRESS, [[TOPIC_C, TOPIC_B]], True),
+        (ADDRESS, [[TOPIC_C], TOPIC_A], False),
+        (ADDRESS, [[], TOPIC_A], True),
+        (None, ['0x' + 'aa' * 32], True),
+    )
+)
+def test_bloom_query_matches(address, topics, expected):
+    bloom = make_bloom(ADDRESS, TOPIC_A, TOPIC_B)
+    query = BloomQuery(address, topics)
+
+    assert query.matches(bloom) is expected
+    assert query.matches(bloom.to_bytes(256, 'big')) is expected
+    assert query.matches('0x' + bloom.to_bytes(256, 'big').hex()) is expected
+
+
+def test_bloom_query_matches_any():
+    query = BloomQuery(ADDRESS, [TOPIC_A])
+
+    assert query.matches_any([make_bloom(OTHER_ADDRESS), make_bloom(ADDRESS, TOPIC_A)])
+    assert not query.matches_any([make_bloom(OTHER_ADDRESS), make_bloom(TOPIC_B)])
+    assert not query.matches_any([])
+
+
+def test_bloom_query_narrow_block_range():
+    query = BloomQuery(ADDRESS, [TOPIC_A])
+    match = make_bloom(ADDRESS, TOPIC_A)
+    no_match = make_bloom(OTHER_ADDRESS, TOPIC_B)
+    blooms = {10: no_match, 11: match, 12: no_match, 13: match, 14: no_match}
+
+    assert query.narrow_block_range(10, 14, blooms) == (11, 13)
+    assert query.narrow_block_range(12, 12, blooms) is None
+    assert query.narrow_block_range(14, 14, blooms) is None
+    # the blooms of some of the blocks are unknown
+    assert query.narrow_block_range(12, 15, blooms) == (12, 15)
+    assert query.narrow_block_range(0, 100, blooms) == (0, 100)
+    # a query without an address or topics matches everything
+    assert BloomQuery().narrow_block_range(12, 12, blooms) == (12, 12)
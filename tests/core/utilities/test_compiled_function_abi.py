@@ -0,0 +1,54 @@
+import json
+import pytest
+
+from eth_abi import (
+    decode_abi,
+    encode_abi,
+)
+from eth_utils import (
+    encode_hex,
+    function_signature_to_4byte_selector,
+)
+
+from web3._utils.contracts import (
+    compile_function_abi,
+)
+
+FN_ABI = json.loads('{"constant":true,"inputs":[{"name":"a","type":"uint256"},{"name":"b","type":"string"}],"name":"f","outputs":[{"name":"","type":"bytes32[]"},{"name":"","type":"address"}],"type":"function"}')  # noqa: E501
+
+
+def test_compiled_function_abi_is_cached_by_identity():
+    fn_abi = json.loads(json.dumps(FN_ABI))
+    other_fn_abi = json.loads(json.dumps(FN_ABI))
+
+    assert compile_function_abi(fn_abi) is compile_function_abi(fn_abi)
+    assert compile_function_abi(other_fn_abi) is not compile_function_abi(fn_abi)
+    assert compile_function_abi(other_fn_abi).abi is other_fn_abi
+
+
+def test_compiled_function_abi_metadata():
+    compiled_fn_abi = compile_function_abi(FN_ABI)
+
+    assert compiled_fn_abi.selector == encode_hex(
+        function_signature_to_4byte_selector('f(uint256,string)')
+    )
+    assert compiled_fn_abi.input_types == ['uint256', 'string']
+    assert compiled_fn_abi.output_types == ['bytes32[]', 'address']
+
+
+def test_compiled_function_abi_codec():
+    compiled_fn_abi = compile_function_abi(FN_ABI)
+    output = ([b'\x01' * 32, b'\x02' * 32], '0x' + '03' * 20)
+
+    assert compiled_fn_abi.encode_arguments([12345, 'abc']) == encode_abi(
+        ['uint256', 'string'],
+        [12345, 'abc'],
+    )
+    output_data = encode_abi(['bytes32[]', 'address'], output)
+    assert compiled_fn_abi.decode_output(output_data) == decode_abi(
+        ['bytes32[]', 'address'],
+        output_data,
+    )
+
+    with pytest.raises(TypeError):
+        compiled_fn_abi.decode_output(output_data.hex())
@@ -18,7 +18,9 @@ from hypothesis import (
 
 from web3._utils.encoding import (
     FriendlyJsonSerde as FriendlyJson,
+    get_abi_packer,
     hex_encode_abi_type,
+    hex_pack_abi_values,
     hexstr_if_str,
     text_if_str,
     to_hex,
@@ -99,6 +101,49 @@ def test_hex_encode_abi_type(abi_type, value, expected):
     assert actual == expected
 
 
+ADDRESS = "0x00360d2b7D240Ec0643B6D819ba81A09e40E5bCd"
+
+
+@pytest.mark.parametrize(
+    "abi_types,values",
+    [
+        (('bool', 'uint16', 'int16', 'int16'), (True, 300, 8, -8)),
+        (('int8', 'int256', 'uint256'), (-128, -1, 2**256 - 1)),
+        (('address', 'address[]'), (ADDRESS, [ADDRESS, ADDRESS])),
+        (('bytes2', 'bytes3', 'bytes', 'bytes'), (b"T\x02", b"T\x02", '0x5402', '0x')),
+        (('string', 'string'), ("testing a string!", "")),
+        (('bool[2][]', 'uint8[2]', 'int8[]'), ([[True, False], [False, True]], [8, 9], [-1])),
+        (('string[]', 'bytes1[]'), (['ab', 'c'], [b'\x01', '0x02'])),
+        # values which aren't encoded as whole bytes
+        (('uint8', 'bool'), (300, True)),
+        (('int8', 'bool'), (-250, True)),
+        (('int8', 'bool'), (200, True)),
+        (('bytes', 'bytes1'), ('0x123', b'\x01')),
+        (('uint8[]',), ([1, 256],)),
+        ((), ()),
+    ]
+)
+def test_abi_packer_matches_hex_encode_abi_type(abi_types, values):
+    assert get_abi_packer(abi_types)(values) == hex_pack_abi_values(abi_types, values)
+
+
+@pytest.mark.parametrize(
+    "abi_types,values,expected",
+    [
+        (('bool', 'strings'), (True, "bad abi!"), ValueError),
+        (('bool', 'strings'), ("string", "bad abi!"), TypeError),
+        (('bytes', 'bool['), ('5402', True), TypeError),
+        (('address',), (ADDRESS.lower(),), ValueError),
+        (('string',), (b'text',), TypeError),
+    ]
+)
+def test_abi_packer_errors(abi_types, values, expected):
+    with pytest.raises(expected):
+        hex_pack_abi_values(abi_types, values)
+    with pytest.raises(expected):
+        get_abi_packer(abi_types)(values)
+
+
 @given(st.one_of(st.integers(), st.booleans(), st.binary()))
 @example(b'')
 def test_hexstr_if_str_passthrough(val):
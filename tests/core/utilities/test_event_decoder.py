@@ -0,0 +1,200 @@
+import pytest
+
+from eth_abi import (
+    encode_abi,
+    encode_single,
+)
+from eth_abi.exceptions import (
+    DecodingError,
+)
+from eth_utils import (
+    event_abi_to_log_topic,
+)
+
+from web3._utils.events import (
+    EventDecoder,
+    get_event_data,
+    get_event_decoder,
+)
+from web3.exceptions import (
+    MismatchedABI,
+)
+
+TRANSFER_ABI = {
+    'anonymous': False,
+    'inputs': [
+        {'indexed': True, 'name': 'from', 'type': 'address'},
+        {'indexed': True, 'name': 'to', 'type': 'address'},
+        {'indexed': False, 'name': 'value', 'type': 'uint256'},
+        {'indexed': False, 'name': 'memo', 'type': 'string'},
+    ],
+    'name': 'Transfer',
+    'type': 'event',
+}
+
+ANONYMOUS_ABI = {
+    'anonymous': True,
+    'inputs': [
+        {'indexed': True, 'name': 'key', 'type': 'uint256'},
+        {'indexed': False, 'name': 'value', 'type': 'bytes32'},
+    ],
+    'name': 'Anonymous',
+    'type': 'event',
+}
+
+FROM = '0x' + '11' * 20
+TO = '0x' + '22' * 20
+
+
+def make_log(topics, data):
+    return {
+        'topics': topics,
+        'data': data,
+        'logIndex': 0,
+        'transactionIndex': 0,
+        'transactionHash': b'\x01' * 32,
+        'address': '0x' + '33' * 20,
+        'blockHash': b'\x02' * 32,
+        'blockNumber': 1,
+    }
+
+
+def make_transfer_log(value, memo):
+    return make_log(
+        [
+            event_abi_to_log_topic(TRANSFER_ABI),
+            encode_single('address', FROM),
+            encode_single('address', TO),
+        ],
+        encode_abi(['uint256', 'string'], [value, memo]),
+    )
+
+
+def test_event_decoder_attributes():
+    decoder = EventDecoder(TRANSFER_ABI)
+
+    assert decoder.topic == event_abi_to_log_topic(TRANSFER_ABI)
+    assert decoder.topic_types == ('address', 'address')
+    assert decoder.topic_names == ['from', 'to']
+    assert decoder.data_types == ('uint256', 'string')
+    assert decoder.data_names == ['value', 'memo']
+    assert EventDecoder(ANONYMOUS_ABI).topic is None
+
+
+def test_event_decoder_decode():
+    event = get_event_decoder(TRANSFER_ABI).decode(make_transfer_log(7, 'rent'))
+
+    assert event.event == 'Transfer'
+    assert event.args == {
+        'from': '0x' + '11' * 20,
+        'to': '0x' + '22' * 20,
+        'value': 7,
+        'memo': 'rent',
+    }
+    assert event == get_event_data(TRANSFER_ABI, make_transfer_log(7, 'rent'))
+
+
+def test_event_decoder_decode_anonymous():
+    log = make_log([encode_single('uint256', 5)], encode_single('bytes32', b'\xff' * 32))
+
+    event = get_event_data(ANONYMOUS_ABI, log)
+
+    assert event.args == {'key': 5, 'value': b'\xff' * 32}
+
+
+def test_event_decoder_matches():
+    decoder = get_event_decoder(TRANSFER_ABI)
+    other_log = make_log([b'\x00' * 32], '0x')
+
+    assert decoder.matches(make_transfer_log(1, ''))
+    assert not decoder.matches(other_log)
+    assert not decoder.matches(make_log([], '0x'))
+    assert get_event_decoder(ANONYMOUS_ABI).matches(other_log)
+
+    with pytest.raises(MismatchedABI):
+        decoder.decode(other_log)
+    with pytest.raises(MismatchedABI):
+        decoder.decode(make_log([], '0x'))
+
+
+def test_event_decoder_wrong_topic_count():
+    log = make_transfer_log(1, '')
+    log['topics'] = log['topics'][:2]
+
+    with pytest.raises(ValueError, match="Expected 2 log topics.  Got 1"):
+        get_event_data(TRANSFER_ABI, log)
+
+
+def test_event_decoder_duplicate_names():
+    event_abi = dict(TRANSFER_ABI, inputs=[
+        {'indexed': True, 'name': 'value', 'type': 'address'},
+        {'indexed': False, 'name': 'value', 'type': 'uint256'},
+    ])
+
+    with pytest.raises(ValueError, match="duplicated"):
+        EventDecoder(event_abi)
+
+
+def test_get_event_decoder_is_cached_by_abi_identity():
+    decoder = get_event_decoder(TRANSFER_ABI)
+
+    assert get_event_decoder(TRANSFER_ABI) is decoder
+    assert get_event_decoder(dict(TRANSFER_ABI)) is not decoder
+
+
+STATIC_ABI = {
+    'anonymous': False,
+    'inputs': [
+        {'indexed': True, 'name': 'owner', 'type': 'address'},
+        {'indexed': True, 'name': 'flag', 'type': 'bool'},
+        {'indexed': False, 'name': 'small', 'type': 'int8'},
+        {'indexed': False, 'name': 'big', 'type': 'uint256'},
+        {'indexed': False, 'name': 'tag', 'type': 'bytes4'},
+        {'indexed': False, 'name': 'spender', 'type': 'address'},
+    ],
+    'name': 'Static',
+    'type': 'event',
+}
+
+
+def make_static_log(owner, flag, data_values):
+    return make_log(
+        [
+            event_abi_to_log_topic(STATIC_ABI),
+            encode_single('address', owner),
+            encode_single('bool', flag),
+        ],
+        encode_abi(['int8', 'uint256', 'bytes4', 'address'], data_values),
+    )
+
+
+@pytest.mark.parametrize(
+    'owner,flag,data_values',
+    (
+        (FROM, True, [-128, 2 ** 256 - 1, b'\x01\x02\x03\x04', TO]),
+        (TO, False, [127, 0, b'\x00' * 4, FROM]),
+        (FROM, False, [-1, 1, b'\xff' * 4, '0x' + '00' * 20]),
+    ),
+)
+def test_event_decoder_static_words_match_eth_abi(owner, flag, data_values):
+    decoder = EventDecoder(STATIC_ABI)
+    assert decoder._topic_converters is not None
+    assert decoder._data_converters is not None
+    log = make_static_log(owner, flag, data_values)
+
+    event = decoder.decode(log)
+
+    # decode without the word converters
+    decoder._topic_converters = decoder._data_converters = None
+    assert event == decoder.decode(log)
+    assert event.args.flag is flag
+    assert event.args.small == data_values[0]
+
+
+def test_event_decoder_static_words_invalid_padding():
+    log = make_static_log(FROM, True, [1, 2, b'\x01' * 4, TO])
+    log['data'] = b'\x01' + log['data'][1:]
+
+    # the invalid int8 is left to eth-abi to reject
+    with pytest.raises(DecodingError):
+        get_event_data(STATIC_ABI, log)
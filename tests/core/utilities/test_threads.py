@@ -1,9 +1,12 @@
+import itertools
 import pytest
+import threading
 import time
 
 from web3._utils.threads import (
     ThreadWithReturn,
     Timeout,
+    concurrent_map,
     spawn,
 )
 
@@ -105,3 +108,57 @@ def test_with_custom_exception_instance():
         timeout.check()
 
     assert err.value is exc
+
+
+def test_concurrent_map_preserves_order():
+    def slow_square(value):
+        time.sleep(0.01 * (value % 3))
+        return value * value
+
+    assert list(concurrent_map(slow_square, range(10), 4)) == [
+        value * value
+        for value
+        in range(10)
+    ]
+
+
+def test_concurrent_map_runs_concurrently():
+    barrier = threading.Barrier(3, timeout=5)
+
+    def wait_for_others(value):
+        barrier.wait()
+        return value
+
+    assert list(concurrent_map(wait_for_others, range(3), 3)) == [0, 1, 2]
+
+
+def test_concurrent_map_only_consumes_items_as_results_are_consumed():
+    consumed = itertools.count()
+
+    def items():
+        for value in range(100):
+            next(consumed)
+            yield value
+
+    results = concurrent_map(lambda value: value, items(), 2)
+    assert next(results) == 0
+    assert next(results) == 1
+    assert next(consumed) <= 4
+
+
+def test_concurrent_map_raises_errors():
+    def fail_on_two(value):
+        if value == 2:
+            raise ValueError("two")
+        return value
+
+    results = concurrent_map(fail_on_two, range(5), 2)
+    assert next(results) == 0
+    assert next(results) == 1
+    with pytest.raises(ValueError):
+        next(results)
+
+
+def test_concurrent_map_requires_positive_concurrency():
+    with pytest.raises(ValueError):
+        list(concurrent_map(lambda value: value, range(5), 0))
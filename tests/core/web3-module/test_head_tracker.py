@@ -0,0 +1,128 @@
+import gc
+import itertools
+import pytest
+import time
+import weakref
+
+from web3 import Web3
+from web3.head import (
+    get_head_tracker,
+)
+from web3.middleware import (
+    construct_result_generator_middleware,
+)
+from web3.providers.base import (
+    BaseProvider,
+)
+
+
+@pytest.fixture
+def chain():
+    return {'head_block_number': 10, 'requests': itertools.count()}
+
+
+@pytest.fixture
+def w3(chain):
+    def _get_block_by_number(method, params):
+        next(chain['requests'])
+        block_id = params[0]
+        if block_id == 'latest':
+            block_id = chain['head_block_number']
+        block_hash = chain.get('forks', {}).get(block_id, block_id)
+        return {
+            'hash': block_hash,
+            'parentHash': chain.get('forks', {}).get(block_id - 1, block_id - 1),
+            'number': block_id,
+            'timestamp': block_id * 2,
+            'logsBloom': block_hash * 2,
+        }
+
+    return Web3(
+        providers=[BaseProvider()],
+        middlewares=[construct_result_generator_middleware({
+            'eth_getBlockByNumber': _get_block_by_number,
+            'eth_blockNumber': lambda *_: chain['head_block_number'],
+            'eth_syncing': lambda *_: False,
+        })],
+    )
+
+
+def test_head_tracker_is_shared_per_web3_instance(w3):
+    assert w3.head is get_head_tracker(w3)
+    assert w3.head is w3.head
+    assert Web3(providers=[BaseProvider()]).head is not w3.head
+
+
+def test_head_tracker_does_not_keep_web3_alive():
+    w3 = Web3(providers=[BaseProvider()], middlewares=[])
+    head_tracker = w3.head
+    w3_ref = weakref.ref(w3)
+
+    del w3
+    gc.collect()
+
+    assert w3_ref() is None
+    assert head_tracker.web3 is None
+
+
+def test_head_tracker_get_latest_block(w3, chain):
+    assert w3.head.latest_block is None
+
+    assert w3.head.get_latest_block()['number'] == 10
+    chain['head_block_number'] = 11
+    assert w3.head.get_latest_block(max_age=60)['number'] == 10
+    assert w3.head.get_latest_block()['number'] == 11
+    assert w3.head.latest_block['number'] == 11
+
+
+def test_head_tracker_shares_average_block_time(w3, chain):
+    assert w3.head.get_average_block_time(5) == 2
+    num_requests = next(chain['requests'])
+
+    assert w3.head.get_average_block_time(5) == 2
+    assert next(chain['requests']) == num_requests + 1
+
+
+def test_head_tracker_average_block_time_without_history(w3, chain):
+    chain['head_block_number'] = 0
+    assert w3.head.get_average_block_time(5) is None
+
+
+def test_head_tracker_background_polling(w3, chain):
+    w3.head.start(poll_interval=0.01)
+    try:
+        assert w3.head.is_running
+        with pytest.raises(ValueError):
+            w3.head.start()
+
+        chain['head_block_number'] = 12
+        time.sleep(0.1)
+        assert w3.head.get_latest_block()['number'] == 12
+        assert w3.head.get_block_number() == 12
+        assert w3.head.get_syncing() is False
+    finally:
+        w3.head.stop()
+
+    assert not w3.head.is_running
+
+
+def test_head_tracker_tracks_logs_blooms(w3, chain):
+    assert w3.head.get_logs_blooms() == {}
+
+    w3.head.update()
+    chain['head_block_number'] = 11
+    w3.head.update()
+    w3.head.update()
+    assert w3.head.get_logs_blooms() == {10: 20, 11: 22}
+
+    # a block which isn't the child of the last tracked block starts over
+    chain['head_block_number'] = 13
+    w3.head.update()
+    assert w3.head.get_logs_blooms() == {13: 26}
+
+    # as does a reorg
+    chain['head_block_number'] = 14
+    w3.head.update()
+    chain['forks'] = {13: 113, 14: 114}
+    w3.head.update()
+    assert w3.head.get_logs_blooms() == {14: 228}
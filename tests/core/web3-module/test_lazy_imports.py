@@ -0,0 +1,117 @@
+import json
+import subprocess
+import sys
+
+import web3 as web3_package
+from web3 import (
+    Account,
+    HTTPProvider,
+    Web3,
+)
+from web3.middleware import (
+    construct_sign_and_send_raw_middleware,
+)
+from web3.middleware.signing import (
+    construct_sign_and_send_raw_middleware as signing_middleware,
+)
+from web3.providers.rpc import (
+    HTTPProvider as RPCHTTPProvider,
+)
+
+LAZY_MODULES = (
+    'eth_account',
+    'eth_tester',
+    'requests',
+    'websockets',
+    'ens.abis',
+    'web3.middleware.signing',
+    'web3.providers.eth_tester',
+    'web3.providers.ipc',
+    'web3.providers.rpc',
+    'web3.providers.tester',
+    'web3.providers.websocket',
+)
+
+# The required dependencies which web3 can't defer importing, only one of
+# cytoolz and toolz is installed.
+EAGER_DEPENDENCIES = (
+    'cytoolz',
+    'eth_abi',
+    'eth_utils',
+    'hexbytes',
+    'lru',
+    'toolz',
+)
+
+# The lazily loaded modules which only need the required dependencies.
+DEFERRED_IMPORTS = (
+    'ens.abis',
+    'web3.middleware.signing',
+    'web3.providers.ipc',
+    'web3.providers.rpc',
+    'web3.providers.websocket',
+)
+
+IMPORT_WEB3 = '''
+import importlib
+import json
+import sys
+import time
+
+for name in %r:
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        pass
+
+start = time.perf_counter()
+import web3
+import_time = time.perf_counter() - start
+imported = [name for name in %r if name in sys.modules]
+
+start = time.perf_counter()
+for name in %r:
+    importlib.import_module(name)
+deferred_import_time = time.perf_counter() - start
+
+print(json.dumps({
+    "imported": imported,
+    "import_time": import_time,
+    "deferred_import_time": deferred_import_time,
+}))
+''' % (EAGER_DEPENDENCIES, LAZY_MODULES, DEFERRED_IMPORTS)
+
+
+def import_web3():
+    output = subprocess.check_output([sys.executable, '-c', IMPORT_WEB3])
+    return json.loads(output.decode())
+
+
+def test_import_web3_skips_unused_dependencies():
+    assert import_web3()['imported'] == []
+
+
+def test_import_web3_is_faster_than_deferred_imports():
+    # The import time is compared with the time of the imports which are
+    # deferred, measured in the same process, so that it doesn't depend on
+    # how fast the machine is.  The fastest of a few runs is compared to
+    # leave out one off stalls.
+    results = [import_web3() for _ in range(3)]
+    import_time = min(result['import_time'] for result in results)
+    deferred_import_time = min(result['deferred_import_time'] for result in results)
+
+    assert import_time < deferred_import_time
+
+
+def test_lazy_attributes_are_loaded_on_access():
+    assert HTTPProvider is RPCHTTPProvider
+    assert Web3.HTTPProvider is RPCHTTPProvider
+    assert Web3.EthereumTesterProvider is web3_package.EthereumTesterProvider
+    assert construct_sign_and_send_raw_middleware is signing_middleware
+    assert isinstance(web3_package.__version__, str)
+    assert 'IPCProvider' in dir(web3_package)
+
+
+def test_eth_account_is_loaded_on_access(web3):
+    assert isinstance(web3.eth.account, Account)
+    assert web3.eth.account is web3.eth.account
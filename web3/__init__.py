@@ -1,4 +1,3 @@
-import pkg_resources
 import sys
 import warnings
 
@@ -13,25 +12,32 @@ if sys.version_info < (3, 5):
         "Python 3.5 or above is required. "
         "Note that support for Python 3.5 will be remove in web3.py v5")
 
-from eth_account import Account  # noqa: E402
-from web3.main import Web3  # noqa: E402
-from web3.providers.rpc import (  # noqa: E402
-    HTTPProvider,
-)
-from web3.providers.eth_tester import (  # noqa: E402
-    EthereumTesterProvider,
-)
-from web3.providers.tester import (  # noqa: E402
-    TestRPCProvider,
-)
-from web3.providers.ipc import (  # noqa: E402
-    IPCProvider,
-)
-from web3.providers.websocket import (  # noqa: E402
-    WebsocketProvider,
+from web3._utils.module_loading import (  # noqa: E402
+    lazy_attribute,
+    set_lazy_attributes,
 )
+from web3.main import Web3  # noqa: E402
+
+
+def _get_version():
+    import pkg_resources
+    return pkg_resources.get_distribution("web3").version
+
 
-__version__ = pkg_resources.get_distribution("web3").version
+# The providers, eth-account and the version are loaded on first access, so
+# that ``import web3`` doesn't import their dependencies.
+set_lazy_attributes(__name__, {
+    "__version__": _get_version,
+    "HTTPProvider": lazy_attribute("web3.providers.rpc", "HTTPProvider"),
+    "IPCProvider": lazy_attribute("web3.providers.ipc", "IPCProvider"),
+    "WebsocketProvider": lazy_attribute("web3.providers.websocket", "WebsocketProvider"),
+    "TestRPCProvider": lazy_attribute("web3.providers.tester", "TestRPCProvider"),
+    "EthereumTesterProvider": lazy_attribute(
+        "web3.providers.eth_tester",
+        "EthereumTesterProvider",
+    ),
+    "Account": lazy_attribute("eth_account", "Account"),
+})
 
 __all__ = [
     "__version__",
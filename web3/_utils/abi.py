@@ -1,6 +1,8 @@
 from collections import (
+    Iterable,
     namedtuple,
 )
+import functools
 import itertools
 import re
 
@@ -10,6 +12,7 @@ from eth_abi import (
 from eth_utils import (
     is_hex,
     is_list_like,
+    is_string,
     to_bytes,
     to_text,
     to_tuple,
@@ -109,7 +112,7 @@ def filter_by_argument_name(argument_names, contract_abi):
 
 try:
     from eth_abi.abi import (
-        process_type,
+        process_type as parse_type_parts,
         collapse_type,
     )
 except ImportError:
@@ -119,7 +122,7 @@ except ImportError:
         TupleType,
     )
 
-    def process_type(type_str):
+    def parse_type_parts(type_str):
         normalized_type_str = normalize_type_string(type_str)
         abi_type = parse_type_string(normalized_type_str)
 
@@ -159,19 +162,56 @@ except ImportError:
         return base + str(sub) + ''.join(map(repr, arrlist))
 
 
+class ABIType(namedtuple('ABIType', 'base, sub, arrlist, item_type')):
+    '''
+    The parts of a parsed ABI type string, as returned by
+    :func:`process_type`, with the ``arrlist`` as a tuple of tuples.  The
+    ``item_type`` is the collapsed type string of the items of an array
+    type, or ``None``.
+    '''
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_abi_type(type_str):
+    """
+    Returns the :class:`ABIType` of ``type_str``.  Type strings are parsed
+    once, while types which can't be parsed raise on every call.
+    """
+    base, sub, arrlist = parse_type_parts(type_str)
+    if arrlist:
+        item_type = collapse_type(base, sub, arrlist[:-1])
+    else:
+        item_type = None
+    return ABIType(base, sub, tuple(map(tuple, arrlist)), item_type)
+
+
+def process_type(type_str):
+    abi_type = parse_abi_type(type_str)
+    return abi_type.base, abi_type.sub, list(map(list, abi_type.arrlist))
+
+
 def is_encodable(_type, value):
     if not isinstance(_type, str):
         raise ValueError("is_encodable only accepts type strings")
 
-    base, sub, arrlist = process_type(_type)
+    return is_encodable_abi_type(parse_abi_type(_type), _type, value)
+
+
+def is_encodable_abi_type(abi_type, _type, value):
+    base, arrlist = abi_type.base, abi_type.arrlist
 
     if arrlist:
         if not is_list_like(value):
             return False
         if arrlist[-1] and len(value) != arrlist[-1][0]:
             return False
-        sub_type = (base, sub, arrlist[:-1])
-        return all(is_encodable(collapse_type(*sub_type), sub_value) for sub_value in value)
+        item_type = abi_type.item_type
+        item_abi_type = parse_abi_type(item_type)
+        return all(
+            is_encodable_abi_type(item_abi_type, item_type, item_value)
+            for item_value
+            in value
+        )
     elif base == 'address' and is_ens_name(value):
         # ENS names can be used anywhere an address is needed
         # Web3.py will resolve the name to an address before encoding it
@@ -361,6 +401,7 @@ def is_length(target_length, value):
     return len(value) == target_length
 
 
+@functools.lru_cache(maxsize=4096)
 def size_of_type(abi_type):
     """
     Returns size in bits of abi_type
@@ -382,25 +423,23 @@ END_BRACKETS_OF_ARRAY_TYPE_REGEX = r"\[[^]]*\]$"
 
 
 def sub_type_of_array_type(abi_type):
-    if not is_array_type(abi_type):
+    array_type = parse_array_type(abi_type)
+    if array_type is None:
         raise ValueError(
             "Cannot parse subtype of nonarray abi-type: {0}".format(abi_type)
         )
 
-    return re.sub(END_BRACKETS_OF_ARRAY_TYPE_REGEX, '', abi_type, 1)
+    return array_type.sub_type
 
 
 def length_of_array_type(abi_type):
-    if not is_array_type(abi_type):
+    array_type = parse_array_type(abi_type)
+    if array_type is None:
         raise ValueError(
             "Cannot parse length of nonarray abi-type: {0}".format(abi_type)
         )
 
-    inner_brackets = re.search(END_BRACKETS_OF_ARRAY_TYPE_REGEX, abi_type).group(0).strip("[]")
-    if not inner_brackets:
-        return None
-    else:
-        return int(inner_brackets)
+    return array_type.length
 
 
 ARRAY_REGEX = (
@@ -411,8 +450,47 @@ ARRAY_REGEX = (
 ).format(sub_type=SUB_TYPE_REGEX)
 
 
+ArrayType = namedtuple('ArrayType', 'sub_type, length')
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_array_type(abi_type):
+    """
+    Returns the :class:`ArrayType` of the outer dimension of ``abi_type``, or
+    ``None`` if it isn't an array type.  Unlike :func:`parse_abi_type`, this
+    accepts the arrays of any type name, like those of enums.
+    """
+    if not re.match(ARRAY_REGEX, abi_type):
+        return None
+
+    end_brackets = re.search(END_BRACKETS_OF_ARRAY_TYPE_REGEX, abi_type)
+    inner_brackets = end_brackets.group(0).strip("[]")
+    if not inner_brackets:
+        length = None
+    else:
+        length = int(inner_brackets)
+    return ArrayType(abi_type[:end_brackets.start()], length)
+
+
 def is_array_type(abi_type):
-    return bool(re.match(ARRAY_REGEX, abi_type))
+    return parse_array_type(abi_type) is not None
+
+
+def is_word_type(abi_type):
+    """
+    Whether values of ``abi_type`` are encoded as a single 32 byte word.
+    """
+    if abi_type.startswith('('):
+        return False
+    base, sub, arrlist = process_type(abi_type)
+    if arrlist:
+        return False
+    elif base in {'uint', 'int', 'address', 'bool'}:
+        return True
+    elif base == 'bytes':
+        return bool(sub)
+    else:
+        return False
 
 
 NAME_REGEX = (
@@ -486,13 +564,104 @@ def map_abi_data(normalizers, types, data):
     2. Recursively mapping each of the normalizers to the data
     3. Stripping the types back out of the tree
     '''
-    pipeline = itertools.chain(
-        [abi_data_tree(types)],
-        map(data_tree_map, normalizers),
-        [partial(recursive_map, strip_abi_type)],
+    return get_abi_data_normalizer(tuple(normalizers), types)(data)
+
+
+def is_plain_value(value):
+    return is_string(value) or not isinstance(value, Iterable)
+
+
+def _get_plain_abi_type(data_type):
+    if data_type is None:
+        return None
+
+    try:
+        try:
+            base, sub, arrlist = data_type
+        except ValueError:
+            base, sub, arrlist = process_type(data_type)
+    except Exception:
+        # let the error surface when the data is normalized
+        return None
+
+    if arrlist:
+        return None
+    return collapse_type(base, sub, arrlist)
+
+
+_cached_get_plain_abi_type = functools.lru_cache(1024)(_get_plain_abi_type)
+
+
+def get_plain_abi_type(data_type):
+    """
+    Returns the type string of ``data_type`` if its values can be normalized
+    directly, or ``None`` if they need the typed tree.
+    """
+    try:
+        return _cached_get_plain_abi_type(data_type)
+    except TypeError:
+        # a processed type with an unhashable array list
+        return _get_plain_abi_type(data_type)
+
+
+def compile_abi_sub_normalizer(normalizers, data_type):
+    """
+    Returns a function which applies ``normalizers`` to a value of
+    ``data_type``, with the same result as building, mapping and stripping
+    its typed sub tree.  Values of a type without an array dimension are
+    normalized directly, without wrapping them in :class:`ABITypedData`.
+    """
+    pipeline = None
+
+    def normalize_tree(value):
+        nonlocal pipeline
+        # built when first needed, as most values are normalized directly
+        if pipeline is None:
+            pipeline = tuple(
+                data_tree_map(normalizer) for normalizer in normalizers
+            ) + (partial(recursive_map, strip_abi_type),)
+        return pipe(abi_sub_tree(data_type, value), *pipeline)
+
+    collapsed = get_plain_abi_type(data_type)
+    if collapsed is None:
+        return normalize_tree
+
+    def normalize_value(value):
+        # collections are mapped into by every normalizer, so they take the
+        # long way round, as do values which normalizers make into them.
+        if not is_plain_value(value):
+            return normalize_tree(value)
+        abi_type, normalized = collapsed, value
+        for normalizer in normalizers:
+            abi_type, normalized = normalizer(abi_type, normalized)
+            if not is_plain_value(normalized):
+                return normalize_tree(value)
+        return normalized
+
+    return normalize_value
+
+
+def get_abi_data_normalizer(normalizers, types):
+    """
+    Returns a function which applies ``normalizers`` to data of ``types``,
+    like :func:`map_abi_data`, with the work which only depends on the types
+    done once.  It isn't cached here, as normalizers may hold on to a
+    ``Web3`` instance, so callers which know that their normalizers don't,
+    such as the decoders of return values, should keep it.
+    """
+    sub_normalizers = tuple(
+        compile_abi_sub_normalizer(normalizers, data_type)
+        for data_type
+        in types
     )
 
-    return pipe(data, *pipeline)
+    def abi_data_normalizer(data):
+        return [
+            normalize(data_value)
+            for normalize, data_value
+            in zip(sub_normalizers, data)
+        ]
+    return abi_data_normalizer
 
 
 @curry
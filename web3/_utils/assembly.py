@@ -0,0 +1,101 @@
+OPCODES = {
+    'STOP': 0x00,
+    'ADD': 0x01,
+    'MUL': 0x02,
+    'SUB': 0x03,
+    'DIV': 0x04,
+    'LT': 0x10,
+    'GT': 0x11,
+    'EQ': 0x14,
+    'ISZERO': 0x15,
+    'AND': 0x16,
+    'OR': 0x17,
+    'NOT': 0x19,
+    'CALLVALUE': 0x34,
+    'CALLDATALOAD': 0x35,
+    'CALLDATASIZE': 0x36,
+    'CALLDATACOPY': 0x37,
+    'CODECOPY': 0x39,
+    'RETURNDATASIZE': 0x3d,
+    'RETURNDATACOPY': 0x3e,
+    'POP': 0x50,
+    'MLOAD': 0x51,
+    'MSTORE': 0x52,
+    'JUMP': 0x56,
+    'JUMPI': 0x57,
+    'GAS': 0x5a,
+    'JUMPDEST': 0x5b,
+    'CALL': 0xf1,
+    'RETURN': 0xf3,
+    'STATICCALL': 0xfa,
+    'REVERT': 0xfd,
+}
+OPCODES.update(('PUSH{0}'.format(size), 0x5f + size) for size in range(1, 33))
+OPCODES.update(('DUP{0}'.format(depth), 0x7f + depth) for depth in range(1, 17))
+OPCODES.update(('SWAP{0}'.format(depth), 0x8f + depth) for depth in range(1, 17))
+
+
+def get_push_size(opcode_name):
+    if opcode_name.startswith('PUSH'):
+        return int(opcode_name[4:])
+    return 0
+
+
+def assemble(instructions):
+    """
+    Assembles EVM bytecode from ``instructions``, which are each one of:
+
+    * an opcode name, such as ``'CALLDATALOAD'``
+    * a ``(push_opcode_name, value)`` tuple, such as ``('PUSH2', 0x100)``,
+      where the value may also be the name of a label
+    * a ``('JUMPDEST', label)`` tuple, which marks a jump destination
+    """
+    labels = {}
+    offset = 0
+    for instruction in instructions:
+        if isinstance(instruction, tuple):
+            opcode_name, argument = instruction
+            if opcode_name == 'JUMPDEST':
+                if argument in labels:
+                    raise ValueError("Duplicate label: {0}".format(argument))
+                labels[argument] = offset
+        else:
+            opcode_name = instruction
+        offset += 1 + get_push_size(opcode_name)
+
+    code = bytearray()
+    for instruction in instructions:
+        if isinstance(instruction, tuple):
+            opcode_name, argument = instruction
+        else:
+            opcode_name, argument = instruction, None
+        code.append(OPCODES[opcode_name])
+
+        push_size = get_push_size(opcode_name)
+        if push_size:
+            value = labels[argument] if isinstance(argument, str) else argument
+            try:
+                code.extend(value.to_bytes(push_size, 'big'))
+            except OverflowError:
+                raise ValueError(
+                    "{0} does not fit in {1}".format(argument, opcode_name)
+                )
+    return bytes(code)
+
+
+def get_deploy_code(runtime_code):
+    """
+    Returns the init code which deploys ``runtime_code``, followed by the
+    runtime code itself.
+    """
+    init_code = assemble([
+        ('PUSH2', len(runtime_code)),
+        'DUP1',
+        # the length of this init code, where the runtime code starts
+        ('PUSH2', 13),
+        ('PUSH1', 0),
+        'CODECOPY',
+        ('PUSH1', 0),
+        'RETURN',
+    ])
+    return init_code + runtime_code
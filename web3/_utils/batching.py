@@ -0,0 +1,109 @@
+import contextlib
+import threading
+
+_local = threading.local()
+
+
+def get_batch_collector():
+    """
+    Returns the :class:`BatchCollector` that requests made on this thread
+    are collected by, if any.
+    """
+    return getattr(_local, 'collector', None)
+
+
+class BatchCollector:
+    """
+    Collects the requests which reach the providers from a number of worker
+    threads, each making one request through the full middleware stack, and
+    sends them to the providers as batches.
+
+    Requests are held until every worker has either reached a provider or
+    returned without one, e.g. on a cache hit, and are then sent together.
+    Workers which make further requests after receiving a response take part
+    in a following batch.
+
+    A worker may never reach a provider while another one waits for its
+    response, e.g. when a middleware makes a request while holding a lock
+    the other workers are waiting for.  So the queued requests are also sent
+    once no worker has reached a provider or returned for ``flush_timeout``
+    seconds.
+    """
+    def __init__(self, size, flush_timeout=0.1):
+        self._condition = threading.Condition()
+        self._outstanding = size
+        self._queued = []
+        self._responses = {}
+        self._progress = 0
+        self.flush_timeout = flush_timeout
+
+    @contextlib.contextmanager
+    def worker(self):
+        _local.collector = self
+        try:
+            yield
+        finally:
+            _local.collector = None
+            with self._condition:
+                self._outstanding -= 1
+                self._mark_progress()
+                self._flush_if_ready()
+
+    def make_request(self, provider, method, params):
+        key = object()
+        with self._condition:
+            self._queued.append((key, provider, method, params))
+            self._outstanding -= 1
+            self._mark_progress()
+            self._flush_if_ready()
+            while key not in self._responses:
+                progress = self._progress
+                self._condition.wait(self.flush_timeout)
+                if progress == self._progress and key not in self._responses:
+                    self._flush()
+            response, error = self._responses.pop(key)
+
+        if error is not None:
+            raise error
+        return response
+
+    def _mark_progress(self):
+        # restarts the flush timeout of the waiting workers
+        self._progress += 1
+        self._condition.notify_all()
+
+    def _flush_if_ready(self):
+        if not self._outstanding:
+            self._flush()
+
+    def _flush(self):
+        if not self._queued:
+            return
+
+        queued, self._queued = self._queued, []
+        for provider in unique_providers(queued):
+            batch = [item for item in queued if item[1] is provider]
+            try:
+                responses = provider.make_batch_request([
+                    (method, params)
+                    for _, _, method, params
+                    in batch
+                ])
+            except Exception as exc:
+                for key, _, _, _ in batch:
+                    self._responses[key] = (None, exc)
+            else:
+                for (key, _, _, _), response in zip(batch, responses):
+                    self._responses[key] = (response, None)
+
+        # every worker which receives a response is making requests again
+        self._outstanding += len(queued)
+        self._condition.notify_all()
+
+
+def unique_providers(queued):
+    providers = []
+    for _, provider, _, _ in queued:
+        if not any(provider is seen for seen in providers):
+            providers.append(provider)
+    return providers
@@ -43,6 +43,19 @@ def is_hex_encoded_block_number(value):
     return 0 <= value_as_int < 2**256
 
 
+def to_block_number(value):
+    """
+    Returns ``value`` as an integer block number, or ``None`` if it is a
+    predefined block identifier like ``'latest'`` or a block hash.
+    """
+    if is_integer(value):
+        return value
+    elif is_hex_encoded_block_number(value):
+        return int(value, 16)
+    else:
+        return None
+
+
 def select_method_for_block_identifier(value, if_hash, if_number, if_predefined):
     if is_predefined_block_number(value):
         return if_predefined
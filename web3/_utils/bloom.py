@@ -0,0 +1,116 @@
+import functools
+import operator
+
+from eth_utils import (
+    is_integer,
+    is_list_like,
+    keccak,
+)
+
+from web3._utils.encoding import (
+    hexstr_if_str,
+    to_bytes,
+)
+
+
+def get_bloom_bits(value):
+    """
+    Returns the bits set in a 2048 bit logs bloom for ``value``, an address
+    or a topic, as an integer mask.
+    """
+    value_hash = keccak(value)
+    mask = 0
+    for index in (0, 2, 4):
+        mask |= 1 << (int.from_bytes(value_hash[index:index + 2], 'big') & 2047)
+    return mask
+
+
+def to_bloom_int(logs_bloom):
+    """
+    Returns the ``logsBloom`` of a block, as bytes, hex or an integer, as an
+    integer.
+    """
+    if is_integer(logs_bloom):
+        return logs_bloom
+    return int.from_bytes(hexstr_if_str(to_bytes, logs_bloom), 'big')
+
+
+def normalize_query_values(values):
+    if values is None:
+        return None
+    elif is_list_like(values):
+        if not values:
+            return None
+        return tuple(hexstr_if_str(to_bytes, value) for value in values)
+    else:
+        return (hexstr_if_str(to_bytes, values),)
+
+
+class BloomQuery:
+    """
+    Tests an ``eth_getLogs`` style ``address`` and ``topics`` query against
+    the ``logsBloom`` of block headers.  A bloom which doesn't match the
+    query proves that the block has no matching logs, while a bloom which
+    does match may still be a false positive.
+    """
+    def __init__(self, address=None, topics=None):
+        value_groups = [normalize_query_values(address)]
+        for topic in topics or ():
+            value_groups.append(normalize_query_values(topic))
+
+        # every group has to match, by any of its values
+        self.mask_groups = tuple(
+            tuple(get_bloom_bits(value) for value in values)
+            for values
+            in value_groups
+            if values is not None
+        )
+
+    def matches(self, logs_bloom):
+        """
+        Whether a block with ``logs_bloom`` may have logs matching the query.
+        """
+        bloom = to_bloom_int(logs_bloom)
+        return all(
+            any(bloom & mask == mask for mask in masks)
+            for masks
+            in self.mask_groups
+        )
+
+    def matches_any(self, logs_blooms):
+        """
+        Whether any of the blocks with ``logs_blooms`` may have logs matching
+        the query.  The blooms are combined into one, so that this costs a
+        single test.
+        """
+        return self.matches(functools.reduce(
+            operator.or_,
+            (to_bloom_int(logs_bloom) for logs_bloom in logs_blooms),
+            0,
+        ))
+
+    def narrow_block_range(self, from_block, to_block, logs_blooms):
+        """
+        Returns the part of the inclusive block range from the first to the
+        last block which may have matching logs, or ``None`` if none of them
+        can.  ``logs_blooms`` maps block numbers to their ``logsBloom``, and
+        the range is returned unchanged unless the blooms of all of its
+        blocks are known.
+        """
+        if not self.mask_groups or to_block - from_block + 1 > len(logs_blooms):
+            return from_block, to_block
+        block_numbers = range(from_block, to_block + 1)
+        if any(block_number not in logs_blooms for block_number in block_numbers):
+            return from_block, to_block
+        if not self.matches_any(logs_blooms[block_number] for block_number in block_numbers):
+            return None
+
+        matching_block_numbers = [
+            block_number
+            for block_number
+            in block_numbers
+            if self.matches(logs_blooms[block_number])
+        ]
+        if not matching_block_numbers:
+            return None
+        return matching_block_numbers[0], matching_block_numbers[-1]
@@ -11,6 +11,7 @@ from eth_utils import (
     is_text,
     to_bytes,
 )
+import lru
 
 
 def generate_cache_key(value):
@@ -40,3 +41,30 @@ def generate_cache_key(value):
             value,
             type(value),
         ))
+
+
+class IdentityLRU:
+    """
+    An LRU cache of values computed from an object, such as an ABI, keyed by
+    the identity of the object and an optional extra ``key``.
+
+    The object is kept alive in its cache entry, so its ``id`` can't be reused
+    by another object while the entry exists.
+    """
+    def __init__(self, size):
+        self._cache = lru.LRU(size)
+
+    def __len__(self):
+        return len(self._cache)
+
+    def get(self, obj, key=None, default=None):
+        cached_obj, value = self._cache.get((id(obj), key), (None, default))
+        if cached_obj is obj:
+            return value
+        return default
+
+    def set(self, obj, value, key=None):
+        self._cache[(id(obj), key)] = (obj, value)
+
+    def clear(self):
+        self._cache.clear()
@@ -1,20 +1,36 @@
 import functools
+import json
+import threading
 
-from eth_abi import (
-    encode_abi as eth_abi_encode_abi,
+from eth_abi.decoding import (
+    ContextFramesBytesIO,
+    TupleDecoder,
+)
+from eth_abi.encoding import (
+    TupleEncoder,
 )
 from eth_abi.exceptions import (
     EncodingError,
 )
+from eth_abi.registry import (
+    registry,
+)
 from eth_utils import (
     add_0x_prefix,
     encode_hex,
+    event_abi_to_log_topic,
     function_abi_to_4byte_selector,
+    is_bytes,
+    is_checksum_formatted_address,
+    is_hex,
+    is_hex_address,
     is_text,
+    remove_0x_prefix,
 )
 from hexbytes import (
     HexBytes,
 )
+import lru
 
 from web3._utils.abi import (
     abi_to_signature,
@@ -24,18 +40,27 @@ from web3._utils.abi import (
     filter_by_encodability,
     filter_by_name,
     filter_by_type,
+    get_abi_data_normalizer,
     get_abi_input_types,
+    get_abi_output_types,
     get_fallback_func_abi,
     map_abi_data,
     merge_args_and_kwargs,
 )
+from web3._utils.caching import (
+    IdentityLRU,
+)
 from web3._utils.encoding import (
     to_hex,
 )
+from web3._utils.ens import (
+    is_ens_name,
+)
 from web3._utils.function_identifiers import (
     FallbackFn,
 )
 from web3._utils.normalizers import (
+    BASE_RETURN_NORMALIZERS,
     abi_address_to_hex,
     abi_bytes_to_bytes,
     abi_ens_resolver,
@@ -50,6 +75,158 @@ from web3.exceptions import (
 )
 
 
+class CompiledFunctionABI:
+    """
+    A function ABI with its selector, argument types, the eth-abi encoder
+    and decoder for its arguments and return values and the normalizer of
+    its return values, which are built when first needed.
+    """
+    def __init__(self, fn_abi):
+        self.abi = fn_abi
+        self.input_types = get_abi_input_types(fn_abi)
+        self._selector = None
+        self._output_types = None
+        self._encoder = None
+        self._decoder = None
+        self._output_normalizer = None
+
+    @property
+    def selector(self):
+        if self._selector is None:
+            self._selector = encode_hex(function_abi_to_4byte_selector(self.abi))
+        return self._selector
+
+    @property
+    def output_types(self):
+        if self._output_types is None:
+            self._output_types = get_abi_output_types(self.abi)
+        return self._output_types
+
+    def encode_arguments(self, arguments):
+        if self._encoder is None:
+            self._encoder = TupleEncoder(encoders=[
+                registry.get_encoder(type_str)
+                for type_str
+                in self.input_types
+            ])
+        return self._encoder(arguments)
+
+    def decode_output(self, data):
+        if not is_bytes(data):
+            raise TypeError("The `data` value must be of bytes type.  Got {0}".format(type(data)))
+        if self._decoder is None:
+            self._decoder = TupleDecoder(decoders=[
+                registry.get_decoder(type_str)
+                for type_str
+                in self.output_types
+            ])
+        return self._decoder(ContextFramesBytesIO(data))
+
+    def normalize_output(self, output_data):
+        """
+        Applies the ``BASE_RETURN_NORMALIZERS`` to the decoded return values.
+        """
+        if self._output_normalizer is None:
+            self._output_normalizer = get_abi_data_normalizer(
+                tuple(BASE_RETURN_NORMALIZERS),
+                self.output_types,
+            )
+        return self._output_normalizer(output_data)
+
+
+_compiled_function_abis = IdentityLRU(4096)
+
+
+def compile_function_abi(fn_abi):
+    """
+    Returns the :class:`CompiledFunctionABI` of ``fn_abi``, which is cached
+    by the identity of the ABI dict.
+    """
+    compiled_fn_abi = _compiled_function_abis.get(fn_abi)
+    if compiled_fn_abi is None:
+        compiled_fn_abi = CompiledFunctionABI(fn_abi)
+        _compiled_function_abis.set(fn_abi, compiled_fn_abi)
+    return compiled_fn_abi
+
+
+class CompiledEventABI:
+    """
+    An event ABI with its topic, which is ``None`` for anonymous events.
+    """
+    def __init__(self, event_abi):
+        self.abi = event_abi
+        if event_abi.get('anonymous'):
+            self.topic = None
+        else:
+            self.topic = event_abi_to_log_topic(event_abi)
+
+
+class CompiledContractABI:
+    """
+    The parts of a contract ABI which are looked up over and over, computed
+    once and shared by every contract factory and instance with the same ABI.
+    """
+    def __init__(self, abi):
+        self.abi = abi
+        self.functions = filter_by_type('function', abi)
+        self.function_names = frozenset(fn_abi['name'] for fn_abi in self.functions)
+        self.events = filter_by_type('event', abi)
+        self.event_names = frozenset(event_abi['name'] for event_abi in self.events)
+        self.has_fallback = bool(filter_by_type('fallback', abi))
+
+        # keyed by the id of the ABI dicts, which are kept alive by ``abi``
+        self._compiled_functions = {
+            id(fn_abi): compile_function_abi(fn_abi)
+            for fn_abi
+            in self.functions
+        }
+        self._compiled_events = {
+            id(event_abi): CompiledEventABI(event_abi)
+            for event_abi
+            in self.events
+        }
+        self._events_by_name = {}
+        for event_abi in self.events:
+            self._events_by_name.setdefault(event_abi['name'], []).append(event_abi)
+
+    def get_function(self, fn_abi):
+        """
+        Returns the :class:`CompiledFunctionABI` of ``fn_abi`` if it is one of
+        the functions of this ABI, otherwise ``None``.
+        """
+        return self._compiled_functions.get(id(fn_abi))
+
+    def get_event(self, event_abi):
+        """
+        Returns the :class:`CompiledEventABI` of ``event_abi`` if it is one of
+        the events of this ABI, otherwise ``None``.
+        """
+        return self._compiled_events.get(id(event_abi))
+
+    def get_events_by_name(self, event_name):
+        return self._events_by_name.get(event_name, [])
+
+
+_compiled_contract_abis = lru.LRU(256)
+_compiled_contract_abis_lock = threading.Lock()
+
+
+def compile_contract_abi(abi):
+    """
+    Returns the :class:`CompiledContractABI` of ``abi``, shared with every
+    other equal ABI.
+    """
+    try:
+        cache_key = json.dumps(abi, sort_keys=True)
+    except TypeError:
+        return CompiledContractABI(abi)
+
+    with _compiled_contract_abis_lock:
+        if cache_key not in _compiled_contract_abis:
+            _compiled_contract_abis[cache_key] = CompiledContractABI(abi)
+        return _compiled_contract_abis[cache_key]
+
+
 def find_matching_event_abi(abi, event_name=None, argument_names=None):
 
     filters = [
@@ -74,11 +251,78 @@ def find_matching_event_abi(abi, event_name=None, argument_names=None):
         raise ValueError("Multiple events found")
 
 
+def _get_text_shape(value):
+    if is_checksum_formatted_address(value):
+        # a mixed case address is only an address if its checksum is valid,
+        # and checking that means hashing it, so the address is its own shape
+        return (str, value)
+    if is_hex(value) and len(value) % 2 == 0:
+        hex_length = len(remove_0x_prefix(value))
+    else:
+        hex_length = None
+    return (str, hex_length, is_hex_address(value), is_ens_name(value))
+
+
+_cached_get_text_shape = functools.lru_cache(4096)(_get_text_shape)
+
+
+def get_argument_shape(value):
+    """
+    Returns a hashable summary of everything about ``value`` which decides
+    the ABI types it can be encoded as, or ``None`` if it can't be summed up.
+    """
+    if isinstance(value, bool):
+        return (bool,)
+    elif isinstance(value, int):
+        # the bits needed besides the sign bit, e.g. 7 for both -128 and 127
+        if value < 0:
+            return (int, True, (~value).bit_length())
+        return (int, False, value.bit_length())
+    elif isinstance(value, (bytes, bytearray)):
+        try:
+            value.decode('utf-8')
+        except UnicodeDecodeError:
+            is_text_bytes = False
+        else:
+            is_text_bytes = True
+        return (bytes, len(value), is_text_bytes)
+    elif isinstance(value, str):
+        return _cached_get_text_shape(value)
+    elif isinstance(value, (list, tuple)):
+        item_shapes = tuple(get_argument_shape(item) for item in value)
+        if None in item_shapes:
+            return None
+        return (type(value), item_shapes)
+    else:
+        return None
+
+
+def get_fn_abi_cache_key(abi, fn_identifier, args, kwargs):
+    argument_shapes = tuple(get_argument_shape(arg) for arg in args)
+    kwarg_shapes = tuple(
+        (name, get_argument_shape(kwargs[name]))
+        for name
+        in sorted(kwargs)
+    )
+    if None in argument_shapes or any(shape is None for _, shape in kwarg_shapes):
+        return None
+    return (fn_identifier, argument_shapes, kwarg_shapes)
+
+
+_matching_fn_abis = IdentityLRU(4096)
+
+
 def find_matching_fn_abi(abi, fn_identifier=None, args=None, kwargs=None):
+    """
+    Returns the ABI of the function named ``fn_identifier`` which the
+    arguments can be encoded for.
+
+    Matches are cached by the identity of ``abi``, the function name and the
+    shape of the arguments, see :func:`get_argument_shape`, so repeated
+    calls skip the filtering.
+    """
     args = args or tuple()
     kwargs = kwargs or dict()
-    filters = []
-    num_arguments = len(args) + len(kwargs)
 
     if fn_identifier is FallbackFn:
         return get_fallback_func_abi(abi)
@@ -86,6 +330,22 @@ def find_matching_fn_abi(abi, fn_identifier=None, args=None, kwargs=None):
     if not is_text(fn_identifier):
         raise TypeError("Unsupported function identifier")
 
+    cache_key = get_fn_abi_cache_key(abi, fn_identifier, args, kwargs)
+    if cache_key is not None:
+        fn_abi = _matching_fn_abis.get(abi, cache_key)
+        if fn_abi is not None:
+            return fn_abi
+
+    fn_abi = _find_matching_fn_abi(abi, fn_identifier, args, kwargs)
+    if cache_key is not None:
+        _matching_fn_abis.set(abi, fn_abi, cache_key)
+    return fn_abi
+
+
+def _find_matching_fn_abi(abi, fn_identifier, args, kwargs):
+    filters = []
+    num_arguments = len(args) + len(kwargs)
+
     name_filter = functools.partial(filter_by_name, fn_identifier)
     arg_count_filter = functools.partial(filter_by_argument_count, num_arguments)
     encoding_filter = functools.partial(filter_by_encodability, args, kwargs)
@@ -129,7 +389,8 @@ def find_matching_fn_abi(abi, fn_identifier=None, args=None, kwargs=None):
 
 
 def encode_abi(web3, abi, arguments, data=None):
-    argument_types = get_abi_input_types(abi)
+    compiled_fn_abi = compile_function_abi(abi)
+    argument_types = compiled_fn_abi.input_types
 
     if not check_if_arguments_can_be_encoded(abi, arguments, {}):
         raise TypeError(
@@ -151,10 +412,7 @@ def encode_abi(web3, abi, arguments, data=None):
             argument_types,
             arguments,
         )
-        encoded_arguments = eth_abi_encode_abi(
-            argument_types,
-            normalized_arguments,
-        )
+        encoded_arguments = compiled_fn_abi.encode_arguments(normalized_arguments)
     except EncodingError as e:
         raise TypeError(
             "One or more arguments could not be encoded to the necessary "
@@ -245,7 +503,7 @@ def get_function_info(fn_name, contract_abi=None, fn_abi=None, args=None, kwargs
     if fn_abi is None:
         fn_abi = find_matching_fn_abi(contract_abi, fn_name, args, kwargs)
 
-    fn_selector = encode_hex(function_abi_to_4byte_selector(fn_abi))
+    fn_selector = compile_function_abi(fn_abi).selector
 
     fn_arguments = merge_args_and_kwargs(fn_abi, args, kwargs)
 
@@ -1,4 +1,5 @@
 # String encodings and numeric representations
+import functools
 import json
 import re
 
@@ -31,6 +32,9 @@ from web3._utils.abi import (
     size_of_type,
     sub_type_of_array_type,
 )
+from web3._utils.formatters import (
+    static_return,
+)
 from web3._utils.toolz import (
     curry,
 )
@@ -101,6 +105,110 @@ def pad_hex(value, bit_size):
     return add_0x_prefix(value.zfill(int(bit_size / 4)))
 
 
+def compile_abi_type_packer(abi_type, force_size=None):
+    """
+    Returns a function which encodes a valid value of ``abi_type`` to the
+    bytes of :func:`hex_encode_abi_type`.  It returns ``None`` for values
+    which that doesn't encode to whole bytes, like integers out of the range
+    of their type or odd length hex strings.
+    """
+    data_size = force_size or size_of_type(abi_type)
+    if is_array_type(abi_type):
+        pack_item = compile_abi_type_packer(sub_type_of_array_type(abi_type), 256)
+
+        def pack_array(value):
+            packed_items = [pack_item(item) for item in value]
+            if None in packed_items:
+                return None
+            return b''.join(packed_items)
+        return pack_array
+    elif is_bool_type(abi_type) or is_uint_type(abi_type):
+        num_bytes = data_size // 8
+        max_value = 2 ** data_size
+
+        def pack_unsigned(value):
+            if value < max_value:
+                return int(value).to_bytes(num_bytes, 'big')
+            return None
+        return pack_unsigned
+    elif is_int_type(abi_type):
+        num_bytes = data_size // 8
+        max_value = 2 ** data_size
+        min_value = -2 ** (data_size - 1)
+
+        def pack_signed(value):
+            if min_value <= value < max_value:
+                return (value % max_value).to_bytes(num_bytes, 'big')
+            return None
+        return pack_signed
+    elif is_address_type(abi_type):
+        num_bytes = data_size // 8
+
+        def pack_address(value):
+            if isinstance(value, str):
+                return decode_hex(value).rjust(num_bytes, b'\0')
+            return None
+        return pack_address
+    elif is_bytes_type(abi_type):
+        def pack_bytes(value):
+            if is_bytes(value):
+                return value
+            elif len(value) % 2 == 0 and is_hex(value):
+                return decode_hex(value)
+            return None
+        return pack_bytes
+    elif is_string_type(abi_type):
+        def pack_string(value):
+            if isinstance(value, str):
+                return value.encode('utf-8')
+            return None
+        return pack_string
+    else:
+        return static_return(None)
+
+
+def hex_pack_abi_values(abi_types, values):
+    return to_bytes(hexstr=add_0x_prefix(''.join(
+        remove_0x_prefix(hex_encode_abi_type(abi_type, value))
+        for abi_type, value
+        in zip(abi_types, values)
+    )))
+
+
+@functools.lru_cache(maxsize=1024)
+def get_abi_packer(abi_types):
+    """
+    Returns a function which packs values of the tuple of ``abi_types``
+    tightly, like solidity's ``abi.encodePacked``, to the same bytes as
+    joining the :func:`hex_encode_abi_type` of each value.  The encoders
+    are compiled once per tuple of types, and values are packed straight to
+    bytes unless they need the hex string encoding.
+    """
+    packers = []
+    for abi_type in abi_types:
+        try:
+            validate_abi_type(abi_type)
+        except ValueError:
+            # leave it to hex_encode_abi_type to raise, in order
+            packers.append(None)
+        else:
+            packers.append(compile_abi_type_packer(abi_type))
+
+    def pack(values):
+        packed_values = []
+        for abi_type, pack_value, value in zip(abi_types, packers, values):
+            if pack_value is None:
+                hex_encode_abi_type(abi_type, value)
+            validate_abi_value(abi_type, value)
+            packed_value = pack_value(value)
+            if packed_value is None:
+                return hex_pack_abi_values(abi_types, values)
+            packed_values.append(packed_value)
+        return b''.join(packed_values)
+
+    return pack
+
+
 def trim_hex(hexstr):
     if hexstr.startswith('0x0'):
         hexstr = re.sub('^0x0+', '0x', hexstr)
@@ -0,0 +1,261 @@
+import array
+import itertools
+
+from eth_abi import (
+    decode_abi,
+    decode_single,
+)
+from eth_utils import (
+    event_abi_to_log_topic,
+)
+
+from web3._utils.abi import (
+    exclude_indexed_event_inputs,
+    get_abi_data_normalizer,
+    get_abi_input_names,
+    get_indexed_event_inputs,
+    is_word_type,
+    normalize_event_input_types,
+    process_type,
+)
+from web3._utils.encoding import (
+    hexstr_if_str,
+    to_bytes,
+)
+from web3._utils.events import (
+    get_event_abi_types_for_decoding,
+)
+from web3._utils.normalizers import (
+    BASE_RETURN_NORMALIZERS,
+)
+
+LOG_INTEGER_FIELDS = (
+    'blockNumber',
+    'transactionIndex',
+    'logIndex',
+)
+
+LOG_BYTES_FIELDS = (
+    ('blockHash', 32),
+    ('transactionHash', 32),
+    ('address', 20),
+)
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class IntegerColumn:
+    """
+    Integers of up to 64 bits, kept in an ``array.array``.
+    """
+    def __init__(self, typecode):
+        self.values = array.array(typecode)
+        self.is_signed = typecode.islower()
+
+    def append_word(self, word):
+        self.values.append(int.from_bytes(word[24:], 'big', signed=self.is_signed))
+
+    def append_value(self, value):
+        self.values.append(int(value))
+
+    def finalize(self, numpy):
+        if numpy is None:
+            return self.values
+        elif self.values.typecode == 'B':
+            return numpy.frombuffer(self.values, dtype=numpy.uint8).astype(numpy.bool_)
+        elif self.is_signed:
+            return numpy.frombuffer(self.values, dtype=numpy.int64)
+        else:
+            return numpy.frombuffer(self.values, dtype=numpy.uint64)
+
+
+class BigIntegerColumn:
+    """
+    Integers wider than 64 bits, which have no compact native
+    representation, kept as a list of python integers.
+    """
+    def __init__(self, is_signed):
+        self.values = []
+        self.is_signed = is_signed
+
+    def append_word(self, word):
+        self.values.append(int.from_bytes(word, 'big', signed=self.is_signed))
+
+    def append_value(self, value):
+        self.values.append(value)
+
+    def finalize(self, numpy):
+        return self.values
+
+
+class FixedBytesColumn:
+    """
+    Values of ``width`` bytes, kept back to back in a single buffer.
+    ``offset`` is where the value starts within a 32 byte ABI word.
+    """
+    def __init__(self, width, offset=0):
+        self.values = bytearray()
+        self.width = width
+        self.offset = offset
+
+    def append_word(self, word):
+        self.values += word[self.offset:self.offset + self.width]
+
+    def append_value(self, value):
+        self.values += hexstr_if_str(to_bytes, value)
+
+    def finalize(self, numpy):
+        if numpy is None:
+            return bytes(self.values)
+        return numpy.frombuffer(bytes(self.values), dtype=numpy.uint8).reshape(-1, self.width)
+
+
+class ValueColumn:
+    """
+    Any other type, decoded and kept as a list.
+    """
+    def __init__(self, abi_type):
+        self.values = []
+        self.abi_type = abi_type
+        self._normalizer = get_abi_data_normalizer(tuple(BASE_RETURN_NORMALIZERS), [abi_type])
+
+    def append_word(self, word):
+        self.append_value(decode_single(self.abi_type, word))
+
+    def append_value(self, value):
+        self.values.extend(self._normalizer([value]))
+
+    def finalize(self, numpy):
+        return self.values
+
+
+def make_column(abi_type):
+    base, sub, arrlist = process_type(abi_type)
+    if arrlist:
+        return ValueColumn(abi_type)
+    elif base == 'uint' and int(sub) <= 64:
+        return IntegerColumn('Q')
+    elif base == 'int' and int(sub) <= 64:
+        return IntegerColumn('q')
+    elif base in {'uint', 'int'}:
+        return BigIntegerColumn(is_signed=base == 'int')
+    elif base == 'bool':
+        return IntegerColumn('B')
+    elif base == 'address':
+        return FixedBytesColumn(20, offset=12)
+    elif base == 'bytes' and sub:
+        return FixedBytesColumn(int(sub))
+    else:
+        return ValueColumn(abi_type)
+
+
+def get_event_columns(event_abi, log_entries, use_numpy=None):
+    """
+    Given an event ABI and log entries for that event, return the decoded
+    event data as a dictionary of columns, one for each event argument and
+    one for each of the ``blockNumber``, ``transactionIndex``, ``logIndex``,
+    ``blockHash``, ``transactionHash`` and ``address`` fields of the logs.
+
+    Integers of up to 64 bits are returned as an ``array.array`` and fixed
+    size byte strings, like addresses and hashes, as a single ``bytes``
+    buffer of the values back to back.  When ``use_numpy`` is true, or
+    ``None`` and numpy is installed, these are returned as numpy arrays
+    instead, with fixed size byte strings as 2-dimensional ``uint8`` arrays.
+    Wider integers and dynamic types are returned as lists of values.
+
+    Logs which do not match the event ABI are skipped.
+    """
+    if use_numpy is False:
+        numpy = None
+    else:
+        numpy = _import_numpy()
+        if use_numpy and numpy is None:
+            raise ImportError("numpy is required for use_numpy=True")
+
+    log_topics_abi = get_indexed_event_inputs(event_abi)
+    log_topic_types = get_event_abi_types_for_decoding(
+        normalize_event_input_types(log_topics_abi)
+    )
+    log_topic_names = get_abi_input_names({'inputs': log_topics_abi})
+
+    log_data_abi = exclude_indexed_event_inputs(event_abi)
+    log_data_types = get_event_abi_types_for_decoding(
+        normalize_event_input_types(log_data_abi)
+    )
+    log_data_names = get_abi_input_names({'inputs': log_data_abi})
+
+    duplicate_names = set(log_topic_names).intersection(log_data_names)
+    if duplicate_names:
+        raise ValueError(
+            "Invalid Event ABI:  The following argument names are duplicated "
+            "between event inputs: '{0}'".format(', '.join(duplicate_names))
+        )
+
+    topic_columns = [make_column(topic_type) for topic_type in log_topic_types]
+    data_columns = [make_column(data_type) for data_type in log_data_types]
+    integer_field_columns = [IntegerColumn('Q') for _ in LOG_INTEGER_FIELDS]
+    bytes_field_columns = [FixedBytesColumn(width) for _, width in LOG_BYTES_FIELDS]
+
+    # When all of the data arguments are single words they can be sliced out
+    # of the log data without running the full ABI decoder.
+    is_data_sliceable = all(is_word_type(data_type) for data_type in log_data_types)
+
+    if event_abi['anonymous']:
+        event_topic = None
+    else:
+        event_topic = event_abi_to_log_topic(event_abi)
+
+    for log_entry in log_entries:
+        topics = [hexstr_if_str(to_bytes, topic) for topic in log_entry['topics']]
+        if event_topic is not None:
+            if not topics or topics[0] != event_topic:
+                continue
+            topics = topics[1:]
+        if len(topics) != len(topic_columns):
+            continue
+
+        log_data = hexstr_if_str(to_bytes, log_entry['data'])
+        if is_data_sliceable:
+            if len(log_data) < 32 * len(data_columns):
+                continue
+            for index, column in enumerate(data_columns):
+                column.append_word(log_data[32 * index:32 * (index + 1)])
+        else:
+            for column, value in zip(data_columns, decode_abi(log_data_types, log_data)):
+                column.append_value(value)
+
+        for column, topic in zip(topic_columns, topics):
+            column.append_word(topic)
+        for column, field in zip(integer_field_columns, LOG_INTEGER_FIELDS):
+            column.append_value(log_entry[field])
+        for column, (field, _) in zip(bytes_field_columns, LOG_BYTES_FIELDS):
+            column.append_value(log_entry[field])
+
+    return dict(itertools.chain(
+        (
+            (name, column.finalize(numpy))
+            for name, column
+            in zip(log_topic_names, topic_columns)
+        ),
+        (
+            (name, column.finalize(numpy))
+            for name, column
+            in zip(log_data_names, data_columns)
+        ),
+        (
+            (field, column.finalize(numpy))
+            for field, column
+            in zip(LOG_INTEGER_FIELDS, integer_field_columns)
+        ),
+        (
+            (field, column.finalize(numpy))
+            for (field, _), column
+            in zip(LOG_BYTES_FIELDS, bytes_field_columns)
+        ),
+    ))
@@ -2,24 +2,35 @@ from abc import (
     ABC,
     abstractmethod,
 )
+import functools
 import itertools
 
 from eth_abi import (
-    decode_abi,
-    decode_single,
     encode_single,
 )
+from eth_abi.decoding import (
+    ContextFramesBytesIO,
+    TupleDecoder,
+)
+from eth_abi.registry import (
+    registry,
+)
 from eth_utils import (
     encode_hex,
     event_abi_to_log_topic,
+    is_bytes,
     is_list_like,
     keccak,
+    to_checksum_address,
     to_dict,
     to_hex,
     to_tuple,
 )
 
 import web3
+from web3._utils.caching import (
+    IdentityLRU,
+)
 from web3._utils.encoding import (
     encode_single_packed,
     hexstr_if_str,
@@ -47,9 +58,10 @@ from web3.exceptions import (
 
 from .abi import (
     exclude_indexed_event_inputs,
+    get_abi_data_normalizer,
     get_abi_input_names,
     get_indexed_event_inputs,
-    map_abi_data,
+    is_word_type,
     normalize_event_input_types,
     process_type,
 )
@@ -158,82 +170,247 @@ def get_event_abi_types_for_decoding(event_inputs):
             yield input_abi['type']
 
 
-@curry
-def get_event_data(event_abi, log_entry):
+# Returned by the word converters for a word which isn't a valid encoding.
+INVALID_WORD = object()
+
+ZERO_WORD = bytes(32)
+
+
+@functools.lru_cache(maxsize=4096)
+def checksum_address_bytes(address_bytes):
+    return to_checksum_address(address_bytes)
+
+
+def get_word_converter(abi_type):
     """
-    Given an event ABI and a log entry for that event, return the decoded
-    event data
+    Returns a function converting a single 32 byte ABI word of ``abi_type``
+    to the value eth-abi decodes it to, normalized for returning.  The
+    function returns ``INVALID_WORD`` for words which eth-abi would reject,
+    e.g. because of non-empty padding bytes.
     """
-    if event_abi['anonymous']:
-        log_topics = log_entry['topics']
-    elif not log_entry['topics']:
-        raise MismatchedABI("Expected non-anonymous event to have 1 or more topics")
-    elif event_abi_to_log_topic(event_abi) != log_entry['topics'][0]:
-        raise MismatchedABI("The event signature did not match the provided ABI")
+    base, sub, _ = process_type(abi_type)
+    if base == 'uint':
+        bits = int(sub)
+
+        def convert_uint(word):
+            value = int.from_bytes(word, 'big')
+            if value >> bits:
+                return INVALID_WORD
+            return value
+        return convert_uint
+    elif base == 'int':
+        bound = 2 ** (int(sub) - 1)
+
+        def convert_int(word):
+            value = int.from_bytes(word, 'big', signed=True)
+            if not -bound <= value < bound:
+                return INVALID_WORD
+            return value
+        return convert_int
+    elif base == 'bool':
+        def convert_bool(word):
+            if word[:31] != ZERO_WORD[:31] or word[31] > 1:
+                return INVALID_WORD
+            return bool(word[31])
+        return convert_bool
+    elif base == 'address':
+        def convert_address(word):
+            if word[:12] != ZERO_WORD[:12]:
+                return INVALID_WORD
+            return checksum_address_bytes(bytes(word[12:]))
+        return convert_address
+    elif base == 'bytes' and sub:
+        size = int(sub)
+
+        def convert_bytes(word):
+            if word[size:] != ZERO_WORD[size:]:
+                return INVALID_WORD
+            return bytes(word[:size])
+        return convert_bytes
     else:
-        log_topics = log_entry['topics'][1:]
+        raise TypeError("Values of {0} are not encoded as a single word".format(abi_type))
 
-    log_topics_abi = get_indexed_event_inputs(event_abi)
-    log_topic_normalized_inputs = normalize_event_input_types(log_topics_abi)
-    log_topic_types = get_event_abi_types_for_decoding(log_topic_normalized_inputs)
-    log_topic_names = get_abi_input_names({'inputs': log_topics_abi})
 
-    if len(log_topics) != len(log_topic_types):
-        raise ValueError("Expected {0} log topics.  Got {1}".format(
-            len(log_topic_types),
-            len(log_topics),
-        ))
+def get_word_converters(abi_types):
+    """
+    Returns the word converters of ``abi_types`` if all of them are encoded
+    as a single word, or ``None`` otherwise.
+    """
+    if all(is_word_type(abi_type) for abi_type in abi_types):
+        return tuple(get_word_converter(abi_type) for abi_type in abi_types)
+    return None
+
+
+def convert_words(converters, words):
+    """
+    Converts the 32 byte words at the start of ``words``, a memoryview, or
+    returns ``None`` if there are too few or any of them is invalid.
+    """
+    if len(words) < 32 * len(converters):
+        return None
+    values = []
+    for index, convert in enumerate(converters):
+        value = convert(words[32 * index:32 * (index + 1)])
+        if value is INVALID_WORD:
+            return None
+        values.append(value)
+    return values
 
-    log_data = hexstr_if_str(to_bytes, log_entry['data'])
-    log_data_abi = exclude_indexed_event_inputs(event_abi)
-    log_data_normalized_inputs = normalize_event_input_types(log_data_abi)
-    log_data_types = get_event_abi_types_for_decoding(log_data_normalized_inputs)
-    log_data_names = get_abi_input_names({'inputs': log_data_abi})
-
-    # sanity check that there are not name intersections between the topic
-    # names and the data argument names.
-    duplicate_names = set(log_topic_names).intersection(log_data_names)
-    if duplicate_names:
-        raise ValueError(
-            "Invalid Event ABI:  The following argument names are duplicated "
-            "between event inputs: '{0}'".format(', '.join(duplicate_names))
+
+class EventDecoder:
+    """
+    An event ABI compiled for decoding its log entries: the topic, the
+    types and names of the indexed and data arguments and their eth-abi
+    decoders and normalizers are worked out once, when the decoder is
+    created.
+    """
+    def __init__(self, event_abi):
+        self.abi = event_abi
+        if event_abi['anonymous']:
+            self.topic = None
+        else:
+            self.topic = event_abi_to_log_topic(event_abi)
+
+        log_topics_abi = get_indexed_event_inputs(event_abi)
+        log_topic_normalized_inputs = normalize_event_input_types(log_topics_abi)
+        self.topic_types = get_event_abi_types_for_decoding(log_topic_normalized_inputs)
+        self.topic_names = get_abi_input_names({'inputs': log_topics_abi})
+
+        log_data_abi = exclude_indexed_event_inputs(event_abi)
+        log_data_normalized_inputs = normalize_event_input_types(log_data_abi)
+        self.data_types = get_event_abi_types_for_decoding(log_data_normalized_inputs)
+        self.data_names = get_abi_input_names({'inputs': log_data_abi})
+
+        # sanity check that there are not name intersections between the topic
+        # names and the data argument names.
+        duplicate_names = set(self.topic_names).intersection(self.data_names)
+        if duplicate_names:
+            raise ValueError(
+                "Invalid Event ABI:  The following argument names are duplicated "
+                "between event inputs: '{0}'".format(', '.join(duplicate_names))
+            )
+
+        self._topic_decoders = [
+            registry.get_decoder(topic_type)
+            for topic_type
+            in self.topic_types
+        ]
+        self._data_decoder = TupleDecoder(decoders=[
+            registry.get_decoder(data_type)
+            for data_type
+            in self.data_types
+        ])
+        # Static arguments are sliced out of the data and topics word by word,
+        # falling back to eth-abi for anything which doesn't decode cleanly.
+        self._topic_converters = get_word_converters(self.topic_types)
+        self._data_converters = get_word_converters(self.data_types)
+        self._topic_normalizer = get_abi_data_normalizer(
+            tuple(BASE_RETURN_NORMALIZERS),
+            self.topic_types,
+        )
+        self._data_normalizer = get_abi_data_normalizer(
+            tuple(BASE_RETURN_NORMALIZERS),
+            self.data_types,
         )
 
-    decoded_log_data = decode_abi(log_data_types, log_data)
-    normalized_log_data = map_abi_data(
-        BASE_RETURN_NORMALIZERS,
-        log_data_types,
-        decoded_log_data
-    )
-
-    decoded_topic_data = [
-        decode_single(topic_type, topic_data)
-        for topic_type, topic_data
-        in zip(log_topic_types, log_topics)
-    ]
-    normalized_topic_data = map_abi_data(
-        BASE_RETURN_NORMALIZERS,
-        log_topic_types,
-        decoded_topic_data
-    )
-
-    event_args = dict(itertools.chain(
-        zip(log_topic_names, normalized_topic_data),
-        zip(log_data_names, normalized_log_data),
-    ))
-
-    event_data = {
-        'args': event_args,
-        'event': event_abi['name'],
-        'logIndex': log_entry['logIndex'],
-        'transactionIndex': log_entry['transactionIndex'],
-        'transactionHash': log_entry['transactionHash'],
-        'address': log_entry['address'],
-        'blockHash': log_entry['blockHash'],
-        'blockNumber': log_entry['blockNumber'],
-    }
+    def matches(self, log_entry):
+        """
+        Whether the first topic of ``log_entry`` is the topic of this event,
+        which is always the case for anonymous events.
+        """
+        if self.topic is None:
+            return True
+        topics = log_entry['topics']
+        return bool(topics) and topics[0] == self.topic
+
+    def decode(self, log_entry):
+        """
+        Given a log entry for this event, return the decoded event data
+        """
+        if self.topic is None:
+            log_topics = log_entry['topics']
+        elif not log_entry['topics']:
+            raise MismatchedABI("Expected non-anonymous event to have 1 or more topics")
+        elif self.topic != log_entry['topics'][0]:
+            raise MismatchedABI("The event signature did not match the provided ABI")
+        else:
+            log_topics = log_entry['topics'][1:]
+
+        if len(log_topics) != len(self.topic_types):
+            raise ValueError("Expected {0} log topics.  Got {1}".format(
+                len(self.topic_types),
+                len(log_topics),
+            ))
+
+        log_data = hexstr_if_str(to_bytes, log_entry['data'])
+        if not is_bytes(log_data):
+            raise TypeError(
+                "The `data` value must be of bytes type.  Got {0}".format(type(log_data))
+            )
+
+        normalized_log_data = None
+        if self._data_converters is not None:
+            normalized_log_data = convert_words(self._data_converters, memoryview(log_data))
+        if normalized_log_data is None:
+            decoded_log_data = self._data_decoder(ContextFramesBytesIO(log_data))
+            normalized_log_data = self._data_normalizer(decoded_log_data)
+
+        normalized_topic_data = None
+        if self._topic_converters is not None and all(
+                len(topic_data) == 32 for topic_data in log_topics):
+            normalized_topic_data = convert_words(
+                self._topic_converters,
+                memoryview(b''.join(log_topics)),
+            )
+        if normalized_topic_data is None:
+            decoded_topic_data = [
+                decoder(ContextFramesBytesIO(topic_data))
+                for decoder, topic_data
+                in zip(self._topic_decoders, log_topics)
+            ]
+            normalized_topic_data = self._topic_normalizer(decoded_topic_data)
+
+        event_args = dict(itertools.chain(
+            zip(self.topic_names, normalized_topic_data),
+            zip(self.data_names, normalized_log_data),
+        ))
+
+        event_data = {
+            'args': event_args,
+            'event': self.abi['name'],
+            'logIndex': log_entry['logIndex'],
+            'transactionIndex': log_entry['transactionIndex'],
+            'transactionHash': log_entry['transactionHash'],
+            'address': log_entry['address'],
+            'blockHash': log_entry['blockHash'],
+            'blockNumber': log_entry['blockNumber'],
+        }
+
+        return AttributeDict.recursive(event_data)
+
 
-    return AttributeDict.recursive(event_data)
+_event_decoders = IdentityLRU(1024)
+
+
+def get_event_decoder(event_abi):
+    """
+    Returns the :class:`EventDecoder` of ``event_abi``, which is cached by
+    the identity of the ABI dict.
+    """
+    decoder = _event_decoders.get(event_abi)
+    if decoder is None:
+        decoder = EventDecoder(event_abi)
+        _event_decoders.set(event_abi, decoder)
+    return decoder
+
+
+@curry
+def get_event_data(event_abi, log_entry):
+    """
+    Given an event ABI and a log entry for that event, return the decoded
+    event data
+    """
+    return get_event_decoder(event_abi).decode(log_entry)
 
 
 @to_tuple
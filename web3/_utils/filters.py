@@ -1,8 +1,10 @@
 from eth_abi import (
     decode_abi,
+    encode_single,
     is_encodable,
 )
 from eth_abi.grammar import (
+    TupleType,
     parse as parse_type_string,
 )
 from eth_utils import (
@@ -14,6 +16,10 @@ from hexbytes import (
     HexBytes,
 )
 
+from web3._utils.abi import (
+    is_word_type,
+    parse_abi_type,
+)
 from web3._utils.formatters import (
     apply_formatter_if,
 )
@@ -173,7 +179,7 @@ class LogFilter(Filter):
         """
         self.data_filter_set = data_filter_set
         if any(data_filter_set):
-            self.data_filter_set_function = match_fn(data_filter_set)
+            self.data_filter_set_function = compile_match_fn(data_filter_set)
 
     def is_valid_entry(self, entry):
         if not self.data_filter_set:
@@ -195,15 +201,120 @@ def normalize_data_values(type_string, data_value):
     eth-abi v1 returns utf-8 bytes for string values.
     This can be removed once eth-abi v2 is required.
     """
-    _type = parse_type_string(type_string)
+    _type = parse_abi_type(type_string)
     if _type.base == "string":
-        if _type.arrlist is not None:
+        if _type.arrlist:
             return tuple((normalize_to_text(value) for value in data_value))
         else:
             return normalize_to_text(data_value)
     return data_value
 
 
+def get_head_size(abi_type):
+    """
+    Returns the number of bytes taken by a value of ``abi_type`` in the head
+    of an abi encoded tuple, which is a single offset word for dynamic types.
+    """
+    static_size = get_static_size(parse_type_string(abi_type))
+    if static_size is None:
+        return 32
+    return static_size
+
+
+def get_static_size(parsed_type):
+    if parsed_type.arrlist:
+        dimension = parsed_type.arrlist[-1]
+        if not dimension:
+            return None
+        item_size = get_static_size(parsed_type.item_type)
+        if item_size is None:
+            return None
+        return item_size * dimension[0]
+    elif isinstance(parsed_type, TupleType):
+        component_sizes = [
+            get_static_size(component)
+            for component
+            in parsed_type.components
+        ]
+        if None in component_sizes:
+            return None
+        return sum(component_sizes)
+    elif parsed_type.base in {'bytes', 'string'} and not parsed_type.sub:
+        return None
+    else:
+        return 32
+
+
+def compile_match_fn(match_values_and_abi):
+    """Compiles the match function used for filtering non-indexed event
+    arguments, see :func:`match_fn`.
+
+    The match values are validated once, and those of single word types are
+    abi encoded, so that they are compared with the raw words of the log
+    data without decoding it.  The data is only decoded when a value of any
+    other type has to be compared.
+    """
+    abi_types, all_match_values = zip(*match_values_and_abi)
+
+    filters = []
+    head_size = 0
+    for index, (match_values, abi_type) in enumerate(zip(all_match_values, abi_types)):
+        if match_values is not None:
+            match_values = tuple(match_values)
+            is_valid = tuple(is_encodable(abi_type, value) for value in match_values)
+            if is_word_type(abi_type):
+                match_words = tuple(
+                    encode_single(abi_type, value) if valid else None
+                    for value, valid
+                    in zip(match_values, is_valid)
+                )
+                if all(is_valid):
+                    match_words = frozenset(match_words)
+                filters.append((index, abi_type, match_values, head_size, match_words))
+            else:
+                filters.append((index, abi_type, match_values, None, is_valid))
+        head_size += get_head_size(abi_type)
+
+    def raise_wrong_type(value, abi_type):
+        raise ValueError(
+            "Value {0} is of the wrong abi type. "
+            "Expected {1} typed value.".format(value, abi_type))
+
+    def match_data(data):
+        data = bytes(HexBytes(data))
+        decoded_values = None
+        for index, abi_type, match_values, offset, match_words in filters:
+            if offset is not None and len(data) >= head_size:
+                word = data[offset:offset + 32]
+                if isinstance(match_words, frozenset):
+                    if word not in match_words:
+                        return False
+                    continue
+                for value, match_word in zip(match_values, match_words):
+                    if match_word is None:
+                        raise_wrong_type(value, abi_type)
+                    if word == match_word:
+                        break
+                else:
+                    return False
+                continue
+
+            if decoded_values is None:
+                decoded_values = decode_abi(abi_types, data)
+            normalized_data = normalize_data_values(abi_type, decoded_values[index])
+            for value, valid in zip(match_values, match_words):
+                if not valid:
+                    raise_wrong_type(value, abi_type)
+                if value == normalized_data:
+                    break
+            else:
+                return False
+
+        return True
+
+    return match_data
+
+
 @curry
 def match_fn(match_values_and_abi, data):
     """Match function used for filtering non-indexed event arguments.
@@ -211,23 +322,7 @@ def match_fn(match_values_and_abi, data):
     Values provided through the match_values_and_abi parameter are
     compared to the abi decoded log data.
     """
-    abi_types, all_match_values = zip(*match_values_and_abi)
-    decoded_values = decode_abi(abi_types, HexBytes(data))
-    for data_value, match_values, abi_type in zip(decoded_values, all_match_values, abi_types):
-        if match_values is None:
-            continue
-        normalized_data = normalize_data_values(abi_type, data_value)
-        for value in match_values:
-            if not is_encodable(abi_type, value):
-                raise ValueError(
-                    "Value {0} is of the wrong abi type. "
-                    "Expected {1} typed value.".format(value, abi_type))
-            if value == normalized_data:
-                break
-        else:
-            return False
-
-    return True
+    return compile_match_fn(match_values_and_abi)(data)
 
 
 class ShhFilter(Filter):
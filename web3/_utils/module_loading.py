@@ -0,0 +1,65 @@
+import importlib
+import sys
+import types
+
+
+def import_attribute(module_name, attribute_name):
+    return getattr(importlib.import_module(module_name), attribute_name)
+
+
+def lazy_attribute(module_name, attribute_name):
+    """
+    Returns a loader for ``attribute_name`` of the module ``module_name``,
+    which isn't imported until the loader is called.
+    """
+    def load():
+        return import_attribute(module_name, attribute_name)
+    return load
+
+
+class LazyModule(types.ModuleType):
+    """
+    A module which loads some of its attributes when they are first accessed,
+    see :func:`set_lazy_attributes`.
+    """
+    def __getattr__(self, name):
+        try:
+            load = self.__dict__['_lazy_attributes'][name]
+        except KeyError:
+            raise AttributeError(
+                "module {0!r} has no attribute {1!r}".format(self.__name__, name)
+            )
+        value = load()
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()).union(self._lazy_attributes))
+
+
+def set_lazy_attributes(module_name, lazy_attributes):
+    """
+    Makes the attributes of the module ``module_name`` which are named in
+    ``lazy_attributes`` load on first access, by calling their loaders.
+    This keeps rarely used dependencies out of ``import web3``, without
+    module level ``__getattr__``, which needs python 3.7.
+    """
+    module = sys.modules[module_name]
+    module._lazy_attributes = lazy_attributes
+    module.__class__ = LazyModule
+
+
+class LazyClassAttribute:
+    """
+    A class attribute which is loaded by calling ``load`` when it is first
+    accessed, on the class or any of its instances.
+    """
+    def __init__(self, load):
+        self.load = load
+
+    def __get__(self, instance, owner):
+        try:
+            return self.value
+        except AttributeError:
+            self.value = self.load()
+            return self.value
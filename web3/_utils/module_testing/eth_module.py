@@ -517,6 +517,20 @@ class EthModuleTest:
         transaction = block['transactions'][0]
         assert transaction['hash'] == block_with_txn['transactions'][0]
 
+    def test_eth_getBlocks(self, web3, empty_block):
+        current_block_number = web3.eth.blockNumber
+        blocks = web3.eth.getBlocks(0, current_block_number + 1, concurrency=2, batch_size=3)
+        assert [block['number'] for block in blocks] == list(range(current_block_number + 1))
+
+    def test_eth_getBlocks_not_found(self, web3, empty_block):
+        assert list(web3.eth.getBlocks(12345, 12347)) == [None, None]
+
+    def test_eth_getBlocks_full_transactions(self, web3, block_with_txn):
+        block_number = block_with_txn['number']
+        block, = web3.eth.getBlocks(block_number, block_number + 1, full_transactions=True)
+        transaction = block['transactions'][0]
+        assert transaction['hash'] == block_with_txn['transactions'][0]
+
     def test_eth_getTransactionByHash(self, web3, mined_txn_hash):
         transaction = web3.eth.getTransaction(mined_txn_hash)
         assert is_dict(transaction)
@@ -557,6 +571,31 @@ class EthModuleTest:
         assert receipt['transactionIndex'] == 0
         assert receipt['transactionHash'] == HexBytes(mined_txn_hash)
 
+    def test_eth_getTransactionReceipts(self,
+                                        web3,
+                                        block_with_txn,
+                                        mined_txn_hash,
+                                        txn_hash_with_log):
+        receipts = web3.eth.getTransactionReceipts(
+            [txn_hash_with_log, mined_txn_hash, UNKNOWN_HASH],
+            concurrency=2,
+            batch_size=1,
+        )
+        assert len(receipts) == 3
+        assert receipts[0]['transactionHash'] == HexBytes(txn_hash_with_log)
+        assert receipts[1]['transactionHash'] == HexBytes(mined_txn_hash)
+        assert receipts[1]['blockHash'] == block_with_txn['hash']
+        assert receipts[2] is None
+
+    def test_eth_getBlockReceipts(self, web3, block_with_txn, mined_txn_hash):
+        receipts = web3.eth.getBlockReceipts(block_with_txn['number'])
+        assert len(receipts) == len(block_with_txn['transactions'])
+        assert receipts[0]['transactionHash'] == HexBytes(mined_txn_hash)
+        assert receipts[0]['blockHash'] == block_with_txn['hash']
+
+    def test_eth_getBlockReceipts_not_found(self, web3):
+        assert web3.eth.getBlockReceipts(UNKNOWN_HASH) is None
+
     def test_eth_getTransactionReceipt_unmined(self, web3, unlocked_account_dual_type):
         txn_hash = web3.eth.sendTransaction({
             'from': unlocked_account_dual_type,
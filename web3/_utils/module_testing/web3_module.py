@@ -213,5 +213,28 @@ class Web3ModuleTest:
         with pytest.raises(ValueError):
             web3.soliditySha3(types, values)
 
+    def test_soliditySha3Batch(self, web3):
+        types = ['string', 'bool', 'uint16', 'bytes2', 'address']
+        values_list = [
+            [
+                'testing a string!',
+                False,
+                value,
+                '0x5402',
+                "0x49EdDD3769c0712032808D86597B84ac5c2F5614",
+            ]
+            for value
+            in (299, 300)
+        ]
+
+        actual = web3.soliditySha3Batch(types, values_list)
+        assert actual == [web3.soliditySha3(types, values) for values in values_list]
+        assert actual[0] == HexBytes(
+            "0x8cc6eabb25b842715e8ca39e2524ed946759aa37bfb7d4b81829cf5a7e266103"
+        )
+
+        with pytest.raises(ValueError):
+            web3.soliditySha3Batch(types, values_list + [values_list[0][:-1]])
+
     def test_is_connected(self, web3):
         assert web3.isConnected()
@@ -185,6 +185,18 @@ def normalize_address(ens, address):
     return address
 
 
+def normalize_contract_address(web3, address):
+    """
+    Like :func:`normalize_address`, but only sets up ENS for ``web3`` when
+    ``address`` is an ENS name, which makes binding a contract to a plain
+    address cheap.
+    """
+    if is_ens_name(address):
+        return normalize_address(web3.ens, address)
+    else:
+        return normalize_address(None, address)
+
+
 def normalize_bytecode(bytecode):
     if bytecode:
         bytecode = HexBytes(bytecode)
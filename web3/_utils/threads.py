@@ -1,6 +1,11 @@
 """
 A minimal implementation of the various gevent APIs used within this codebase.
 """
+import collections
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+import itertools
 import threading
 import time
 
@@ -116,3 +121,39 @@ def spawn(target, *args, thread_class=ThreadWithReturn, **kwargs):
     thread.daemon = True
     thread.start()
     return thread
+
+
+def concurrent_map(fn, iterable, concurrency, executor=None):
+    """
+    Yields ``fn(item)`` for each item in ``iterable``, in order, running up to
+    ``concurrency`` calls at once on a pool of worker threads.
+
+    Items are only taken from ``iterable`` as results are consumed, so no
+    more than ``concurrency`` results are ever pending.
+
+    The calls are run on ``executor`` when it is given, which is left running
+    for the caller to reuse, and otherwise on a pool created for this map.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be a positive integer, got {0}".format(concurrency))
+
+    items = iter(iterable)
+    owns_executor = executor is None
+    if owns_executor:
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+    pending = collections.deque(
+        executor.submit(fn, item)
+        for item
+        in itertools.islice(items, concurrency)
+    )
+    try:
+        while pending:
+            result = pending.popleft().result()
+            for item in itertools.islice(items, 1):
+                pending.append(executor.submit(fn, item))
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        if owns_executor:
+            executor.shutdown(wait=False)
@@ -15,8 +15,10 @@ try:
         itertoolz,
         merge,
         partial,
+        partition_all,
         pipe,
         sliding_window,
+        unique,
         valfilter,
         valmap,
     )
@@ -37,8 +39,10 @@ except ImportError:
         itertoolz,
         merge,
         partial,
+        partition_all,
         pipe,
         sliding_window,
+        unique,
         valfilter,
         valmap,
     )
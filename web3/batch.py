@@ -0,0 +1,88 @@
+import itertools
+
+from hexbytes import (
+    HexBytes,
+)
+
+from web3._utils.toolz import (
+    partition_all,
+)
+from web3.contract import (
+    decode_function_output,
+    parse_block_identifier,
+    prepare_transaction,
+)
+from web3.snapshot import (
+    PINNED_BLOCK_IDENTIFIERS,
+    get_active_snapshot,
+)
+
+
+class CallBatch:
+    """
+    Collects contract function calls, e.g.
+    ``token.functions.balanceOf(owner)``, and makes all of their
+    ``eth_call`` requests at once, as a single JSON-RPC batch where the
+    provider supports it.  Unlike :class:`web3.multicall.Multicall` this
+    needs no aggregator contract.
+
+    :param batch_size: The maximum number of requests sent in a single batch.
+    """
+    def __init__(self, web3, batch_size=100):
+        self.web3 = web3
+        self.batch_size = batch_size
+        self._calls = []
+
+    def __len__(self):
+        return len(self._calls)
+
+    def add(self, contract_function, transaction=None, block_identifier='latest'):
+        """
+        Adds the call of ``contract_function``, with the same arguments as
+        :meth:`ContractFunction.call`, and returns its index in the results.
+        """
+        call_transaction = prepare_transaction(
+            contract_function.address,
+            self.web3,
+            fn_identifier=contract_function.function_identifier,
+            contract_abi=contract_function.contract_abi,
+            fn_abi=contract_function.abi,
+            transaction=contract_function._get_call_transaction(transaction),
+            fn_args=contract_function.args,
+            fn_kwargs=contract_function.kwargs,
+        )
+        block_id = parse_block_identifier(self.web3, block_identifier)
+        snapshot = get_active_snapshot(self.web3)
+        if snapshot is not None and block_id in PINNED_BLOCK_IDENTIFIERS:
+            block_id = snapshot.block_number
+        self._calls.append((contract_function, call_transaction, block_id))
+        return len(self._calls) - 1
+
+    def execute(self):
+        """
+        Makes all of the calls and returns their results in the order they
+        were added, decoded just like :meth:`ContractFunction.call` decodes
+        them.  The batch is emptied, so it can be reused.
+        """
+        calls, self._calls = self._calls, []
+        return list(itertools.chain.from_iterable(
+            self._execute_batch(batch)
+            for batch
+            in partition_all(self.batch_size, calls)
+        ))
+
+    def _execute_batch(self, calls):
+        return_data = self.web3.manager.request_blocking_batch(
+            ("eth_call", [call_transaction, block_id])
+            for _, call_transaction, block_id
+            in calls
+        )
+        for (contract_function, _, _), result_data in zip(calls, return_data):
+            yield decode_function_output(
+                self.web3,
+                contract_function.address,
+                contract_function._return_data_normalizers,
+                contract_function.function_identifier,
+                contract_function.abi,
+                HexBytes(result_data),
+            )
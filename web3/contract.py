@@ -14,21 +14,21 @@ from eth_abi.exceptions import (
 from eth_utils import (
     add_0x_prefix,
     encode_hex,
-    function_abi_to_4byte_selector,
     is_list_like,
     is_text,
+    to_normalized_address,
     to_tuple,
 )
 from hexbytes import (
     HexBytes,
 )
+import lru
 
 from web3._utils.abi import (
     abi_to_signature,
     check_if_arguments_can_be_encoded,
     fallback_func_abi_exists,
     filter_by_type,
-    get_abi_output_types,
     get_constructor_abi,
     is_array_type,
     map_abi_data,
@@ -38,6 +38,8 @@ from web3._utils.blocks import (
     is_hex_encoded_block_hash,
 )
 from web3._utils.contracts import (
+    compile_contract_abi,
+    compile_function_abi,
     encode_abi,
     find_matching_event_abi,
     find_matching_fn_abi,
@@ -58,9 +60,12 @@ from web3._utils.encoding import (
     to_4byte_hex,
     to_hex,
 )
+from web3._utils.event_columns import (
+    get_event_columns,
+)
 from web3._utils.events import (
     EventFilterBuilder,
-    get_event_data,
+    get_event_decoder,
     is_dynamic_sized_type,
 )
 from web3._utils.filters import (
@@ -72,8 +77,8 @@ from web3._utils.function_identifiers import (
 from web3._utils.normalizers import (
     BASE_RETURN_NORMALIZERS,
     normalize_abi,
-    normalize_address,
     normalize_bytecode,
+    normalize_contract_address,
 )
 from web3._utils.toolz import (
     compose,
@@ -90,6 +95,16 @@ from web3.exceptions import (
     NoABIEventsFound,
     NoABIFunctionsFound,
 )
+from web3.head import (
+    get_head_tracker,
+)
+from web3.router import (
+    get_abi_event_router,
+)
+from web3.snapshot import (
+    PINNED_BLOCK_IDENTIFIERS,
+    get_active_snapshot,
+)
 
 DEPRECATED_SIGNATURE_MESSAGE = (
     "The constructor signature for the `Contract` object has changed. "
@@ -103,22 +118,36 @@ ACCEPTABLE_EMPTY_STRINGS = ["0x", b"0x", "", b""]
 
 class ContractFunctions:
     """Class containing contract function objects
+
+    The contract functions are created on first access.  Those of a
+    contract instance are bound copies of the functions of its factory, so
+    that instantiating a contract for another address is cheap.
     """
 
     def __init__(self, abi, web3, address=None):
         if abi:
             self.abi = abi
-            self._functions = filter_by_type('function', self.abi)
-            for func in self._functions:
-                setattr(
-                    self,
-                    func['name'],
-                    ContractFunction.factory(
-                        func['name'],
-                        web3=web3,
-                        contract_abi=self.abi,
-                        address=address,
-                        function_identifier=func['name']))
+            self._compiled_abi = compile_contract_abi(abi)
+            self._functions = self._compiled_abi.functions
+            self._web3 = web3
+            self._address = address
+            self._unbound_functions = None
+
+    def _bind(self, address):
+        """
+        Returns a copy of these functions bound to ``address``.
+        """
+        bound = object.__new__(type(self))
+        if '_functions' in self.__dict__:
+            bound.__dict__ = {
+                key: value
+                for key, value
+                in self.__dict__.items()
+                if key not in self._compiled_abi.function_names
+            }
+            bound._address = address
+            bound._unbound_functions = self
+        return bound
 
     def __iter__(self):
         if not hasattr(self, '_functions') or not self._functions:
@@ -133,13 +162,24 @@ class ContractFunctions:
                 "The abi for this contract contains no function definitions. ",
                 "Are you sure you provided the correct contract abi?"
             )
-        elif function_name not in self.__dict__['_functions']:
+        elif function_name not in self.__dict__['_compiled_abi'].function_names:
             raise MismatchedABI(
                 "The function '{}' was not found in this contract's abi. ".format(function_name),
                 "Are you sure you provided the correct contract abi?"
             )
+        elif self._unbound_functions is not None:
+            function = copy.copy(getattr(self._unbound_functions, function_name))
+            function.address = self._address
         else:
-            return super().__getattribute__(function_name)
+            function = ContractFunction.factory(
+                function_name,
+                web3=self._web3,
+                contract_abi=self._compiled_abi.abi,
+                compiled_abi=self._compiled_abi,
+                address=self._address,
+                function_identifier=function_name)
+        setattr(self, function_name, function)
+        return function
 
     def __getitem__(self, function_name):
         return getattr(self, function_name)
@@ -147,22 +187,36 @@ class ContractFunctions:
 
 class ContractEvents:
     """Class containing contract event objects
+
+    Like the contract functions, the contract events are created on first
+    access, and those of a contract instance are derived from the events of
+    its factory.
     """
 
     def __init__(self, abi, web3, address=None):
         if abi:
             self.abi = abi
-            self._events = filter_by_type('event', self.abi)
-            for event in self._events:
-                setattr(
-                    self,
-                    event['name'],
-                    ContractEvent.factory(
-                        event['name'],
-                        web3=web3,
-                        contract_abi=self.abi,
-                        address=address,
-                        event_name=event['name']))
+            self._compiled_abi = compile_contract_abi(abi)
+            self._events = self._compiled_abi.events
+            self._web3 = web3
+            self._address = address
+            self._unbound_events = None
+
+    def _bind(self, address):
+        """
+        Returns a copy of these events bound to ``address``.
+        """
+        bound = object.__new__(type(self))
+        if '_events' in self.__dict__:
+            bound.__dict__ = {
+                key: value
+                for key, value
+                in self.__dict__.items()
+                if key not in self._compiled_abi.event_names
+            }
+            bound._address = address
+            bound._unbound_events = self
+        return bound
 
     def __getattr__(self, event_name):
         if '_events' not in self.__dict__:
@@ -170,13 +224,25 @@ class ContractEvents:
                 "The abi for this contract contains no event definitions. ",
                 "Are you sure you provided the correct contract abi?"
             )
-        elif event_name not in self.__dict__['_events']:
+        elif event_name not in self.__dict__['_compiled_abi'].event_names:
             raise MismatchedABI(
                 "The event '{}' was not found in this contract's abi. ".format(event_name),
                 "Are you sure you provided the correct contract abi?"
             )
+        elif self._unbound_events is not None:
+            event = getattr(self._unbound_events, event_name).factory(
+                event_name,
+                address=self._address)
         else:
-            return super().__getattribute__(event_name)
+            event = ContractEvent.factory(
+                event_name,
+                web3=self._web3,
+                contract_abi=self._compiled_abi.abi,
+                compiled_abi=self._compiled_abi,
+                address=self._address,
+                event_name=event_name)
+        setattr(self, event_name, event)
+        return event
 
     def __getitem__(self, event_name):
         return getattr(self, event_name)
@@ -238,14 +304,28 @@ class Contract:
             )
 
         if address:
-            self.address = normalize_address(self.web3.ens, address)
+            self.address = normalize_contract_address(self.web3, address)
 
         if not self.address:
             raise TypeError("The address argument is required to instantiate a contract.")
 
-        self.functions = ContractFunctions(self.abi, self.web3, self.address)
-        self.events = ContractEvents(self.abi, self.web3, self.address)
-        self.fallback = Contract.get_fallback_function(self.abi, self.web3, self.address)
+        cls = type(self)
+        if cls.functions is None:
+            self.functions = ContractFunctions(self.abi, self.web3, self.address)
+        else:
+            self.functions = cls.functions._bind(self.address)
+        if cls.events is None:
+            self.events = ContractEvents(self.abi, self.web3, self.address)
+        else:
+            self.events = cls.events._bind(self.address)
+        fallback = getattr(cls, 'fallback', None)
+        if isinstance(fallback, ContractFunction):
+            self.fallback = copy.copy(fallback)
+            self.fallback.address = self.address
+        elif isinstance(fallback, NonExistentFallbackFunction):
+            self.fallback = fallback
+        else:
+            self.fallback = Contract.get_fallback_function(self.abi, self.web3, self.address)
 
     @classmethod
     def factory(cls, web3, class_name=None, **kwargs):
@@ -254,7 +334,7 @@ class Contract:
 
         normalizers = {
             'abi': normalize_abi,
-            'address': partial(normalize_address, kwargs['web3'].ens),
+            'address': partial(normalize_contract_address, kwargs['web3']),
             'bytecode': normalize_bytecode,
             'bytecode_runtime': normalize_bytecode,
         }
@@ -364,6 +444,34 @@ class Contract:
 
         return encode_abi(cls.web3, fn_abi, fn_arguments, data)
 
+    @combomethod
+    def processReceipt(self, txn_receipt):
+        """
+        Decodes the logs in ``txn_receipt`` of all of the events of this
+        contract in a single pass.  See :meth:`processLogs`.
+        """
+        return self.processLogs(txn_receipt['logs'])
+
+    @combomethod
+    def processLogs(self, log_entries):
+        """
+        Decodes the ``log_entries`` of all of the events of this contract, in
+        a single pass, and returns them in order.  Each log is dispatched on
+        its first topic, and the logs of other events and anonymous events
+        are skipped.  A contract instance only decodes the logs emitted at its
+        own address.
+        """
+        router = get_abi_event_router(self.abi)
+        if self.address is None:
+            return router.processLogs(log_entries)
+        address = to_normalized_address(self.address)
+        return router.processLogs(
+            log_entry
+            for log_entry
+            in log_entries
+            if to_normalized_address(log_entry['address']) == address
+        )
+
     @combomethod
     @deprecated_for("contract.functions.<method name>.estimateGas")
     def estimateGas(self, transaction=None):
@@ -650,7 +758,7 @@ class Contract:
     @combomethod
     def get_function_by_selector(self, selector):
         def callable_check(fn_abi):
-            return encode_hex(function_abi_to_4byte_selector(fn_abi)) == to_4byte_hex(selector)
+            return compile_function_abi(fn_abi).selector == to_4byte_hex(selector)
 
         fns = find_functions_by_identifier(self.abi, self.web3, self.address, callable_check)
         return get_function_by_identifier(fns, 'selector')
@@ -981,6 +1089,7 @@ class ContractFunction:
     function_identifier = None
     web3 = None
     contract_abi = None
+    compiled_abi = None
     abi = None
     transaction = None
     arguments = None
@@ -1014,7 +1123,7 @@ class ContractFunction:
         if self.function_identifier is FallbackFn:
             self.selector = encode_hex(b'')
         elif is_text(self.function_identifier):
-            self.selector = encode_hex(function_abi_to_4byte_selector(self.abi))
+            self.selector = compile_function_abi(self.abi).selector
         else:
             raise TypeError("Unsupported function identifier")
 
@@ -1045,6 +1154,28 @@ class ContractFunction:
         :return: ``Caller`` object that has contract public functions
             and variables exposed as Python methods
         """
+        call_transaction = self._get_call_transaction(transaction)
+
+        if is_block_hash(block_identifier):
+            # resolved by call_contract_function, so its result is cached by hash
+            block_id = block_identifier
+        else:
+            block_id = parse_block_identifier(self.web3, block_identifier)
+
+        return call_contract_function(
+            self.web3,
+            self.address,
+            self._return_data_normalizers,
+            self.function_identifier,
+            call_transaction,
+            block_id,
+            self.contract_abi,
+            self.abi,
+            *self.args,
+            **self.kwargs
+        )
+
+    def _get_call_transaction(self, transaction):
         if transaction is None:
             call_transaction = {}
         else:
@@ -1070,20 +1201,7 @@ class ContractFunction:
                     "Please ensure that this contract instance has an address."
                 )
 
-        block_id = parse_block_identifier(self.web3, block_identifier)
-
-        return call_contract_function(
-            self.web3,
-            self.address,
-            self._return_data_normalizers,
-            self.function_identifier,
-            call_transaction,
-            block_id,
-            self.contract_abi,
-            self.abi,
-            *self.args,
-            **self.kwargs
-        )
+        return call_transaction
 
     def transact(self, transaction=None):
         if transaction is None:
@@ -1227,6 +1345,7 @@ class ContractEvent:
     event_name = None
     web3 = None
     contract_abi = None
+    compiled_abi = None
     abi = None
 
     def __init__(self, *argument_names):
@@ -1240,6 +1359,10 @@ class ContractEvent:
 
     @classmethod
     def _get_event_abi(cls):
+        if cls.compiled_abi is not None:
+            event_abis = cls.compiled_abi.get_events_by_name(cls.event_name)
+            if len(event_abis) == 1:
+                return event_abis[0]
         return find_matching_event_abi(
             cls.contract_abi,
             event_name=cls.event_name)
@@ -1248,11 +1371,22 @@ class ContractEvent:
     def processReceipt(self, txn_receipt):
         return self._parse_logs(txn_receipt)
 
+    @combomethod
+    def processLogColumns(self, log_entries, use_numpy=None):
+        """
+        Decodes the ``log_entries`` for this event into a dictionary of
+        columns, one for each event argument and log field.
+        """
+        return get_event_columns(self._get_event_abi(), log_entries, use_numpy)
+
     @to_tuple
     def _parse_logs(self, txn_receipt):
+        event_decoder = get_event_decoder(self.abi)
         for log in txn_receipt['logs']:
+            if not event_decoder.matches(log):
+                continue
             try:
-                decoded_log = get_event_data(self.abi, log)
+                decoded_log = event_decoder.decode(log)
             except MismatchedABI:
                 continue
             yield decoded_log
@@ -1310,7 +1444,7 @@ class ContractEvent:
             filter_builder.args[arg].match_single(value)
 
         log_filter = filter_builder.deploy(self.web3)
-        log_filter.log_entry_formatter = get_event_data(self._get_event_abi())
+        log_filter.log_entry_formatter = get_event_decoder(self._get_event_abi()).decode
         log_filter.builder = filter_builder
 
         return log_filter
@@ -1319,7 +1453,7 @@ class ContractEvent:
     def build_filter(self):
         builder = EventFilterBuilder(
             self._get_event_abi(),
-            formatter=get_event_data(self._get_event_abi()))
+            formatter=get_event_decoder(self._get_event_abi()).decode)
         builder.address = self.address
         return builder
 
@@ -1344,6 +1478,95 @@ def check_for_forbidden_api_filter_arguments(event_abi, _filters):
                 "method.")
 
 
+# The fields of a call transaction which the cached results are keyed by.
+CACHEABLE_CALL_FIELDS = {'to', 'from', 'data'}
+
+
+def is_read_only_fn_abi(fn_abi):
+    return (
+        fn_abi.get('stateMutability') in {'view', 'pure'} or
+        fn_abi.get('constant', False)
+    )
+
+
+def is_block_hash(block_identifier):
+    return isinstance(block_identifier, bytes) or is_hex_encoded_block_hash(block_identifier)
+
+
+class CallResultCache:
+    """
+    Caches the results of calls to view and pure contract functions made
+    with :meth:`ContractFunction.call`, once it is set with
+    :meth:`web3.eth.Eth.setCallResultCache`.
+
+    Only calls at a block hash, a block number or the block of an active
+    snapshot are cached, and only once that block is at least
+    ``confirmation_blocks`` below the chain head.  Calls at a block hash are
+    cached by the hash and other calls by the block number.  The ``size``
+    most recently used results are kept.
+    """
+    def __init__(self, size=4096, confirmation_blocks=64):
+        self.confirmation_blocks = confirmation_blocks
+        self._results = lru.LRU(size)
+        self._confirmed_block_number = -1
+
+    def __len__(self):
+        return len(self._results)
+
+    def clear(self):
+        self._results.clear()
+
+    def get_key(self, web3, fn_abi, call_transaction, block_identifier):
+        """
+        Returns the key of the result of the call, or ``None`` if it can't be
+        cached.
+        """
+        if not is_read_only_fn_abi(fn_abi):
+            return None
+        if not set(call_transaction).issubset(CACHEABLE_CALL_FIELDS):
+            return None
+
+        if block_identifier in PINNED_BLOCK_IDENTIFIERS:
+            snapshot = get_active_snapshot(web3)
+            if snapshot is None:
+                return None
+            block_key = snapshot.block_number
+        elif is_block_hash(block_identifier):
+            block_key = HexBytes(block_identifier)
+        elif isinstance(block_identifier, int) and block_identifier >= 0:
+            block_key = block_identifier
+        else:
+            return None
+
+        return (
+            call_transaction.get('to'),
+            HexBytes(call_transaction['data']),
+            call_transaction.get('from'),
+            block_key,
+        )
+
+    def get(self, cache_key):
+        return self._results.get(cache_key)
+
+    def set(self, web3, cache_key, block_number, return_data):
+        """
+        Caches the ``return_data`` of the call made at ``block_number``, if
+        that block has enough confirmations.
+        """
+        if self.is_confirmed(web3, block_number):
+            self._results[cache_key] = return_data
+
+    def is_confirmed(self, web3, block_number):
+        # the head is only fetched for blocks above those seen to be confirmed
+        if block_number > self._confirmed_block_number:
+            head_block_number = get_head_tracker(web3).get_block_number()
+            self._confirmed_block_number = max(
+                self._confirmed_block_number,
+                head_block_number - self.confirmation_blocks,
+            )
+        return block_number <= self._confirmed_block_number
+
+
 def call_contract_function(
         web3,
         address,
@@ -1370,18 +1593,62 @@ def call_contract_function(
         fn_kwargs=kwargs,
     )
 
-    if block_id is None:
-        return_data = web3.eth.call(call_transaction)
-    else:
-        return_data = web3.eth.call(call_transaction, block_identifier=block_id)
-
     if fn_abi is None:
         fn_abi = find_matching_fn_abi(contract_abi, function_identifier, args, kwargs)
 
-    output_types = get_abi_output_types(fn_abi)
+    call_result_cache = web3.eth.callResultCache
+    if call_result_cache is None:
+        cache_key = None
+    else:
+        cache_key = call_result_cache.get_key(web3, fn_abi, call_transaction, block_id)
+
+    if cache_key is None:
+        return_data = None
+    else:
+        return_data = call_result_cache.get(cache_key)
+
+    if return_data is None:
+        if is_block_hash(block_id):
+            block_id = parse_block_identifier(web3, block_id)
+
+        if block_id is None:
+            return_data = web3.eth.call(call_transaction)
+        else:
+            return_data = web3.eth.call(call_transaction, block_identifier=block_id)
+
+        if cache_key is not None:
+            if block_id in PINNED_BLOCK_IDENTIFIERS:
+                block_number = get_active_snapshot(web3).block_number
+            else:
+                block_number = block_id
+            call_result_cache.set(web3, cache_key, block_number, return_data)
+
+    return decode_function_output(
+        web3,
+        address,
+        normalizers,
+        function_identifier,
+        fn_abi,
+        return_data,
+    )
+
+
+def decode_function_output(
+        web3,
+        address,
+        normalizers,
+        function_identifier,
+        fn_abi,
+        return_data):
+    """
+    Decodes and normalizes the ``return_data`` of a call to the contract
+    function described by ``fn_abi``.
+    """
+    compiled_fn_abi = compile_function_abi(fn_abi)
+    output_types = compiled_fn_abi.output_types
 
     try:
-        output_data = decode_abi(output_types, return_data)
+        output_data = compiled_fn_abi.decode_output(return_data)
     except DecodingError as e:
         # Provide a more helpful error message than the one provided by
         # eth-abi-utils
@@ -1405,11 +1672,14 @@ def call_contract_function(
             )
         raise BadFunctionCallOutput(msg) from e
 
-    _normalizers = itertools.chain(
-        BASE_RETURN_NORMALIZERS,
-        normalizers,
-    )
-    normalized_data = map_abi_data(_normalizers, output_types, output_data)
+    if normalizers:
+        _normalizers = itertools.chain(
+            BASE_RETURN_NORMALIZERS,
+            normalizers,
+        )
+        normalized_data = map_abi_data(_normalizers, output_types, output_data)
+    else:
+        normalized_data = compiled_fn_abi.normalize_output(output_data)
 
     if len(normalized_data) == 1:
         return normalized_data[0]
@@ -1,6 +1,3 @@
-from eth_account import (
-    Account,
-)
 from eth_utils import (
     apply_to_return_value,
     is_checksum_address,
@@ -27,12 +24,19 @@ from web3._utils.filters import (
     LogFilter,
     TransactionFilter,
 )
+from web3._utils.module_loading import (
+    LazyClassAttribute,
+    import_attribute,
+)
 from web3._utils.threads import (
     Timeout,
+    concurrent_map,
 )
 from web3._utils.toolz import (
     assoc,
+    concat,
     merge,
+    partition_all,
 )
 from web3._utils.transactions import (
     assert_valid_transaction_params,
@@ -54,15 +58,26 @@ from web3.iban import (
 from web3.module import (
     Module,
 )
+from web3.snapshot import (
+    PINNED_BLOCK_IDENTIFIERS,
+    BlockSnapshot,
+    get_active_snapshot,
+)
+
+
+def create_account():
+    return import_attribute('eth_account', 'Account')()
 
 
 class Eth(Module):
-    account = Account()
+    # eth-account is imported on first access
+    account = LazyClassAttribute(create_account)
     defaultAccount = empty
     defaultBlock = "latest"
     defaultContractFactory = Contract
     iban = Iban
     gasPriceStrategy = None
+    callResultCache = None
 
     @deprecated_for("doing nothing at all")
     def enable_unaudited_features(self):
@@ -106,28 +121,44 @@ class Eth(Module):
     def blockNumber(self):
         return self.web3.manager.request_blocking("eth_blockNumber", [])
 
-    def getBalance(self, account, block_identifier=None):
+    def at_block(self, block_identifier='latest'):
+        """
+        Returns a :class:`web3.snapshot.BlockSnapshot` which pins reads of
+        the chain state to a single block.
+        """
+        return BlockSnapshot(self.web3, block_identifier)
+
+    def _request_state_at_block(self, method, params, block_identifier):
+        snapshot = get_active_snapshot(self.web3)
+        if snapshot is not None and block_identifier in PINNED_BLOCK_IDENTIFIERS:
+            return snapshot.request_blocking(method, params)
+
         if block_identifier is None:
             block_identifier = self.defaultBlock
         return self.web3.manager.request_blocking(
+            method,
+            params + [block_identifier],
+        )
+
+    def getBalance(self, account, block_identifier=None):
+        return self._request_state_at_block(
             "eth_getBalance",
-            [account, block_identifier],
+            [account],
+            block_identifier,
         )
 
     def getStorageAt(self, account, position, block_identifier=None):
-        if block_identifier is None:
-            block_identifier = self.defaultBlock
-        return self.web3.manager.request_blocking(
+        return self._request_state_at_block(
             "eth_getStorageAt",
-            [account, position, block_identifier]
+            [account, position],
+            block_identifier,
         )
 
     def getCode(self, account, block_identifier=None):
-        if block_identifier is None:
-            block_identifier = self.defaultBlock
-        return self.web3.manager.request_blocking(
+        return self._request_state_at_block(
             "eth_getCode",
-            [account, block_identifier],
+            [account],
+            block_identifier,
         )
 
     def getBlock(self, block_identifier, full_transactions=False):
@@ -147,6 +178,25 @@ class Eth(Module):
             [block_identifier, full_transactions],
         )
 
+    def getBlocks(self, start, stop, full_transactions=False, concurrency=4, batch_size=100):
+        """
+        Returns an iterator over the blocks numbered from ``start`` up to, but
+        not including, ``stop`` in order, fetching up to ``batch_size`` of
+        them in a single batch with up to ``concurrency`` batches at once.
+        """
+        def get_batch(block_numbers):
+            return self.web3.manager.request_blocking_batch(
+                ('eth_getBlockByNumber', [block_number, full_transactions])
+                for block_number
+                in block_numbers
+            )
+
+        return concat(concurrent_map(
+            get_batch,
+            partition_all(batch_size, range(start, stop)),
+            concurrency,
+        ))
+
     def getBlockTransactionCount(self, block_identifier):
         """
         `eth_getBlockTransactionCountByHash`
@@ -242,6 +292,35 @@ class Eth(Module):
             [transaction_hash],
         )
 
+    def getTransactionReceipts(self, transaction_hashes, concurrency=4, batch_size=100):
+        """
+        Returns the receipts for ``transaction_hashes`` in the same order,
+        fetching up to ``batch_size`` of them in a single batch with up to
+        ``concurrency`` batches at once.
+        """
+        def get_batch(batch_hashes):
+            return self.web3.manager.request_blocking_batch(
+                ('eth_getTransactionReceipt', [transaction_hash])
+                for transaction_hash
+                in batch_hashes
+            )
+
+        return list(concat(concurrent_map(
+            get_batch,
+            partition_all(batch_size, transaction_hashes),
+            concurrency,
+        )))
+
+    def getBlockReceipts(self, block_identifier, concurrency=4, batch_size=100):
+        """
+        Returns the receipts for all transactions in the block specified by
+        ``block_identifier``, in the order of the transactions in the block.
+        """
+        block = self.getBlock(block_identifier)
+        if block is None:
+            return None
+        return self.getTransactionReceipts(block['transactions'], concurrency, batch_size)
+
     def getTransactionCount(self, account, block_identifier=None):
         if block_identifier is None:
             block_identifier = self.defaultBlock
@@ -300,12 +379,10 @@ class Eth(Module):
         if 'from' not in transaction and is_checksum_address(self.defaultAccount):
             transaction = assoc(transaction, 'from', self.defaultAccount)
 
-        # TODO: move to middleware
-        if block_identifier is None:
-            block_identifier = self.defaultBlock
-        return self.web3.manager.request_blocking(
+        return self._request_state_at_block(
             "eth_call",
-            [transaction, block_identifier],
+            [transaction],
+            block_identifier,
         )
 
     def estimateGas(self, transaction, block_identifier=None):
@@ -405,3 +482,6 @@ class Eth(Module):
 
     def setGasPriceStrategy(self, gas_price_strategy):
         self.gasPriceStrategy = gas_price_strategy
+
+    def setCallResultCache(self, call_result_cache):
+        self.callResultCache = call_result_cache
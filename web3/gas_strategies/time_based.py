@@ -18,6 +18,9 @@ from web3.exceptions import (
     InsufficientData,
     ValidationError,
 )
+from web3.head import (
+    get_head_tracker,
+)
 
 MinerData = collections.namedtuple(
     'MinerData',
@@ -27,14 +30,10 @@ Probability = collections.namedtuple('Probability', ['gas_price', 'prob'])
 
 
 def _get_avg_block_time(w3, sample_size):
-    latest = w3.eth.getBlock('latest')
-
-    constrained_sample_size = min(sample_size, latest['number'])
-    if constrained_sample_size == 0:
+    avg_block_time = get_head_tracker(w3).get_average_block_time(sample_size)
+    if avg_block_time is None:
         raise ValidationError('Constrained sample size is 0')
-
-    oldest = w3.eth.getBlock(latest['number'] - constrained_sample_size)
-    return (latest['timestamp'] - oldest['timestamp']) / constrained_sample_size
+    return avg_block_time
 
 
 def _get_raw_miner_data(w3, sample_size):
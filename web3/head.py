@@ -0,0 +1,227 @@
+from collections import (
+    OrderedDict,
+)
+import logging
+import threading
+import time
+import weakref
+
+from eth_utils import (
+    is_dict,
+)
+
+from web3._utils.threads import (
+    TimerClass,
+)
+
+# The number of recent blocks of which the logs bloom is kept.
+MAX_TRACKED_BLOOMS = 256
+
+
+class HeadTracker:
+    """
+    Keeps track of the latest block header, the average block time and the
+    sync status of the chain a ``Web3`` instance is connected to, so that
+    middlewares, gas price strategies and filters can share a single view of
+    the chain head rather than each fetching ``'latest'`` on their own.
+
+    When started with :meth:`start` the tracker polls the node on a
+    background thread and reads are served from the tracked state.
+    Otherwise the state is refreshed lazily by the callers.
+    """
+    logger = logging.getLogger("web3.HeadTracker")
+
+    def __init__(self, web3):
+        # a weak reference, as the trackers are kept by web3 instance
+        self._web3 = weakref.ref(web3)
+        self._lock = threading.RLock()
+        self._latest_block = None
+        self._latest_block_fetched_at = None
+        self._average_block_times = {}
+        self._syncing = None
+        self._syncing_fetched_at = None
+        self._poller = None
+        self._blooms = OrderedDict()
+
+    @property
+    def web3(self):
+        return self._web3()
+
+    @property
+    def is_running(self):
+        return self._poller is not None and self._poller.is_alive()
+
+    @property
+    def latest_block(self):
+        """
+        The most recently seen latest block, or ``None`` if it has not been
+        fetched yet.
+        """
+        return self._latest_block
+
+    def update(self):
+        """
+        Fetches the latest block from the node and returns it.
+        """
+        with self._lock:
+            latest_block = self.web3.eth.getBlock('latest')
+            self._latest_block = latest_block
+            self._latest_block_fetched_at = time.time()
+            self._track_bloom(latest_block)
+            return latest_block
+
+    def _track_bloom(self, block):
+        if not is_dict(block) or block.get('logsBloom') is None or block.get('hash') is None:
+            return
+        block_number = block['number']
+        tracked = self._blooms.get(block_number)
+        if tracked is not None and tracked[0] == block['hash']:
+            return
+
+        # Only blooms of a chain of blocks linked by their parent hashes are
+        # kept, so that those of blocks which were reorganized away are
+        # dropped.
+        parent = self._blooms.get(block_number - 1)
+        if parent is None or parent[0] != block.get('parentHash'):
+            self._blooms.clear()
+        else:
+            for tracked_block_number in list(self._blooms):
+                if tracked_block_number >= block_number:
+                    del self._blooms[tracked_block_number]
+
+        self._blooms[block_number] = (block['hash'], block['logsBloom'])
+        while len(self._blooms) > MAX_TRACKED_BLOOMS:
+            self._blooms.popitem(last=False)
+
+    def get_logs_blooms(self):
+        """
+        Returns the ``logsBloom`` of the recently seen latest blocks, by
+        block number.
+        """
+        with self._lock:
+            return {
+                block_number: logs_bloom
+                for block_number, (_, logs_bloom)
+                in self._blooms.items()
+            }
+
+    def get_latest_block(self, max_age=0):
+        """
+        Returns the latest block, only fetching it from the node if the
+        tracker is not running and the tracked block was fetched more than
+        ``max_age`` seconds ago.
+        """
+        if self.is_running and self._latest_block is not None:
+            return self._latest_block
+        with self._lock:
+            if self._latest_block is not None:
+                if time.time() - self._latest_block_fetched_at < max_age:
+                    return self._latest_block
+            return self.update()
+
+    def get_block_number(self):
+        """
+        Returns the latest block number, using the tracked block while the
+        tracker is running and ``eth_blockNumber`` otherwise.
+        """
+        if self.is_running and self._latest_block is not None:
+            return self._latest_block['number']
+        return self.web3.eth.blockNumber
+
+    def get_syncing(self, max_age=0):
+        """
+        Returns the sync status of the node, only fetching it if the tracker
+        is not running and the tracked status was fetched more than
+        ``max_age`` seconds ago.
+        """
+        if self.is_running and self._syncing_fetched_at is not None:
+            return self._syncing
+        with self._lock:
+            if self._syncing_fetched_at is not None:
+                if time.time() - self._syncing_fetched_at < max_age:
+                    return self._syncing
+            return self._update_syncing()
+
+    def _update_syncing(self):
+        with self._lock:
+            self._syncing = self.web3.eth.syncing
+            self._syncing_fetched_at = time.time()
+            return self._syncing
+
+    def get_average_block_time(self, sample_size):
+        """
+        Returns the average block time over the last ``sample_size`` blocks,
+        or ``None`` if the chain does not have any history yet.
+
+        The average is shared between all callers using the same
+        ``sample_size`` and is only recomputed once the time it takes to mine
+        ``sample_size`` blocks has passed since it was last computed.
+        """
+        with self._lock:
+            if sample_size in self._average_block_times:
+                avg_block_time, avg_block_sample_size, updated_at = (
+                    self._average_block_times[sample_size]
+                )
+                if avg_block_time:
+                    avg_block_time_age_in_blocks = (time.time() - updated_at) / avg_block_time
+                    if avg_block_time_age_in_blocks < avg_block_sample_size:
+                        return avg_block_time
+
+            latest_block = self.update()
+            constrained_sample_size = min(sample_size, latest_block['number'])
+            if constrained_sample_size == 0:
+                avg_block_time = None
+            else:
+                ancestor_block = self.web3.eth.getBlock(
+                    latest_block['number'] - constrained_sample_size,
+                )
+                avg_block_time = (
+                    (latest_block['timestamp'] - ancestor_block['timestamp']) /
+                    constrained_sample_size
+                )
+            self._average_block_times[sample_size] = (
+                avg_block_time,
+                constrained_sample_size,
+                time.time(),
+            )
+            return avg_block_time
+
+    def start(self, poll_interval=1):
+        """
+        Starts polling the node for the latest block and the sync status on
+        a background thread every ``poll_interval`` seconds.
+        """
+        if self.is_running:
+            raise ValueError("The head tracker is already running")
+        self._poller = TimerClass(poll_interval, self._poll)
+        self._poller.daemon = True
+        self._poller.start()
+
+    def stop(self):
+        if self._poller is not None:
+            self._poller.stop()
+            self._poller = None
+
+    def _poll(self):
+        if self.web3 is None:
+            self.stop()
+            return
+        try:
+            self.update()
+            self._update_syncing()
+        except Exception:
+            self.logger.exception("Failed to update the chain head")
+
+
+_head_trackers = weakref.WeakKeyDictionary()
+_head_trackers_lock = threading.Lock()
+
+
+def get_head_tracker(web3):
+    """
+    Returns the :class:`HeadTracker` shared by everything using ``web3``.
+    """
+    with _head_trackers_lock:
+        if web3 not in _head_trackers:
+            _head_trackers[web3] = HeadTracker(web3)
+        return _head_trackers[web3]
@@ -1,11 +1,9 @@
 from eth_utils import (
-    add_0x_prefix,
     apply_to_return_value,
     from_wei,
     is_address,
     is_checksum_address,
     keccak as eth_utils_keccak,
-    remove_0x_prefix,
     to_checksum_address,
     to_wei,
 )
@@ -15,7 +13,7 @@ from hexbytes import (
 
 from ens import ENS
 from web3._utils.abi import (
-    map_abi_data,
+    get_abi_data_normalizer,
 )
 from web3._utils.decorators import (
     combomethod,
@@ -25,21 +23,31 @@ from web3._utils.empty import (
     empty,
 )
 from web3._utils.encoding import (
-    hex_encode_abi_type,
+    get_abi_packer,
     to_bytes,
     to_hex,
     to_int,
     to_text,
 )
+from web3._utils.module_loading import (
+    LazyClassAttribute,
+    lazy_attribute,
+)
 from web3._utils.normalizers import (
     abi_ens_resolver,
 )
 from web3.admin import (
     Admin,
 )
+from web3.batch import (
+    CallBatch,
+)
 from web3.eth import (
     Eth,
 )
+from web3.head import (
+    get_head_tracker,
+)
 from web3.iban import (
     Iban,
 )
@@ -58,20 +66,8 @@ from web3.parity import (
 from web3.personal import (
     Personal,
 )
-from web3.providers.eth_tester import (
-    EthereumTesterProvider,
-)
-from web3.providers.ipc import (
-    IPCProvider,
-)
-from web3.providers.rpc import (
-    HTTPProvider,
-)
-from web3.providers.tester import (
-    TestRPCProvider,
-)
-from web3.providers.websocket import (
-    WebsocketProvider,
+from web3.storage import (
+    StorageReader,
 )
 from web3.testing import (
     Testing,
@@ -99,12 +95,16 @@ def get_default_modules():
 
 
 class Web3:
-    # Providers
-    HTTPProvider = HTTPProvider
-    IPCProvider = IPCProvider
-    TestRPCProvider = TestRPCProvider
-    EthereumTesterProvider = EthereumTesterProvider
-    WebsocketProvider = WebsocketProvider
+    # Providers, imported on first access
+    HTTPProvider = LazyClassAttribute(lazy_attribute('web3.providers.rpc', 'HTTPProvider'))
+    IPCProvider = LazyClassAttribute(lazy_attribute('web3.providers.ipc', 'IPCProvider'))
+    TestRPCProvider = LazyClassAttribute(lazy_attribute('web3.providers.tester', 'TestRPCProvider'))
+    EthereumTesterProvider = LazyClassAttribute(
+        lazy_attribute('web3.providers.eth_tester', 'EthereumTesterProvider'),
+    )
+    WebsocketProvider = LazyClassAttribute(
+        lazy_attribute('web3.providers.websocket', 'WebsocketProvider'),
+    )
 
     # Managers
     RequestManager = RequestManager
@@ -150,6 +150,10 @@ class Web3:
     def providers(self, providers):
         self.manager.providers = providers
 
+    @property
+    def head(self):
+        return get_head_tracker(self)
+
     @staticmethod
     @deprecated_for("This method has been renamed to keccak")
     @apply_to_return_value(HexBytes)
@@ -185,18 +189,54 @@ class Web3:
                 "{0} types and {1} values.".format(len(abi_types), len(values))
             )
 
+        return cls.soliditySha3Batch(abi_types, [values])[0]
+
+    @combomethod
+    def soliditySha3Batch(cls, abi_types, values_list):
+        """
+        Executes :meth:`soliditySha3` for each of the lists of values in
+        ``values_list``, which all have the ``abi_types``.  The values are
+        packed by an encoder which is compiled once for the types.
+        """
+        for values in values_list:
+            if len(abi_types) != len(values):
+                raise ValueError(
+                    "Length mismatch between provided abi types and values.  Got "
+                    "{0} types and {1} values.".format(len(abi_types), len(values))
+                )
+
         if isinstance(cls, type):
             w3 = None
         else:
             w3 = cls
-        normalized_values = map_abi_data([abi_ens_resolver(w3)], abi_types, values)
-
-        hex_string = add_0x_prefix(''.join(
-            remove_0x_prefix(hex_encode_abi_type(abi_type, value))
-            for abi_type, value
-            in zip(abi_types, normalized_values)
-        ))
-        return cls.sha3(hexstr=hex_string)
+        abi_types = tuple(abi_types)
+        normalize = get_abi_data_normalizer((abi_ens_resolver(w3),), abi_types)
+        pack = get_abi_packer(abi_types)
+
+        return [
+            HexBytes(eth_utils_keccak(pack(normalize(values))))
+            for values
+            in values_list
+        ]
+
+    def batch(self, batch_size=100):
+        """
+        Returns a :class:`web3.batch.CallBatch` which makes many contract
+        function calls in a single round trip to the node.
+        """
+        return CallBatch(self, batch_size=batch_size)
+
+    def storage(self, address, block_identifier='latest', batch_size=100):
+        """
+        Returns a :class:`web3.storage.StorageReader` which reads the storage
+        slots of the contract at ``address`` in bulk, at a single block.
+        """
+        return StorageReader(
+            self,
+            address,
+            block_identifier=block_identifier,
+            batch_size=batch_size,
+        )
 
     def isConnected(self):
         for provider in self.providers:
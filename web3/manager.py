@@ -1,3 +1,6 @@
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
 import logging
 import uuid
 
@@ -5,12 +8,18 @@ from eth_utils import (
     is_list_like,
 )
 
+from web3._utils.batching import (
+    BatchCollector,
+)
 from web3._utils.empty import (
     empty,
 )
 from web3._utils.threads import (
     spawn,
 )
+from web3._utils.toolz import (
+    partition_all,
+)
 from web3.datastructures import (
     NamedElementOnion,
 )
@@ -28,9 +37,6 @@ from web3.middleware import (
     request_parameter_normalizer,
     validation_middleware,
 )
-from web3.providers import (
-    AutoProvider,
-)
 
 
 class RequestManager:
@@ -45,12 +51,15 @@ class RequestManager:
 
         self.middleware_stack = NamedElementOnion(middlewares)
         if providers is empty:
+            # imported here, as it imports all of the providers it may use
+            from web3.providers.auto import AutoProvider
             self.providers = AutoProvider()
         else:
             self.providers = providers
 
     web3 = None
     _providers = None
+    max_batch_workers = 100
 
     @property
     def providers(self):
@@ -113,6 +122,44 @@ class RequestManager:
 
         return response['result']
 
+    def request_blocking_batch(self, requests):
+        """
+        Make a number of synchronous requests, given as (method, params)
+        tuples, which are sent to the provider as a single batch.  Each
+        request still passes through all of the middlewares.
+
+        Returns the results in the same order as the requests.  If any of the
+        requests fails, the error of the first one to fail is raised.
+        """
+        requests = list(requests)
+        if not requests:
+            return []
+
+        def make_batched_request(collector, request):
+            with collector.worker():
+                return self._make_request(*request)
+
+        # Every request of a batch needs its own thread, since the batch is
+        # only sent once all of them have reached the provider, so at most
+        # ``max_batch_workers`` requests are sent in each batch.
+        responses = []
+        max_workers = min(len(requests), self.max_batch_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for batch in partition_all(max_workers, requests):
+                collector = BatchCollector(len(batch))
+                futures = [
+                    executor.submit(make_batched_request, collector, request)
+                    for request
+                    in batch
+                ]
+                responses.extend(future.result() for future in futures)
+
+        for response in responses:
+            if "error" in response:
+                raise ValueError(response["error"])
+
+        return [response['result'] for response in responses]
+
     def request_async(self, raw_method, raw_params):
         request_id = uuid.uuid4()
         self.pending_requests[request_id] = spawn(
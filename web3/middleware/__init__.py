@@ -10,9 +10,11 @@ from .cache import (  # noqa: F401
     construct_simple_cache_middleware,
     construct_time_based_cache_middleware,
     construct_latest_block_based_cache_middleware,
+    construct_reorg_aware_cache_middleware,
     _simple_cache_middleware as simple_cache_middleware,
     _time_based_cache_middleware as time_based_cache_middleware,
     _latest_block_based_cache_middleware as latest_block_based_cache_middleware,
+    _reorg_aware_cache_middleware as reorg_aware_cache_middleware,
 )
 from .exception_handling import (  # noqa: F401
     construct_exception_handler_middleware,
@@ -40,6 +42,10 @@ from .normalize_errors import (  # noqa: F401
 from .normalize_request_parameters import (  # noqa: F401
     request_parameter_normalizer,
 )
+from .prefetch import (  # noqa: F401
+    construct_prefetch_middleware,
+    _prefetch_middleware as prefetch_middleware,
+)
 from .pythonic import (  # noqa: F401
     pythonic_middleware,
 )
@@ -47,10 +53,6 @@ from .stalecheck import (  # noqa: F401
     make_stalecheck_middleware,
 )
 
-from .exception_retry_request import (  # noqa: F401
-    http_retry_request_middleware
-)
-
 from .geth_poa import (  # noqa: F401
     geth_poa_middleware,
 )
@@ -59,8 +61,9 @@ from .validation import (  # noqa: F401
     validation_middleware,
 )
 
-from .signing import (  # noqa: F401
-    construct_sign_and_send_raw_middleware,
+from web3._utils.module_loading import (
+    lazy_attribute,
+    set_lazy_attributes,
 )
 
 
@@ -74,3 +77,16 @@ def combine_middlewares(middlewares, web3, provider_request_fn):
         reversed(middlewares),
         provider_request_fn,
     )
+
+
+# these import requests and eth-account, so they are imported on first access
+set_lazy_attributes(__name__, {
+    "http_retry_request_middleware": lazy_attribute(
+        "web3.middleware.exception_retry_request",
+        "http_retry_request_middleware",
+    ),
+    "construct_sign_and_send_raw_middleware": lazy_attribute(
+        "web3.middleware.signing",
+        "construct_sign_and_send_raw_middleware",
+    ),
+})
@@ -2,11 +2,24 @@ import functools
 import threading
 import time
 
+from eth_utils import (
+    is_dict,
+    is_list_like,
+)
+from hexbytes import (
+    HexBytes,
+)
 import lru
 
+from web3._utils.blocks import (
+    to_block_number,
+)
 from web3._utils.caching import (
     generate_cache_key,
 )
+from web3.head import (
+    get_head_tracker,
+)
 
 SIMPLE_CACHE_RPC_WHITELIST = {
     'web3_clientVersion',
@@ -277,11 +290,6 @@ BLOCK_NUMBER_RPC_WHITELIST = {
 }
 
 
-AVG_BLOCK_TIME_KEY = 'avg_block_time'
-AVG_BLOCK_SAMPLE_SIZE_KEY = 'avg_block_sample_size'
-AVG_BLOCK_TIME_UPDATED_AT_KEY = 'avg_block_time_updated_at'
-
-
 def _is_latest_block_number_request(method, params):
     if method != 'eth_getBlockByNumber':
         return False
@@ -312,46 +320,18 @@ def construct_latest_block_based_cache_middleware(
         This middleware avoids re-fetching the current latest block for each
         request by tracking the current average block time and only requesting
         a new block when the last seen latest block is older than the average
-        block time.
+        block time.  Both are read from the head tracker shared by everything
+        using the same ``web3`` instance.
     """
     def latest_block_based_cache_middleware(make_request, web3):
         cache = cache_class()
+        head_tracker = get_head_tracker(web3)
         block_info = {}
 
         def _update_block_info_cache():
-            avg_block_time = block_info.get(AVG_BLOCK_TIME_KEY, default_average_block_time)
-            avg_block_sample_size = block_info.get(AVG_BLOCK_SAMPLE_SIZE_KEY, 0)
-            avg_block_time_updated_at = block_info.get(AVG_BLOCK_TIME_UPDATED_AT_KEY, 0)
-
-            # compute age as counted by number of blocks since the avg_block_time
-            if avg_block_time == 0:
-                avg_block_time_age_in_blocks = avg_block_sample_size
-            else:
-                avg_block_time_age_in_blocks = (
-                    (time.time() - avg_block_time_updated_at) / avg_block_time
-                )
-
-            if avg_block_time_age_in_blocks >= avg_block_sample_size:
-                # If the length of time since the average block time as
-                # measured by blocks is greater than or equal to the number of
-                # blocks sampled then we need to recompute the average block
-                # time.
-                latest_block = web3.eth.getBlock('latest')
-                ancestor_block_number = max(
-                    0,
-                    latest_block['number'] - average_block_time_sample_size,
-                )
-                ancestor_block = web3.eth.getBlock(ancestor_block_number)
-                sample_size = latest_block['number'] - ancestor_block_number
-
-                block_info[AVG_BLOCK_SAMPLE_SIZE_KEY] = sample_size
-                if sample_size != 0:
-                    block_info[AVG_BLOCK_TIME_KEY] = (
-                        (latest_block['timestamp'] - ancestor_block['timestamp']) / sample_size
-                    )
-                else:
-                    block_info[AVG_BLOCK_TIME_KEY] = avg_block_time
-                block_info[AVG_BLOCK_TIME_UPDATED_AT_KEY] = time.time()
+            avg_block_time = head_tracker.get_average_block_time(average_block_time_sample_size)
+            if avg_block_time is None:
+                avg_block_time = default_average_block_time
 
             if 'latest_block' in block_info:
                 latest_block = block_info['latest_block']
@@ -359,10 +339,10 @@ def construct_latest_block_based_cache_middleware(
 
                 # latest block is too old so update cache
                 if time_since_latest_block > avg_block_time:
-                    block_info['latest_block'] = web3.eth.getBlock('latest')
+                    block_info['latest_block'] = head_tracker.get_latest_block()
             else:
                 # latest block has not been fetched so we fetch it.
-                block_info['latest_block'] = web3.eth.getBlock('latest')
+                block_info['latest_block'] = head_tracker.get_latest_block()
 
         lock = threading.Lock()
 
@@ -399,3 +379,288 @@ _latest_block_based_cache_middleware = construct_latest_block_based_cache_middle
     cache_class=functools.partial(lru.LRU, 256),
     rpc_whitelist=BLOCK_NUMBER_RPC_WHITELIST,
 )
+
+
+REORG_AWARE_CACHE_RPC_WHITELIST = {
+    # 'web3_clientVersion',
+    # 'web3_sha3',
+    # 'net_version',
+    # 'net_peerCount',
+    # 'net_listening',
+    # 'eth_protocolVersion',
+    # 'eth_syncing',
+    # 'eth_coinbase',
+    # 'eth_mining',
+    # 'eth_hashrate',
+    # 'eth_gasPrice',
+    # 'eth_accounts',
+    # 'eth_blockNumber',
+    'eth_getBalance',
+    'eth_getStorageAt',
+    'eth_getTransactionCount',
+    # 'eth_getBlockTransactionCountByHash',
+    'eth_getBlockTransactionCountByNumber',
+    # 'eth_getUncleCountByBlockHash',
+    'eth_getUncleCountByBlockNumber',
+    'eth_getCode',
+    # 'eth_sign',
+    # 'eth_sendTransaction',
+    # 'eth_sendRawTransaction',
+    'eth_call',
+    # 'eth_estimateGas',
+    'eth_getBlockByHash',
+    'eth_getBlockByNumber',
+    'eth_getTransactionByHash',
+    'eth_getTransactionByBlockHashAndIndex',
+    'eth_getTransactionByBlockNumberAndIndex',
+    'eth_getTransactionReceipt',
+    # 'eth_getUncleByBlockHashAndIndex',
+    'eth_getUncleByBlockNumberAndIndex',
+    # 'eth_getCompilers',
+    # 'eth_compileLLL',
+    # 'eth_compileSolidity',
+    # 'eth_compileSerpent',
+    # 'eth_newFilter',
+    # 'eth_newBlockFilter',
+    # 'eth_newPendingTransactionFilter',
+    # 'eth_uninstallFilter',
+    # 'eth_getFilterChanges',
+    # 'eth_getFilterLogs',
+    'eth_getLogs',
+    # 'eth_getWork',
+    # 'eth_submitWork',
+    # 'eth_submitHashrate',
+}
+
+BLOCK_IDENTIFIER_PARAM_INDEX = {
+    'eth_getBalance': 1,
+    'eth_getStorageAt': 2,
+    'eth_getTransactionCount': 1,
+    'eth_getBlockTransactionCountByNumber': 0,
+    'eth_getUncleCountByBlockNumber': 0,
+    'eth_getCode': 1,
+    'eth_call': 1,
+    'eth_getBlockByNumber': 0,
+    'eth_getTransactionByBlockNumberAndIndex': 0,
+    'eth_getUncleByBlockNumberAndIndex': 0,
+}
+
+BLOCK_RPC_METHODS = {
+    'eth_getBlockByHash',
+    'eth_getBlockByNumber',
+}
+
+# Requests for a block by hash may return a block which isn't canonical,
+# such as an uncle, so the blocks in their responses aren't tracked.
+BLOCK_HASH_RPC_METHODS = {
+    'eth_getBlockByHash',
+    'eth_getBlockTransactionCountByHash',
+    'eth_getTransactionByBlockHashAndIndex',
+    'eth_getUncleByBlockHashAndIndex',
+    'eth_getUncleCountByBlockHash',
+}
+
+
+def _get_pinned_block_number(method, params, result):
+    """
+    Returns the highest block number that the response for this request
+    depends upon, or ``None`` if the response cannot be pinned to a concrete
+    block.
+    """
+    if method in BLOCK_IDENTIFIER_PARAM_INDEX:
+        param_index = BLOCK_IDENTIFIER_PARAM_INDEX[method]
+        if len(params) <= param_index:
+            # the node defaults to 'latest'
+            return None
+        return to_block_number(params[param_index])
+    elif method == 'eth_getLogs':
+        filter_params = params[0] if params else {}
+        return to_block_number(filter_params.get('toBlock', 'latest'))
+    elif is_dict(result):
+        return to_block_number(result.get('blockNumber', result.get('number')))
+    else:
+        return None
+
+
+def _iter_block_references(method, result):
+    """
+    Yields ``(block_number, block_hash, parent_hash)`` tuples for the blocks
+    referenced by a response, which are part of the canonical chain.
+    ``parent_hash`` is only known for responses which are full blocks.
+    """
+    if method in BLOCK_HASH_RPC_METHODS:
+        return
+    elif method in BLOCK_RPC_METHODS:
+        if is_dict(result) and result.get('hash') is not None:
+            yield (
+                to_block_number(result['number']),
+                HexBytes(result['hash']),
+                HexBytes(result['parentHash']),
+            )
+    elif method == 'eth_getLogs':
+        if is_list_like(result):
+            for log_entry in result:
+                if log_entry.get('blockHash') is not None and not log_entry.get('removed'):
+                    yield (
+                        to_block_number(log_entry['blockNumber']),
+                        HexBytes(log_entry['blockHash']),
+                        None,
+                    )
+    elif is_dict(result) and result.get('blockHash') is not None:
+        yield (
+            to_block_number(result['blockNumber']),
+            HexBytes(result['blockHash']),
+            None,
+        )
+
+
+def construct_reorg_aware_cache_middleware(
+        cache_class,
+        rpc_whitelist=REORG_AWARE_CACHE_RPC_WHITELIST,
+        max_reorg_depth=64,
+        head_poll_interval=1,
+        should_cache_fn=_should_cache):
+    """
+    Constructs a middleware which caches responses that are pinned to a
+    concrete block, and evicts them when a chain reorganization replaces
+    that block or any block below it.
+
+    :param cache: Any dictionary-like object
+    :param rpc_whitelist: A set of RPC methods which may have their responses cached.
+    :param max_reorg_depth: The number of most recent block heights for which
+        the canonical block hash is tracked.  Reorganizations deeper than this
+        are not detected.
+    :param head_poll_interval: The minimum number of seconds between checks
+        of the ``'latest'`` block for a reorganization.
+    :param should_cache_fn: A callable which accepts ``method`` ``params`` and
+        ``response`` and returns a boolean as to whether the response should be
+        cached.
+
+    .. note::
+        Requests which resolve to ``'latest'`` or ``'pending'``, or to a
+        block above the current head, are never cached.  Block hashes seen
+        in block, transaction, receipt and log responses are compared
+        against the tracked canonical hashes, so a reorganization is also
+        detected as soon as a response references a block which replaced a
+        previously seen one.  Blocks requested by hash may be uncles, so
+        those responses aren't compared.
+    """
+    def reorg_aware_cache_middleware(make_request, web3):
+        cache = cache_class()
+        canonical_hashes = {}
+        cache_keys_by_block_number = {}
+        head_tracker = get_head_tracker(web3)
+
+        def _evict_from(fork_block_number):
+            for block_number in tuple(cache_keys_by_block_number):
+                if block_number >= fork_block_number:
+                    for cache_key in cache_keys_by_block_number.pop(block_number):
+                        if cache_key in cache:
+                            del cache[cache_key]
+
+        def _prune(head_block_number):
+            oldest_tracked = head_block_number - max_reorg_depth
+            for block_number in tuple(canonical_hashes):
+                if block_number < oldest_tracked:
+                    del canonical_hashes[block_number]
+            for block_number in tuple(cache_keys_by_block_number):
+                if block_number < oldest_tracked:
+                    del cache_keys_by_block_number[block_number]
+
+        def _record_canonical_block(block_number, block_hash, parent_hash=None):
+            top_block_number = block_number
+            fork_block_number = None
+            if canonical_hashes:
+                lowest_block_number = max(
+                    min(canonical_hashes),
+                    top_block_number - max_reorg_depth,
+                )
+            else:
+                lowest_block_number = top_block_number
+
+            # walk down the new chain until it joins the tracked chain,
+            # filling in any heights that were skipped since the last check.
+            while True:
+                if canonical_hashes.get(block_number, block_hash) != block_hash:
+                    fork_block_number = block_number
+                canonical_hashes[block_number] = block_hash
+
+                parent_block_number = block_number - 1
+                if parent_block_number < lowest_block_number:
+                    break
+                elif parent_hash is None:
+                    if fork_block_number is None and block_number == top_block_number:
+                        break
+                    block = web3.eth.getBlock(block_hash)
+                    if block is None:
+                        break
+                    parent_hash = HexBytes(block['parentHash'])
+
+                if canonical_hashes.get(parent_block_number) == parent_hash:
+                    break
+                block_number, block_hash, parent_hash = parent_block_number, parent_hash, None
+
+            if fork_block_number is not None:
+                for block_number in tuple(canonical_hashes):
+                    if block_number > top_block_number:
+                        del canonical_hashes[block_number]
+                _evict_from(fork_block_number)
+
+            _prune(max(canonical_hashes))
+
+        def _update_head():
+            latest_block = head_tracker.get_latest_block(max_age=head_poll_interval)
+            head_block_number = to_block_number(latest_block['number'])
+            _record_canonical_block(
+                head_block_number,
+                HexBytes(latest_block['hash']),
+                HexBytes(latest_block['parentHash']),
+            )
+            return head_block_number
+
+        lock = threading.Lock()
+
+        def middleware(method, params):
+            lock_acquired = lock.acquire(blocking=False)
+
+            try:
+                if lock_acquired and method in rpc_whitelist:
+                    head_block_number = _update_head()
+                    cache_key = generate_cache_key((method, params))
+                    if cache_key in cache:
+                        return cache[cache_key]
+
+                    response = make_request(method, params)
+                    if not should_cache_fn(method, params, response):
+                        return response
+
+                    result = response['result']
+                    for block_number, block_hash, parent_hash in _iter_block_references(
+                            method,
+                            result):
+                        _record_canonical_block(block_number, block_hash, parent_hash)
+
+                    # responses pinned to a block above the head may change
+                    # once it is mined, e.g. logs up to a future block
+                    pinned_block_number = _get_pinned_block_number(method, params, result)
+                    if (pinned_block_number is not None and
+                            pinned_block_number <= head_block_number):
+                        cache[cache_key] = response
+                        cache_keys_by_block_number.setdefault(
+                            pinned_block_number,
+                            set(),
+                        ).add(cache_key)
+                    return response
+                else:
+                    return make_request(method, params)
+            finally:
+                if lock_acquired:
+                    lock.release()
+        return middleware
+    return reorg_aware_cache_middleware
+
+
+_reorg_aware_cache_middleware = construct_reorg_aware_cache_middleware(
+    cache_class=functools.partial(lru.LRU, 256),
+    rpc_whitelist=REORG_AWARE_CACHE_RPC_WHITELIST,
+)
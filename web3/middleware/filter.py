@@ -1,3 +1,6 @@
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
 import itertools
 import os
 
@@ -7,16 +10,55 @@ from eth_utils import (
     to_list,
 )
 
+from web3._utils.bloom import (
+    BloomQuery,
+)
+from web3._utils.threads import (
+    concurrent_map,
+)
 from web3._utils.toolz import (
     concat,
     valfilter,
 )
+from web3.head import (
+    get_head_tracker,
+)
 
 if 'WEB3_MAX_BLOCK_REQUEST' in os.environ:
-    MAX_BLOCK_REQUEST = os.environ['WEB3_MAX_BLOCK_REQUEST']
+    MAX_BLOCK_REQUEST = int(os.environ['WEB3_MAX_BLOCK_REQUEST'])
 else:
     MAX_BLOCK_REQUEST = 50
 
+if 'WEB3_MAX_LOGS_PER_REQUEST' in os.environ:
+    MAX_LOGS_PER_REQUEST = int(os.environ['WEB3_MAX_LOGS_PER_REQUEST'])
+else:
+    MAX_LOGS_PER_REQUEST = 1000
+
+if 'WEB3_LOG_REQUEST_CONCURRENCY' in os.environ:
+    LOG_REQUEST_CONCURRENCY = int(os.environ['WEB3_LOG_REQUEST_CONCURRENCY'])
+else:
+    LOG_REQUEST_CONCURRENCY = 4
+
+MAX_ADAPTIVE_BLOCK_REQUEST = 100000
+
+# The JSON-RPC error code for a request which exceeds a limit of the node,
+# see EIP-1474.
+LIMIT_EXCEEDED_ERROR_CODE = -32005
+
+# Fragments of the error messages which providers that don't use the
+# ``LIMIT_EXCEEDED_ERROR_CODE`` return when an ``eth_getLogs`` request
+# matches too many logs or spans too many blocks.
+TOO_MANY_LOGS_ERROR_MESSAGES = (
+    # go-ethereum and Infura
+    'query returned more than',
+    # Alchemy
+    'log response size exceeded',
+    # Ankr
+    'block range is too wide',
+    # BNB Smart Chain and other go-ethereum forks
+    'exceed maximum block range',
+)
+
 
 def segment_count(start, stop, step=5):
     """Creates a segment counting generator
@@ -108,6 +150,7 @@ def iter_latest_block(w3, to_block=None):
     >>>
     """
     _last = None
+    head_tracker = get_head_tracker(w3)
 
     is_bounded_range = (
         to_block is not None and
@@ -115,7 +158,7 @@ def iter_latest_block(w3, to_block=None):
     )
 
     while True:
-        latest_block = w3.eth.blockNumber
+        latest_block = head_tracker.get_block_number()
         if is_bounded_range and latest_block > to_block:
             return
         #  No new blocks since last iteration.
@@ -155,28 +198,106 @@ def drop_items_with_none_value(params):
     return valfilter(lambda x: x is not None, params)
 
 
+def is_too_many_logs_error(error):
+    error_info = error.args[0] if error.args else None
+    if isinstance(error_info, dict):
+        if error_info.get('code') == LIMIT_EXCEEDED_ERROR_CODE:
+            return True
+        message = str(error_info.get('message', '')).lower()
+    else:
+        message = str(error).lower()
+    return any(fragment in message for fragment in TOO_MANY_LOGS_ERROR_MESSAGES)
+
+
+def get_logs_in_range(w3, from_block, to_block, address, topics):
+    """Returns the logs for the inclusive range ``from_block`` to ``to_block``
+
+    If the node rejects the request for matching too many logs the range is
+    bisected until every part of it can be fetched.
+
+    :return: a 2-tuple of the logs and whether the range had to be bisected.
+    """
+    params = {
+        'fromBlock': from_block,
+        'toBlock': to_block,
+        'address': address,
+        'topics': topics
+    }
+    try:
+        return w3.eth.getLogs(drop_items_with_none_value(params)), False
+    except ValueError as err:
+        if from_block == to_block or not is_too_many_logs_error(err):
+            raise
+
+    middle_block = from_block + (to_block - from_block) // 2
+    lower_logs, _ = get_logs_in_range(w3, from_block, middle_block, address, topics)
+    upper_logs, _ = get_logs_in_range(w3, middle_block + 1, to_block, address, topics)
+    return list(lower_logs) + list(upper_logs), True
+
+
 def get_logs_multipart(
         w3,
         startBlock,
         stopBlock,
         address,
         topics,
-        max_blocks):
+        max_blocks,
+        max_logs=MAX_LOGS_PER_REQUEST,
+        concurrency=LOG_REQUEST_CONCURRENCY,
+        blooms=None):
     """Used to break up requests to ``eth_getLogs``
 
-    The getLog request is partitioned into multiple calls of the max number of blocks
-    ``max_blocks``.
+    The getLog request is partitioned into multiple calls, starting with
+    ``max_blocks`` blocks per call.  Up to ``concurrency`` consecutive calls
+    are made at once and the logs are yielded in block order.
+
+    After each round of calls the number of blocks per call is adapted to the
+    results: it grows while calls return fewer than half of ``max_logs``
+    logs and shrinks when they return more than ``max_logs`` logs or the node
+    rejects them for matching too many logs.
+
+    ``blooms`` optionally maps block numbers to the ``logsBloom`` of already
+    fetched headers.  Calls are skipped, or narrowed, when the blooms of all
+    of the blocks of their range show that it has no matching logs.
     """
-    _block_ranges = block_ranges(startBlock, stopBlock, max_blocks)
-    for from_block, to_block in _block_ranges:
-        params = {
-            'fromBlock': from_block,
-            'toBlock': to_block,
-            'address': address,
-            'topics': topics
-        }
-        yield w3.eth.getLogs(
-            drop_items_with_none_value(params))
+    if blooms:
+        bloom_query = BloomQuery(address, topics)
+    else:
+        bloom_query = None
+
+    def get_chunk_logs(block_range):
+        if bloom_query is not None:
+            block_range = bloom_query.narrow_block_range(*block_range, blooms)
+            if block_range is None:
+                return [], False
+        return get_logs_in_range(w3, *block_range, address, topics)
+
+    chunk_size = max_blocks
+    from_block = startBlock
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        while from_block <= stopBlock:
+            chunk_ranges = tuple(itertools.islice(
+                block_ranges(from_block, stopBlock, chunk_size),
+                concurrency,
+            ))
+
+            results = tuple(concurrent_map(
+                get_chunk_logs,
+                chunk_ranges,
+                concurrency,
+                executor=executor,
+            ))
+            for logs, _ in results:
+                yield logs
+
+            from_block = chunk_ranges[-1][1] + 1
+            most_logs = max(len(logs) for logs, _ in results)
+            if any(was_bisected for _, was_bisected in results):
+                chunk_size = max(1, chunk_size // 2)
+            elif most_logs > max_logs:
+                chunk_size = max(1, chunk_size * max_logs // most_logs)
+            elif most_logs < max_logs // 2:
+                chunk_size = min(chunk_size * 2, MAX_ADAPTIVE_BLOCK_REQUEST)
 
 
 class RequestLogs:
@@ -192,7 +313,7 @@ class RequestLogs:
         self.topics = topics
         self.w3 = w3
         if from_block is None or from_block == 'latest':
-            self._from_block = w3.eth.blockNumber + 1
+            self._from_block = get_head_tracker(w3).get_block_number() + 1
         else:
             self._from_block = from_block
         self._to_block = to_block
@@ -205,9 +326,9 @@ class RequestLogs:
     @property
     def to_block(self):
         if self._to_block is None:
-            to_block = self.w3.eth.blockNumber
+            to_block = get_head_tracker(self.w3).get_block_number()
         elif self._to_block == 'latest':
-            to_block = self.w3.eth.blockNumber
+            to_block = get_head_tracker(self.w3).get_block_number()
         else:
             to_block = self._to_block
 
@@ -217,6 +338,7 @@ class RequestLogs:
         for start, stop in iter_latest_block_ranges(self.w3, self.from_block, self.to_block):
             if None in (start, stop):
                 yield []
+                continue
 
             yield list(
                 concat(
@@ -226,7 +348,8 @@ class RequestLogs:
                         stop,
                         self.address,
                         self.topics,
-                        max_blocks=MAX_BLOCK_REQUEST)))
+                        max_blocks=MAX_BLOCK_REQUEST,
+                        blooms=get_head_tracker(self.w3).get_logs_blooms())))
 
     def get_logs(self):
         return list(
@@ -237,7 +360,8 @@ class RequestLogs:
                     self.to_block,
                     self.address,
                     self.topics,
-                    max_blocks=MAX_BLOCK_REQUEST)))
+                    max_blocks=MAX_BLOCK_REQUEST,
+                    blooms=get_head_tracker(self.w3).get_logs_blooms())))
 
 
 FILTER_PARAMS_KEY_MAP = {
@@ -257,7 +381,7 @@ FILTER_CHANGES_METHODS = set([
 class RequestBlocks:
     def __init__(self, w3):
         self.w3 = w3
-        self.start_block = w3.eth.blockNumber + 1
+        self.start_block = get_head_tracker(w3).get_block_number() + 1
 
     @property
     def filter_changes(self):
@@ -277,8 +401,8 @@ class RequestBlocks:
 @to_list
 def block_hashes_in_range(w3, block_range):
     from_block, to_block = block_range
-    for block_number in range(from_block, to_block + 1):
-        yield getattr(w3.eth.getBlock(block_number), 'hash', None)
+    for block in w3.eth.getBlocks(from_block, to_block + 1):
+        yield getattr(block, 'hash', None)
 
 
 def local_filter_middleware(make_request, w3):
@@ -0,0 +1,204 @@
+import collections
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+import threading
+
+from eth_utils import (
+    is_dict,
+    is_integer,
+    is_list_like,
+    is_text,
+)
+from hexbytes import (
+    HexBytes,
+)
+import lru
+
+from web3._utils.blocks import (
+    to_block_number,
+)
+from web3._utils.caching import (
+    generate_cache_key,
+)
+from web3._utils.encoding import (
+    to_hex,
+)
+
+BLOCK_PREFETCH_RPC_METHODS = {
+    'eth_getBlockByNumber',
+}
+
+BLOCK_TRANSACTIONS_RPC_METHODS = {
+    'eth_getBlockByHash',
+    'eth_getBlockByNumber',
+}
+
+RECEIPT_PREFETCH_RPC_METHODS = {
+    'eth_getTransactionReceipt',
+}
+
+
+def _advance_block_identifier(block_identifier, offset):
+    """
+    Returns the block number ``offset`` blocks after ``block_identifier`` in
+    the same representation as ``block_identifier``.
+    """
+    block_number = to_block_number(block_identifier) + offset
+    if is_integer(block_identifier):
+        return block_number
+    else:
+        return hex(block_number)
+
+
+def _to_transaction_hash(transaction):
+    if is_dict(transaction):
+        return HexBytes(transaction['hash'])
+    else:
+        return HexBytes(transaction)
+
+
+def _is_usable_response(response):
+    # Anything which may change by the time it is actually requested, like a
+    # block past the current chain head, is fetched again.
+    return 'error' not in response and response.get('result') is not None
+
+
+def construct_prefetch_middleware(
+        prefetch_depth=8,
+        max_workers=4,
+        max_tracked_blocks=16):
+    """
+    Constructs a middleware which detects forward sequential reads of blocks
+    by number and of the receipts of consecutive transactions within a block
+    and concurrently fetches the next ``prefetch_depth`` items ahead of the
+    caller.
+
+    :param prefetch_depth: The number of items fetched ahead of the last
+        sequential request.
+    :param max_workers: The maximum number of concurrent prefetch requests.
+    :param max_tracked_blocks: The number of recently seen blocks whose
+        transaction order is remembered for prefetching receipts.
+    """
+    def prefetch_middleware(make_request, web3):
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        lock = threading.Lock()
+        prefetched = collections.OrderedDict()
+        last_positions = lru.LRU(max_tracked_blocks + 2)
+        block_transactions = lru.LRU(max_tracked_blocks)
+        transaction_positions = {}
+
+        def _track_block_transactions(block):
+            if not is_dict(block) or not is_list_like(block.get('transactions')):
+                return
+            block_hash = HexBytes(block['hash'])
+            transaction_hashes = tuple(
+                _to_transaction_hash(transaction)
+                for transaction
+                in block['transactions']
+            )
+            block_transactions[block_hash] = transaction_hashes
+            for index, transaction_hash in enumerate(transaction_hashes):
+                transaction_positions[transaction_hash] = (block_hash, index)
+
+            # forget the positions of transactions whose block is no longer tracked
+            if len(transaction_positions) > sum(map(len, block_transactions.values())):
+                for transaction_hash, (block_hash, _) in tuple(transaction_positions.items()):
+                    if block_hash not in block_transactions:
+                        del transaction_positions[transaction_hash]
+
+        def _get_next_block_requests(method, params):
+            block_identifier = params[0]
+            block_number = to_block_number(block_identifier)
+            if block_number is None:
+                return ()
+
+            stream_key = (method, bool(params[1:2] and params[1]))
+            is_sequential = last_positions.get(stream_key) == block_number - 1
+            last_positions[stream_key] = block_number
+
+            if not is_sequential:
+                return ()
+            return tuple(
+                (method, [_advance_block_identifier(block_identifier, offset)] + list(params[1:]))
+                for offset
+                in range(1, prefetch_depth + 1)
+            )
+
+        def _get_next_receipt_requests(method, params):
+            transaction_hash = params[0]
+            position = transaction_positions.get(HexBytes(transaction_hash))
+            if position is None:
+                return ()
+
+            block_hash, index = position
+            stream_key = (method, block_hash)
+            is_sequential = last_positions.get(stream_key) == index - 1
+            last_positions[stream_key] = index
+
+            transaction_hashes = block_transactions.get(block_hash)
+            if not is_sequential or transaction_hashes is None:
+                return ()
+            if is_text(transaction_hash):
+                return tuple(
+                    (method, [to_hex(next_hash)])
+                    for next_hash
+                    in transaction_hashes[index + 1:index + 1 + prefetch_depth]
+                )
+            return tuple(
+                (method, [next_hash])
+                for next_hash
+                in transaction_hashes[index + 1:index + 1 + prefetch_depth]
+            )
+
+        def _schedule(next_requests):
+            for next_method, next_params in next_requests:
+                request_key = generate_cache_key((next_method, next_params))
+                if request_key not in prefetched:
+                    prefetched[request_key] = executor.submit(
+                        make_request,
+                        next_method,
+                        next_params,
+                    )
+
+            # only keep a bounded number of prefetched responses around.
+            while len(prefetched) > prefetch_depth * 2:
+                _, stale_future = prefetched.popitem(last=False)
+                stale_future.cancel()
+
+        def middleware(method, params):
+            if method in BLOCK_PREFETCH_RPC_METHODS:
+                get_next_requests = _get_next_block_requests
+            elif method in RECEIPT_PREFETCH_RPC_METHODS:
+                get_next_requests = _get_next_receipt_requests
+            elif method in BLOCK_TRANSACTIONS_RPC_METHODS:
+                get_next_requests = None
+            else:
+                return make_request(method, params)
+
+            with lock:
+                future = prefetched.pop(generate_cache_key((method, params)), None)
+                if get_next_requests is not None:
+                    _schedule(get_next_requests(method, params))
+
+            response = None
+            if future is not None and not future.cancelled():
+                try:
+                    response = future.result()
+                except Exception:
+                    response = None
+                if response is not None and not _is_usable_response(response):
+                    response = None
+
+            if response is None:
+                response = make_request(method, params)
+
+            if method in BLOCK_TRANSACTIONS_RPC_METHODS and 'result' in response:
+                with lock:
+                    _track_block_transactions(response['result'])
+            return response
+        return middleware
+    return prefetch_middleware
+
+
+_prefetch_middleware = construct_prefetch_middleware()
@@ -3,6 +3,9 @@ import time
 from web3.exceptions import (
     StaleBlockchain,
 )
+from web3.head import (
+    get_head_tracker,
+)
 
 SKIP_STALECHECK_FOR_METHODS = set([
     'eth_getBlockByNumber',
@@ -30,17 +33,15 @@ def make_stalecheck_middleware(
         raise ValueError("You must set a positive allowable_delay in seconds for this middleware")
 
     def stalecheck_middleware(make_request, web3):
-        cache = {'latest': None}
+        head_tracker = get_head_tracker(web3)
 
         def middleware(method, params):
             if method not in skip_stalecheck_for_methods:
-                if _isfresh(cache['latest'], allowable_delay):
+                if _isfresh(head_tracker.latest_block, allowable_delay):
                     pass
                 else:
-                    latest = web3.eth.getBlock('latest')
-                    if _isfresh(latest, allowable_delay):
-                        cache['latest'] = latest
-                    else:
+                    latest = head_tracker.get_latest_block()
+                    if not _isfresh(latest, allowable_delay):
                         raise StaleBlockchain(latest, allowable_delay)
 
             return make_request(method, params)
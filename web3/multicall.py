@@ -0,0 +1,261 @@
+import itertools
+
+from eth_abi import (
+    decode_abi,
+    encode_abi,
+)
+from eth_utils import (
+    encode_hex,
+    function_signature_to_4byte_selector,
+    to_bytes,
+)
+
+from web3._utils.assembly import (
+    assemble,
+    get_deploy_code,
+)
+from web3._utils.empty import (
+    empty,
+)
+from web3._utils.toolz import (
+    partition_all,
+)
+from web3.contract import (
+    decode_function_output,
+    parse_block_identifier,
+)
+
+TRY_AGGREGATE_SELECTOR = function_signature_to_4byte_selector(
+    'tryAggregate(bool,(address,bytes)[])'
+)
+
+# A minimal aggregator contract implementing the
+# ``tryAggregate(bool requireSuccess, (address target, bytes callData)[] calls)``
+# function of the widely deployed Multicall2 contract.  Each call is made in
+# order and its success flag and return data are returned as
+# ``(bool success, bytes returnData)[]``.  If ``requireSuccess`` is true the
+# whole call reverts when any of the calls fails.
+MULTICALL_ABI = [
+    {
+        "constant": False,
+        "inputs": [
+            {"name": "requireSuccess", "type": "bool"},
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+                "name": "calls",
+                "type": "tuple[]",
+            },
+        ],
+        "name": "tryAggregate",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+                "name": "returnData",
+                "type": "tuple[]",
+            },
+        ],
+        "payable": False,
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+]
+
+# The runtime code of the aggregator contract.  It uses a fixed memory layout:
+#
+#   0x00  requireSuccess
+#   0x20  the calldata offset of the length of ``calls``
+#   0x40  the number of calls
+#   0x60  the index of the current call
+#   0x80  where the result of the current call is written
+#   0xa0  the calldata offset of the current ``(target, callData)`` tuple
+#   0xc0  the calldata offset of the length of its ``callData``
+#   0xe0  the length of its ``callData``
+#   0x100 the ABI encoded ``(bool, bytes)[]`` return data: its offset, the
+#         number of results, the offsets of the results from 0x140 and then
+#         the results themselves
+#
+# Each call's input is copied to where its result is written, as the call
+# data of the call, and is then overwritten by the result.
+MULTICALL_ASSEMBLY = (
+    # revert unless the function selector is that of tryAggregate
+    ('PUSH1', 0x00), 'CALLDATALOAD',
+    ('PUSH29', 1 << 224), 'SWAP1', 'DIV',
+    ('PUSH4', int.from_bytes(TRY_AGGREGATE_SELECTOR, 'big')), 'EQ',
+    ('PUSH2', 'try_aggregate'), 'JUMPI',
+    ('PUSH1', 0x00), 'DUP1', 'REVERT',
+
+    ('JUMPDEST', 'try_aggregate'),
+    # the function isn't payable
+    'CALLVALUE', ('PUSH2', 'revert'), 'JUMPI',
+    # mem[0x00] = requireSuccess
+    ('PUSH1', 0x04), 'CALLDATALOAD', ('PUSH1', 0x00), 'MSTORE',
+    # mem[0x20] = 4 + the offset of calls
+    ('PUSH1', 0x24), 'CALLDATALOAD', ('PUSH1', 0x04), 'ADD', ('PUSH1', 0x20), 'MSTORE',
+    # mem[0x40] = calls.length
+    ('PUSH1', 0x20), 'MLOAD', 'CALLDATALOAD', ('PUSH1', 0x40), 'MSTORE',
+    # the return data starts with the offset and the length of the array
+    ('PUSH1', 0x20), ('PUSH2', 0x100), 'MSTORE',
+    ('PUSH1', 0x40), 'MLOAD', ('PUSH2', 0x120), 'MSTORE',
+    # mem[0x80] = 0x140 + 32 * calls.length, after the offsets of the results
+    ('PUSH1', 0x40), 'MLOAD', ('PUSH1', 0x20), 'MUL', ('PUSH2', 0x140), 'ADD',
+    ('PUSH1', 0x80), 'MSTORE',
+    # mem[0x60] = i = 0
+    ('PUSH1', 0x00), ('PUSH1', 0x60), 'MSTORE',
+
+    ('JUMPDEST', 'loop'),
+    # while i < calls.length
+    ('PUSH1', 0x40), 'MLOAD', ('PUSH1', 0x60), 'MLOAD', 'LT', 'ISZERO',
+    ('PUSH2', 'return'), 'JUMPI',
+    # the offset of result i = mem[0x80] - 0x140
+    ('PUSH2', 0x140), ('PUSH1', 0x80), 'MLOAD', 'SUB',
+    ('PUSH1', 0x60), 'MLOAD', ('PUSH1', 0x20), 'MUL', ('PUSH2', 0x140), 'ADD', 'MSTORE',
+    # mem[0xa0] = the offset of calls[i], which is relative to the first offset
+    ('PUSH1', 0x20), 'MLOAD', ('PUSH1', 0x20), 'ADD', 'DUP1',
+    ('PUSH1', 0x60), 'MLOAD', ('PUSH1', 0x20), 'MUL', 'ADD', 'CALLDATALOAD', 'ADD',
+    ('PUSH1', 0xa0), 'MSTORE',
+    # mem[0xc0] = the offset of calls[i].callData, relative to calls[i]
+    ('PUSH1', 0xa0), 'MLOAD', 'DUP1', ('PUSH1', 0x20), 'ADD', 'CALLDATALOAD', 'ADD',
+    ('PUSH1', 0xc0), 'MSTORE',
+    # mem[0xe0] = calls[i].callData.length
+    ('PUSH1', 0xc0), 'MLOAD', 'CALLDATALOAD', ('PUSH1', 0xe0), 'MSTORE',
+    # copy calls[i].callData to mem[0x80] + 0x60
+    ('PUSH1', 0xe0), 'MLOAD',
+    ('PUSH1', 0xc0), 'MLOAD', ('PUSH1', 0x20), 'ADD',
+    ('PUSH1', 0x80), 'MLOAD', ('PUSH1', 0x60), 'ADD',
+    'CALLDATACOPY',
+    # success = call(gas, calls[i].target, 0, mem[0x80] + 0x60, length, 0, 0)
+    ('PUSH1', 0x00), ('PUSH1', 0x00),
+    ('PUSH1', 0xe0), 'MLOAD',
+    ('PUSH1', 0x80), 'MLOAD', ('PUSH1', 0x60), 'ADD',
+    ('PUSH1', 0x00),
+    ('PUSH1', 0xa0), 'MLOAD', 'CALLDATALOAD',
+    'GAS', 'CALL',
+    # revert if the call failed and requireSuccess is set
+    'DUP1', 'ISZERO', ('PUSH1', 0x00), 'MLOAD', 'AND', ('PUSH2', 'revert'), 'JUMPI',
+    # write (success, 0x40, returndatasize) to mem[0x80]
+    ('PUSH1', 0x80), 'MLOAD', 'MSTORE',
+    ('PUSH1', 0x40), ('PUSH1', 0x80), 'MLOAD', ('PUSH1', 0x20), 'ADD', 'MSTORE',
+    'RETURNDATASIZE', ('PUSH1', 0x80), 'MLOAD', ('PUSH1', 0x40), 'ADD', 'MSTORE',
+    # followed by the return data, padded with zeros to a whole word
+    'RETURNDATASIZE', ('PUSH1', 0x00), ('PUSH1', 0x80), 'MLOAD', ('PUSH1', 0x60), 'ADD',
+    'RETURNDATACOPY',
+    ('PUSH1', 0x00),
+    'RETURNDATASIZE', ('PUSH1', 0x80), 'MLOAD', ('PUSH1', 0x60), 'ADD', 'ADD',
+    'MSTORE',
+    # mem[0x80] += 0x60 + returndatasize rounded up to a whole word
+    ('PUSH1', 0x1f), 'NOT', ('PUSH1', 0x1f), 'RETURNDATASIZE', 'ADD', 'AND',
+    ('PUSH1', 0x80), 'MLOAD', 'ADD', ('PUSH1', 0x60), 'ADD',
+    ('PUSH1', 0x80), 'MSTORE',
+    # i += 1
+    ('PUSH1', 0x60), 'MLOAD', ('PUSH1', 0x01), 'ADD', ('PUSH1', 0x60), 'MSTORE',
+    ('PUSH2', 'loop'), 'JUMP',
+
+    ('JUMPDEST', 'return'),
+    # return mem[0x100:mem[0x80]]
+    ('PUSH2', 0x100), ('PUSH1', 0x80), 'MLOAD', 'SUB', ('PUSH2', 0x100), 'RETURN',
+
+    ('JUMPDEST', 'revert'),
+    ('PUSH1', 0x00), 'DUP1', 'REVERT',
+)
+
+MULTICALL_RUNTIME = encode_hex(assemble(MULTICALL_ASSEMBLY))
+
+MULTICALL_BYTECODE = encode_hex(get_deploy_code(assemble(MULTICALL_ASSEMBLY)))
+
+
+class Multicall:
+    """
+    Groups the calls of many contract functions, on one contract or many,
+    into a single ``eth_call`` to a Multicall2 compatible aggregator
+    contract at ``address``.
+
+    Note that the contract functions are called by the aggregator contract,
+    so they see the aggregator as ``msg.sender``.
+
+    :param require_success: If true, the whole batch fails when any of the
+        calls fails.  Otherwise the result of a failed call is ``None``.
+    :param batch_size: The maximum number of calls made in a single
+        ``eth_call``.
+    """
+    def __init__(self, web3, address, require_success=False, batch_size=500):
+        self.web3 = web3
+        self.address = address
+        self.require_success = require_success
+        self.batch_size = batch_size
+
+    @classmethod
+    def deploy(cls, web3, transaction=None, **kwargs):
+        """
+        Deploys the aggregator contract, e.g. to a test chain, and returns a
+        :class:`Multicall` for it.  ``kwargs`` are passed on to
+        :class:`Multicall`.
+        """
+        factory = web3.eth.contract(
+            abi=MULTICALL_ABI,
+            bytecode=MULTICALL_BYTECODE,
+            bytecode_runtime=MULTICALL_RUNTIME,
+        )
+        txn_hash = factory.constructor().transact(transaction)
+        txn_receipt = web3.eth.waitForTransactionReceipt(txn_hash)
+        return cls(web3, txn_receipt['contractAddress'], **kwargs)
+
+    def call(self, contract_functions, transaction=None, block_identifier='latest'):
+        """
+        Calls all of the ``contract_functions``, e.g.
+        ``[token.functions.balanceOf(owner), token.functions.totalSupply()]``,
+        and returns their results in the same order, decoded just like
+        :meth:`ContractFunction.call` decodes them.
+        """
+        if transaction is None:
+            call_transaction = {}
+        else:
+            call_transaction = dict(**transaction)
+
+        if self.web3.eth.defaultAccount is not empty:
+            call_transaction.setdefault('from', self.web3.eth.defaultAccount)
+
+        block_id = parse_block_identifier(self.web3, block_identifier)
+
+        return list(itertools.chain.from_iterable(
+            self._call_batch(batch, call_transaction, block_id)
+            for batch
+            in partition_all(self.batch_size, contract_functions)
+        ))
+
+    def _call_batch(self, contract_functions, call_transaction, block_id):
+        calls = [
+            (
+                contract_function.address,
+                to_bytes(hexstr=contract_function._encode_transaction_data()),
+            )
+            for contract_function
+            in contract_functions
+        ]
+        aggregate_data = TRY_AGGREGATE_SELECTOR + encode_abi(
+            ['bool', '(address,bytes)[]'],
+            [self.require_success, calls],
+        )
+        return_data = self.web3.eth.call(
+            dict(call_transaction, to=self.address, data=aggregate_data),
+            block_identifier=block_id,
+        )
+        (results,) = decode_abi(['(bool,bytes)[]'], return_data)
+
+        for contract_function, (success, result_data) in zip(contract_functions, results):
+            if success:
+                yield decode_function_output(
+                    self.web3,
+                    contract_function.address,
+                    contract_function._return_data_normalizers,
+                    contract_function.function_identifier,
+                    contract_function.abi,
+                    result_data,
+                )
+            else:
+                yield None
@@ -3,7 +3,15 @@ from .base import (  # noqa: F401
     JSONBaseProvider,
 )
 
-from .rpc import HTTPProvider  # noqa: F401
-from .ipc import IPCProvider  # noqa: F401
-from .websocket import WebsocketProvider  # noqa: F401
-from .auto import AutoProvider  # noqa: F401
+from web3._utils.module_loading import (
+    lazy_attribute,
+    set_lazy_attributes,
+)
+
+# the providers are imported on first access, with their dependencies
+set_lazy_attributes(__name__, {
+    "HTTPProvider": lazy_attribute("web3.providers.rpc", "HTTPProvider"),
+    "IPCProvider": lazy_attribute("web3.providers.ipc", "IPCProvider"),
+    "WebsocketProvider": lazy_attribute("web3.providers.websocket", "WebsocketProvider"),
+    "AutoProvider": lazy_attribute("web3.providers.auto", "AutoProvider"),
+})
@@ -71,6 +71,12 @@ class AutoProvider(BaseProvider):
         except IOError as exc:
             return self._proxy_request(method, params, use_cache=False)
 
+    def make_batch_request(self, requests):
+        try:
+            return self._proxy_batch_request(requests)
+        except IOError as exc:
+            return self._proxy_batch_request(requests, use_cache=False)
+
     def isConnected(self):
         provider = self._get_active_provider(use_cache=True)
         return provider is not None and provider.isConnected()
@@ -82,6 +88,13 @@ class AutoProvider(BaseProvider):
 
         return provider.make_request(method, params)
 
+    def _proxy_batch_request(self, requests, use_cache=True):
+        provider = self._get_active_provider(use_cache)
+        if provider is None:
+            raise CannotHandleRequest("Could not discover provider")
+
+        return provider.make_batch_request(requests)
+
     def _get_active_provider(self, use_cache):
         if use_cache and self._active_provider is not None:
             return self._active_provider
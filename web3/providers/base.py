@@ -5,6 +5,9 @@ from eth_utils import (
     to_text,
 )
 
+from web3._utils.batching import (
+    get_batch_collector,
+)
 from web3._utils.encoding import (
     FriendlyJsonSerde,
 )
@@ -44,12 +47,29 @@ class BaseProvider:
         return combine_middlewares(
             middlewares=middlewares,
             web3=web3,
-            provider_request_fn=self.make_request,
+            provider_request_fn=self._dispatch_request,
         )
 
+    def _dispatch_request(self, method, params):
+        collector = get_batch_collector()
+        if collector is None:
+            return self.make_request(method, params)
+        else:
+            return collector.make_request(self, method, params)
+
     def make_request(self, method, params):
         raise NotImplementedError("Providers must implement this method")
 
+    def make_batch_request(self, requests):
+        '''
+        @param requests is a list of (method, params) tuples
+        @returns a list of the responses, in the same order as the requests
+
+        Providers which can send many requests at once should override this,
+        by default the requests are made one at a time.
+        '''
+        return [self.make_request(method, params) for method, params in requests]
+
     def isConnected(self):
         raise NotImplementedError("Providers must implement this method")
 
@@ -62,16 +82,40 @@ class JSONBaseProvider(BaseProvider):
         text_response = to_text(response)
         return FriendlyJsonSerde().json_decode(text_response)
 
-    def encode_rpc_request(self, method, params):
-        rpc_dict = {
+    def form_rpc_request(self, method, params):
+        return {
             "jsonrpc": "2.0",
             "method": method,
             "params": params or [],
             "id": next(self.request_counter),
         }
+
+    def encode_rpc_request(self, method, params):
+        rpc_dict = self.form_rpc_request(method, params)
         encoded = FriendlyJsonSerde().json_encode(rpc_dict)
         return to_bytes(text=encoded)
 
+    def encode_rpc_batch(self, rpc_dicts):
+        encoded = FriendlyJsonSerde().json_encode(rpc_dicts)
+        return to_bytes(text=encoded)
+
+    def order_batch_responses(self, rpc_dicts, responses):
+        '''
+        Batch responses may come back in any order, so they are matched to
+        their requests by id.  A node which does not support batches answers
+        with a single error response, which is returned for every request.
+        '''
+        if not isinstance(responses, list):
+            return [responses] * len(rpc_dicts)
+
+        responses_by_id = {response.get('id'): response for response in responses}
+        try:
+            return [responses_by_id[rpc_dict['id']] for rpc_dict in rpc_dicts]
+        except KeyError as exc:
+            raise ValueError(
+                "Batch response is missing the response to request id {0}".format(exc)
+            )
+
     def isConnected(self):
         try:
             response = self.make_request('web3_clientVersion', [])
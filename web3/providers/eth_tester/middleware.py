@@ -3,6 +3,7 @@ import operator
 from eth_utils import (
     is_dict,
     is_hex,
+    is_integer,
     is_string,
 )
 
@@ -90,8 +91,10 @@ BLOCK_KEY_MAPPINGS = {
     'transactions_root': 'transactionsRoot',
     'parent_hash': 'parentHash',
     'bloom': 'logsBloom',
+    'logs_bloom': 'logsBloom',
     'state_root': 'stateRoot',
     'receipt_root': 'receiptsRoot',
+    'receipts_root': 'receiptsRoot',
     'total_difficulty': 'totalDifficulty',
     'extra_data': 'extraData',
     'gas_used': 'gasUsed',
@@ -101,6 +104,21 @@ BLOCK_KEY_MAPPINGS = {
 block_key_remapper = apply_key_map(BLOCK_KEY_MAPPINGS)
 
 
+def integer_to_logs_bloom(value):
+    return value.to_bytes(256, 'big')
+
+
+BLOCK_FORMATTERS = {
+    'logsBloom': apply_formatter_if(is_integer, integer_to_logs_bloom),
+}
+
+
+block_formatter = compose(
+    apply_formatters_to_dict(BLOCK_FORMATTERS),
+    block_key_remapper,
+)
+
+
 TRANSACTION_PARAMS_MAPPING = {
     'gasPrice': 'gas_price',
 }
@@ -201,6 +219,10 @@ ethereum_tester_middleware = construct_formatting_middleware(
             apply_formatter_if(is_not_named_block, to_integer_if_hex),
         ),
         'eth_uninstallFilter': apply_formatters_to_args(hex_to_integer),
+        'eth_getBalance': apply_formatters_to_args(
+            identity,
+            apply_formatter_if(is_not_named_block, to_integer_if_hex),
+        ),
         'eth_getCode': apply_formatters_to_args(
             identity,
             apply_formatter_if(is_not_named_block, to_integer_if_hex),
@@ -216,11 +238,11 @@ ethereum_tester_middleware = construct_formatting_middleware(
     result_formatters={
         'eth_getBlockByHash': apply_formatter_if(
             is_dict,
-            block_key_remapper,
+            block_formatter,
         ),
         'eth_getBlockByNumber': apply_formatter_if(
             is_dict,
-            block_key_remapper,
+            block_formatter,
         ),
         'eth_getBlockTransactionCountByHash': apply_formatter_if(
             is_dict,
@@ -72,3 +72,17 @@ class HTTPProvider(JSONBaseProvider):
                           "Method: %s, Response: %s",
                           self.endpoint_uri, method, response)
         return response
+
+    def make_batch_request(self, requests):
+        self.logger.debug("Making batch request HTTP. URI: %s, Methods: %s",
+                          self.endpoint_uri, [method for method, _ in requests])
+        rpc_dicts = [self.form_rpc_request(method, params) for method, params in requests]
+        raw_response = make_post_request(
+            self.endpoint_uri,
+            self.encode_rpc_batch(rpc_dicts),
+            **self.get_request_kwargs()
+        )
+        responses = self.decode_rpc_response(raw_response)
+        self.logger.debug("Getting batch response HTTP. URI: %s, Responses: %s",
+                          self.endpoint_uri, responses)
+        return self.order_batch_responses(rpc_dicts, responses)
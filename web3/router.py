@@ -0,0 +1,146 @@
+from eth_utils import (
+    to_normalized_address,
+    to_tuple,
+)
+from hexbytes import (
+    HexBytes,
+)
+
+from web3._utils.abi import (
+    filter_by_type,
+)
+from web3._utils.caching import (
+    IdentityLRU,
+)
+from web3._utils.events import (
+    get_event_decoder,
+)
+from web3._utils.toolz import (
+    unique,
+)
+
+
+class EventRouter:
+    """
+    Decodes the logs of many events, of one contract or many, in a single
+    pass.  Each log is dispatched on its address and first topic to the
+    decoder of its event, so the cost of decoding a receipt doesn't grow
+    with the number of events which are looked for.
+
+    Events registered without an address match the logs of any contract
+    which have their topic.  Events with the same signature but different
+    indexed arguments, like the ``Transfer`` events of ERC-20 and ERC-721
+    tokens, are told apart by the number of topics of the log.  Anonymous
+    events have no topic to be dispatched on and cannot be registered.
+
+    :param events: The contract events to decode, e.g.
+        ``[token.events.Transfer, token.events.Approval]``.
+    """
+    def __init__(self, events=()):
+        # keyed by the first topic and the number of topics of the logs
+        self._decoders_by_topic = {}
+        for event in events:
+            self.add_event(event)
+
+    @property
+    def topics(self):
+        """
+        The topics of the registered events.
+        """
+        return tuple(unique(topic for topic, _ in self._decoders_by_topic))
+
+    def add_event(self, event):
+        """
+        Registers a contract event, e.g. ``token.events.Transfer``, for the
+        address of its contract if it has one.
+        """
+        self.add_event_abi(event._get_event_abi(), event.address)
+
+    def add_contract(self, contract):
+        """
+        Registers all of the events of ``contract``, except for the anonymous
+        ones, for the address of the contract if it has one.
+        """
+        for event_abi in filter_by_type('event', contract.abi):
+            if not event_abi['anonymous']:
+                self.add_event_abi(event_abi, contract.address)
+
+    def add_event_abi(self, event_abi, address=None):
+        """
+        Registers the event of ``event_abi``, emitted by the contract at
+        ``address`` or by any contract if ``address`` is ``None``.
+        """
+        if event_abi['anonymous']:
+            raise ValueError(
+                "Anonymous events cannot be routed: {0}".format(event_abi['name'])
+            )
+        if address is not None:
+            address = to_normalized_address(address)
+        decoder = get_event_decoder(event_abi)
+        topic_key = (decoder.topic, len(decoder.topic_types) + 1)
+        self._decoders_by_topic.setdefault(topic_key, {})[address] = decoder
+
+    def get_decoder(self, log_entry):
+        """
+        Returns the :class:`~web3._utils.events.EventDecoder` for
+        ``log_entry``, or ``None`` if it isn't a log of a registered event.
+        """
+        topics = log_entry['topics']
+        if not topics:
+            return None
+        decoders = self._decoders_by_topic.get((bytes(HexBytes(topics[0])), len(topics)))
+        if decoders is None:
+            return None
+        if len(decoders) == 1 and None in decoders:
+            return decoders[None]
+        return decoders.get(
+            to_normalized_address(log_entry['address']),
+            decoders.get(None),
+        )
+
+    def decode(self, log_entry):
+        """
+        Returns the decoded event of ``log_entry``, or ``None`` if it isn't a
+        log of a registered event.
+        """
+        decoder = self.get_decoder(log_entry)
+        if decoder is None:
+            return None
+        return decoder.decode(log_entry)
+
+    @to_tuple
+    def processLogs(self, log_entries):
+        """
+        Returns the decoded events of the ``log_entries`` of registered events,
+        in the order of the log entries.
+        """
+        for log_entry in log_entries:
+            decoder = self.get_decoder(log_entry)
+            if decoder is not None:
+                yield decoder.decode(log_entry)
+
+    def processReceipt(self, txn_receipt):
+        """
+        Returns the decoded events of all of the logs in ``txn_receipt`` of
+        registered events.
+        """
+        return self.processLogs(txn_receipt['logs'])
+
+
+_abi_event_routers = IdentityLRU(256)
+
+
+def get_abi_event_router(abi):
+    """
+    Returns an :class:`EventRouter` for all of the non-anonymous events of the
+    contract ``abi``, for any address.  It is cached by the identity of the
+    ABI list.
+    """
+    router = _abi_event_routers.get(abi)
+    if router is None:
+        router = EventRouter()
+        for event_abi in filter_by_type('event', abi):
+            if not event_abi['anonymous']:
+                router.add_event_abi(event_abi)
+        _abi_event_routers.set(abi, router)
+    return router
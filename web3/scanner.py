@@ -0,0 +1,225 @@
+import json
+import logging
+import os
+import threading
+
+from eth_utils import (
+    to_checksum_address,
+)
+from hexbytes import (
+    HexBytes,
+)
+
+from web3._utils.encoding import (
+    to_hex,
+)
+from web3.head import (
+    get_head_tracker,
+)
+from web3.middleware.filter import (
+    LOG_REQUEST_CONCURRENCY,
+    MAX_BLOCK_REQUEST,
+    get_logs_multipart,
+)
+from web3.router import (
+    EventRouter,
+)
+
+
+class MemoryCheckpointStore:
+    """
+    Keeps the checkpoints of an :class:`EventScanner` in memory.
+    """
+    def __init__(self):
+        self._checkpoints = []
+
+    def load(self):
+        return list(self._checkpoints)
+
+    def save(self, checkpoints):
+        self._checkpoints = list(checkpoints)
+
+
+class FileCheckpointStore:
+    """
+    Keeps the checkpoints of an :class:`EventScanner` in a JSON file at
+    ``path``.  The file is replaced atomically so that a crash while saving
+    leaves the previous checkpoints intact.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def load(self):
+        with self._lock:
+            if not os.path.exists(self.path):
+                return []
+            with open(self.path) as checkpoint_file:
+                checkpoints = json.load(checkpoint_file)['checkpoints']
+        return [
+            (block_number, HexBytes(block_hash))
+            for block_number, block_hash
+            in checkpoints
+        ]
+
+    def save(self, checkpoints):
+        tmp_path = self.path + '.tmp'
+        with self._lock:
+            with open(tmp_path, 'w') as checkpoint_file:
+                json.dump({
+                    'checkpoints': [
+                        [block_number, to_hex(block_hash)]
+                        for block_number, block_hash
+                        in checkpoints
+                    ],
+                }, checkpoint_file)
+            os.replace(tmp_path, self.path)
+
+
+class EventScanner:
+    """
+    Scans a range of blocks for one or more contract events with
+    ``eth_getLogs`` and yields the decoded events in chain order.
+
+    Progress is saved to ``store`` as checkpoints of the last scanned block
+    number and hash after every ``chunk_size`` blocks, once all of the events
+    in those blocks have been consumed.  A later scan resumes after the most
+    recent checkpoint which is still part of the canonical chain, so after a
+    crash the scan picks up where it left off and after a reorg only the
+    blocks past the fork are scanned again.
+
+    :param events: The contract events to scan for, e.g.
+        ``[token.events.Transfer, token.events.Approval]``.
+    :param store: Where checkpoints are kept, e.g. a
+        :class:`FileCheckpointStore`.  Defaults to a
+        :class:`MemoryCheckpointStore`.
+    :param chunk_size: The number of blocks scanned between checkpoints.
+    :param concurrency: The maximum number of concurrent ``eth_getLogs``
+        requests.
+    :param confirmation_blocks: How many blocks behind the chain head the
+        scan stops.
+    :param max_checkpoints: The number of recent checkpoints kept to find a
+        common ancestor after a reorg.
+    :param on_reorg: Called with the first block number which is scanned
+        again when a reorg invalidates previously yielded events.
+    """
+    logger = logging.getLogger("web3.EventScanner")
+
+    def __init__(
+            self,
+            web3,
+            events,
+            store=None,
+            chunk_size=1000,
+            concurrency=LOG_REQUEST_CONCURRENCY,
+            confirmation_blocks=0,
+            max_checkpoints=16,
+            on_reorg=None):
+        self.web3 = web3
+        self.store = store if store is not None else MemoryCheckpointStore()
+        self.chunk_size = chunk_size
+        self.concurrency = concurrency
+        self.confirmation_blocks = confirmation_blocks
+        self.max_checkpoints = max_checkpoints
+        self.on_reorg = on_reorg
+
+        self._router = EventRouter()
+        addresses = set()
+        for event in events:
+            event_abi = event._get_event_abi()
+            if event_abi['anonymous']:
+                raise ValueError(
+                    "Anonymous events cannot be scanned for: {0}".format(event_abi['name'])
+                )
+            if event.address is None:
+                address = None
+            else:
+                address = to_checksum_address(event.address)
+            self._router.add_event_abi(event_abi, address)
+            addresses.add(address)
+
+        if None in addresses:
+            self.address = None
+        else:
+            self.address = sorted(addresses)
+        self.topics = [[
+            to_hex(topic)
+            for topic
+            in sorted(self._router.topics)
+        ]]
+
+    @property
+    def last_scanned_block(self):
+        """
+        The number of the last block covered by a checkpoint, or ``None`` if
+        nothing has been scanned yet.
+        """
+        checkpoints = self.store.load()
+        if checkpoints:
+            return checkpoints[-1][0]
+        return None
+
+    def _find_resume_block(self, checkpoints, start_block):
+        for index in reversed(range(len(checkpoints))):
+            block_number, block_hash = checkpoints[index]
+            block = self.web3.eth.getBlock(block_number)
+            if block is not None and HexBytes(block['hash']) == HexBytes(block_hash):
+                return checkpoints[:index + 1], block_number + 1
+        return [], start_block
+
+    def scan(self, start_block=0, end_block=None):
+        """
+        Yields the decoded events from ``start_block``, or from after the
+        last valid checkpoint, through ``end_block``.  The scan never goes
+        past ``confirmation_blocks`` behind the chain head, so an ``end_block``
+        which is ``None`` or past that point is clamped to it.
+        """
+        last_confirmed_block = (
+            get_head_tracker(self.web3).get_block_number() - self.confirmation_blocks
+        )
+        if end_block is None or end_block > last_confirmed_block:
+            end_block = last_confirmed_block
+
+        checkpoints = self.store.load()
+        from_block = start_block
+        while True:
+            if checkpoints:
+                valid_checkpoints, resume_block = self._find_resume_block(
+                    checkpoints,
+                    start_block,
+                )
+                if len(valid_checkpoints) != len(checkpoints):
+                    self.logger.info("Chain reorganized, rescanning from block %d", resume_block)
+                    checkpoints = valid_checkpoints
+                    self.store.save(checkpoints)
+                    if self.on_reorg is not None:
+                        self.on_reorg(resume_block)
+                from_block = max(resume_block, start_block)
+
+            if from_block > end_block:
+                return
+
+            to_block = min(from_block + self.chunk_size - 1, end_block)
+            # The hash is fetched before the logs, so that a reorg happening
+            # while the logs are fetched is detected at the next checkpoint.
+            to_block_hash = HexBytes(self.web3.eth.getBlock(to_block)['hash'])
+
+            chunks = get_logs_multipart(
+                self.web3,
+                from_block,
+                to_block,
+                self.address,
+                self.topics,
+                max_blocks=MAX_BLOCK_REQUEST,
+                concurrency=self.concurrency,
+                blooms=get_head_tracker(self.web3).get_logs_blooms(),
+            )
+            for logs in chunks:
+                for log in logs:
+                    event = self._router.decode(log)
+                    if event is not None:
+                        yield event
+
+            checkpoints = (checkpoints + [(to_block, to_block_hash)])[-self.max_checkpoints:]
+            self.store.save(checkpoints)
+            from_block = to_block + 1
@@ -0,0 +1,109 @@
+import threading
+
+from web3._utils.caching import (
+    generate_cache_key,
+)
+
+_local = threading.local()
+
+# Block identifiers which are replaced by the block of an active snapshot.
+PINNED_BLOCK_IDENTIFIERS = (None, 'latest')
+
+
+def get_active_snapshot(web3):
+    """
+    Returns the innermost :class:`BlockSnapshot` of ``web3`` entered on this
+    thread, if any.
+    """
+    for snapshot in reversed(getattr(_local, 'snapshots', ())):
+        if snapshot.web3 is web3:
+            return snapshot
+    return None
+
+
+class BlockSnapshot:
+    """
+    A consistent view of the chain state at a single block.
+
+    ``block_identifier`` is resolved to a block number once, when the
+    snapshot is first entered or used.  Inside a ``with`` block the
+    ``eth_call``, ``eth_getBalance``, ``eth_getStorageAt`` and ``eth_getCode``
+    requests made on the same thread with no block identifier or with
+    ``'latest'``, including those of :meth:`ContractFunction.call`, are made
+    at that block instead.  Their results are memoized for the lifetime of
+    the snapshot.
+    """
+    def __init__(self, web3, block_identifier='latest'):
+        if block_identifier == 'pending':
+            raise ValueError("A snapshot cannot be taken of the pending block")
+        self.web3 = web3
+        self.block_identifier = block_identifier
+        self._block_number = None
+        self._results = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        # resolved before entering, so that the request isn't pinned itself
+        self.block_number
+        _local.snapshots = getattr(_local, 'snapshots', ()) + (self,)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        snapshots = _local.snapshots
+        index = max(i for i, snapshot in enumerate(snapshots) if snapshot is self)
+        _local.snapshots = snapshots[:index] + snapshots[index + 1:]
+
+    @property
+    def block_number(self):
+        if self._block_number is None:
+            if isinstance(self.block_identifier, int) and self.block_identifier >= 0:
+                self._block_number = self.block_identifier
+            else:
+                block = self.web3.eth.getBlock(self.block_identifier)
+                if block is None:
+                    raise ValueError(
+                        "Block not found: {0}".format(self.block_identifier)
+                    )
+                self._block_number = block['number']
+        return self._block_number
+
+    def request_blocking(self, method, params):
+        """
+        Makes the request with the block number of the snapshot appended to
+        ``params``, or returns the result of an identical earlier request.
+        """
+        try:
+            cache_key = generate_cache_key((method, params))
+        except TypeError:
+            cache_key = None
+
+        if cache_key is not None:
+            with self._lock:
+                if cache_key in self._results:
+                    return self._results[cache_key]
+
+        result = self.web3.manager.request_blocking(
+            method,
+            list(params) + [self.block_number],
+        )
+
+        if cache_key is not None:
+            with self._lock:
+                self._results[cache_key] = result
+        return result
+
+    def call(self, transaction):
+        with self:
+            return self.web3.eth.call(transaction)
+
+    def getBalance(self, account):
+        with self:
+            return self.web3.eth.getBalance(account)
+
+    def getStorageAt(self, account, position):
+        with self:
+            return self.web3.eth.getStorageAt(account, position)
+
+    def getCode(self, account):
+        with self:
+            return self.web3.eth.getCode(account)
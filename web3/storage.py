@@ -0,0 +1,170 @@
+import itertools
+
+from eth_abi import (
+    encode_single,
+)
+from eth_utils import (
+    keccak,
+    to_checksum_address,
+)
+from hexbytes import (
+    HexBytes,
+)
+
+from web3._utils.abi import (
+    process_type,
+)
+from web3._utils.encoding import (
+    hexstr_if_str,
+    to_bytes,
+)
+from web3._utils.toolz import (
+    partition_all,
+)
+from web3.snapshot import (
+    BlockSnapshot,
+)
+
+
+def to_slot_bytes(slot):
+    return slot.to_bytes(32, 'big')
+
+
+def get_mapping_slot(slot, key, key_type):
+    """
+    Returns the storage slot of the value of ``key``, of ``key_type``, in the
+    solidity mapping at ``slot``.  That is the keccak of the key, padded to a
+    word unless it is a ``string`` or ``bytes`` key, followed by the slot.
+    The slot of a value in a nested mapping is found by passing the slot of
+    the inner mapping.
+    """
+    if key_type == 'string':
+        key_bytes = key.encode('utf-8')
+    elif key_type == 'bytes':
+        key_bytes = hexstr_if_str(to_bytes, key)
+    else:
+        key_bytes = encode_single(key_type, key)
+    return int.from_bytes(keccak(key_bytes + to_slot_bytes(slot)), 'big')
+
+
+def get_array_slot(slot, index, item_slots=1):
+    """
+    Returns the storage slot of the item at ``index`` of the dynamic solidity
+    array at ``slot``, whose items take ``item_slots`` slots each.  The
+    length of the array is stored at ``slot`` itself.
+    """
+    return int.from_bytes(keccak(to_slot_bytes(slot)), 'big') + index * item_slots
+
+
+def get_storage_decoder(abi_type):
+    """
+    Returns a function which decodes a value of ``abi_type`` from a storage
+    word.  Values are stored right aligned, so this decodes the first of the
+    variables packed into a slot.  Only value types are supported.
+    """
+    base, sub, arrlist = process_type(abi_type)
+    if arrlist or (base in {'bytes', 'string'} and not sub):
+        raise ValueError(
+            "Only value types can be decoded from storage, not {0}".format(abi_type)
+        )
+
+    if base == 'uint':
+        size = int(sub) // 8
+
+        def decode_uint(word):
+            return int.from_bytes(word[-size:], 'big')
+        return decode_uint
+    elif base == 'int':
+        size = int(sub) // 8
+
+        def decode_int(word):
+            return int.from_bytes(word[-size:], 'big', signed=True)
+        return decode_int
+    elif base == 'bool':
+        def decode_bool(word):
+            return word[-1] != 0
+        return decode_bool
+    elif base == 'address':
+        def decode_address(word):
+            return to_checksum_address(word[-20:])
+        return decode_address
+    elif base == 'bytes':
+        size = int(sub)
+
+        def decode_bytes(word):
+            return word[-size:]
+        return decode_bytes
+    else:
+        raise ValueError(
+            "Decoding {0} values from storage is not supported".format(abi_type)
+        )
+
+
+class StorageReader:
+    """
+    Reads the storage of the contract at ``address`` directly, at a single
+    block, making the ``eth_getStorageAt`` requests for many slots at once.
+    This reads large mappings and arrays without calling view functions,
+    which are limited by the gas of an ``eth_call``.
+
+    ``block_identifier`` is resolved to a block number once, when it is
+    first needed, so that all reads see the same state.
+
+    :param batch_size: The maximum number of requests sent in a single batch.
+    """
+    def __init__(self, web3, address, block_identifier='latest', batch_size=100):
+        self.web3 = web3
+        self.address = address
+        self.batch_size = batch_size
+        self._snapshot = BlockSnapshot(web3, block_identifier)
+
+    @property
+    def block_number(self):
+        return self._snapshot.block_number
+
+    def read_words(self, slots):
+        """
+        Returns the 32 byte words stored at ``slots``.
+        """
+        block_number = self.block_number
+        words = itertools.chain.from_iterable(
+            self.web3.manager.request_blocking_batch(
+                ("eth_getStorageAt", [self.address, slot, block_number])
+                for slot
+                in batch
+            )
+            for batch
+            in partition_all(self.batch_size, slots)
+        )
+        return [bytes(HexBytes(word)).rjust(32, b'\0') for word in words]
+
+    def read(self, slots, abi_type='uint256'):
+        """
+        Returns the values of ``abi_type`` stored at ``slots``.
+        """
+        decode = get_storage_decoder(abi_type)
+        return [decode(word) for word in self.read_words(slots)]
+
+    def read_mapping(self, slot, keys, key_type, value_type='uint256'):
+        """
+        Returns the values of ``value_type`` of ``keys`` in the mapping at
+        ``slot``, in the order of the keys.
+        """
+        return self.read(
+            [get_mapping_slot(slot, key, key_type) for key in keys],
+            value_type,
+        )
+
+    def read_array(self, slot, value_type='uint256', indexes=None):
+        """
+        Returns the items of ``value_type`` of the dynamic array at ``slot``,
+        either those at ``indexes`` or all of them.  Each item is read from
+        its own slot, so arrays of packed items aren't supported.
+        """
+        if indexes is None:
+            length, = self.read([slot])
+            indexes = range(length)
+        return self.read(
+            [get_array_slot(slot, index) for index in indexes],
+            value_type,
+        )